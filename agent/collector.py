@@ -6,6 +6,7 @@ This module collects metrics from Kubernetes clusters including:
 - Pod metrics (CPU, memory, status)
 - Node metrics (CPU, memory, capacity)
 - Cluster events
+- PodDisruptionBudgets
 - Resource utilization
 
 Metrics are batched and sent to the backend for analysis.
@@ -66,6 +67,7 @@ class MetricsCollector:
 
         self.core_v1 = client.CoreV1Api()
         self.apps_v1 = client.AppsV1Api()
+        self.policy_v1 = client.PolicyV1Api()
         self.custom_objects = client.CustomObjectsApi()
 
         logger.info(f"MetricsCollector initialized for cluster: {cluster_id}")
@@ -200,6 +202,10 @@ class MetricsCollector:
                     'restart_count': sum(
                         cs.restart_count for cs in pod.status.container_statuses or []
                     ),
+                    'owner_kind': (
+                        pod.metadata.owner_references[0].kind
+                        if pod.metadata.owner_references else None
+                    ),
                     'labels': pod.metadata.labels or {},
                     'timestamp': datetime.utcnow().isoformat()
                 }
@@ -278,6 +284,9 @@ class MetricsCollector:
                     'memory_capacity_bytes': memory_capacity,
                     'cpu_allocatable_millicores': cpu_allocatable,
                     'memory_allocatable_bytes': memory_allocatable,
+                    'pods_allocatable': int(node.status.allocatable.get('pods', '110')),
+                    # providerID is aws:///<az>/<instance-id> on EKS
+                    'instance_id': (node.spec.provider_id or '').rsplit('/', 1)[-1] or None,
                     'ready': ready,
                     'unschedulable': node.spec.unschedulable or False,
                     'labels': node.metadata.labels or {},
@@ -295,6 +304,38 @@ class MetricsCollector:
 
         return node_metrics
 
+    def collect_pdb_metrics(self) -> List[Dict[str, Any]]:
+        """
+        Collect PodDisruptionBudgets and their current allowed disruptions.
+
+        Returns:
+            List of PDB dictionaries
+        """
+        pdbs = []
+
+        try:
+            pdb_list = self.policy_v1.list_pod_disruption_budget_for_all_namespaces(watch=False)
+
+            for pdb in pdb_list.items:
+                selector = pdb.spec.selector
+                pdbs.append({
+                    'cluster_id': self.cluster_id,
+                    'namespace': pdb.metadata.namespace,
+                    'name': pdb.metadata.name,
+                    'match_labels': (selector.match_labels or {}) if selector else {},
+                    'disruptions_allowed': pdb.status.disruptions_allowed if pdb.status else 0,
+                    'timestamp': datetime.utcnow().isoformat()
+                })
+
+            logger.info(f"Collected {len(pdbs)} PodDisruptionBudgets")
+
+        except ApiException as e:
+            logger.error(f"Failed to collect PodDisruptionBudgets: {e}")
+        except Exception as e:
+            logger.error(f"Unexpected error collecting PodDisruptionBudgets: {e}", exc_info=True)
+
+        return pdbs
+
     def collect_cluster_events(self, since_seconds: int = 300) -> List[Dict[str, Any]]:
         """
         Collect recent cluster events.
@@ -414,6 +455,7 @@ class MetricsCollector:
         pod_metrics = self.collect_pod_metrics()
         node_metrics = self.collect_node_metrics()
         events = self.collect_cluster_events()
+        pdbs = self.collect_pdb_metrics()
 
         # Add to buffer
         all_metrics = []
@@ -430,6 +472,10 @@ class MetricsCollector:
             event['metric_type'] = 'event'
             all_metrics.append(event)
 
+        for pdb in pdbs:
+            pdb['metric_type'] = 'pdb'
+            all_metrics.append(pdb)
+
         self.add_to_buffer(all_metrics)
 
         # Flush buffer
@@ -0,0 +1,45 @@
+"""
+Event API Routes
+
+FastAPI endpoint for batched AWS event ingestion (EventBridge API destinations)
+"""
+import hmac
+
+from fastapi import APIRouter, Header, status
+from backend.core.config import settings
+from backend.core.exceptions import AuthenticationError
+from backend.schemas.event_schemas import EventBatch, EventBatchResult
+from backend.workers.tasks.event_processor import enqueue_events
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+
+@router.post(
+    "/batch",
+    response_model=EventBatchResult,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Ingest AWS events",
+    description="Queue a batch of EventBridge/CloudWatch events for processing"
+)
+def ingest_events(
+    batch: EventBatch,
+    x_event_token: str = Header(..., description="Shared ingestion token (EVENT_INGEST_TOKEN)")
+) -> EventBatchResult:
+    """
+    Ingest AWS events
+
+    Events are queued in Redis with one RPUSH and processed in
+    micro-batches by the event consumer (workers.events.consume_events).
+
+    Args:
+        batch: Events to queue
+        x_event_token: Shared ingestion token
+
+    Returns:
+        Number of events queued
+    """
+    expected = settings.EVENT_INGEST_TOKEN
+    if not expected or not hmac.compare_digest(x_event_token, expected):
+        raise AuthenticationError("Invalid event ingestion token")
+
+    return EventBatchResult(queued=enqueue_events(batch.events))
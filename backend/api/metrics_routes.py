@@ -3,13 +3,21 @@ Metrics API Routes
 
 FastAPI endpoints for dashboard metrics and KPIs
 """
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Header, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
-from backend.models.base import get_db
+from backend.models.base import get_db, SessionLocal
 from backend.models.user import User
-from backend.core.dependencies import get_current_user
+from backend.core.dependencies import get_current_user, get_api_key_cluster
+from backend.core.exceptions import AuthorizationError, InvalidInputError
 from backend.services.metrics_service import get_metrics_service
+from backend.modules.savings_export import (
+    export_filename,
+    iter_csv_chunks,
+    savings_export_query,
+    stream_rows,
+)
 from backend.schemas.metric_schemas import (
     DashboardKPIs,
     CostMetrics,
@@ -17,8 +25,10 @@ from backend.schemas.metric_schemas import (
     TimeSeriesData,
     ClusterMetrics,
     MetricFilter,
+    AgentMetricsBatch,
+    AgentMetricsIngestResult,
 )
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 router = APIRouter(prefix="/metrics", tags=["Metrics"])
 
@@ -210,3 +220,95 @@ def get_cluster_metrics(
     """
     service = get_metrics_service(db)
     return service.get_cluster_metrics(cluster_id, current_user.id)
+
+
+@router.post(
+    "/batch",
+    response_model=AgentMetricsIngestResult,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Ingest agent metrics",
+    description="Agent endpoint for batched pod and node metrics"
+)
+def ingest_agent_metrics(
+    batch: AgentMetricsBatch,
+    authorization: str = Header(..., description="Bearer <agent API key>"),
+    db: Session = Depends(get_db)
+) -> AgentMetricsIngestResult:
+    """
+    Ingest agent metrics
+
+    Called by the Kubernetes Agent after each collection cycle. Stores
+    the latest pod requests and node capacity used for consolidation
+    planning.
+
+    Args:
+        batch: Metrics batch from the agent
+        authorization: Agent API key as a Bearer token
+        db: Database session
+
+    Returns:
+        Number of pods and nodes stored
+    """
+    api_key = authorization.split(" ", 1)[-1].strip()
+    cluster_id = get_api_key_cluster(api_key, db)
+
+    if str(cluster_id) != batch.cluster_id:
+        raise AuthorizationError("API key does not belong to this cluster")
+
+    service = get_metrics_service(db)
+    return AgentMetricsIngestResult(
+        **service.ingest_agent_metrics(batch.cluster_id, batch.metrics)
+    )
+
+
+@router.get(
+    "/savings/export",
+    summary="Export savings as CSV",
+    description="Stream savings per cluster, per day or per action as (gzipped) CSV"
+)
+def export_savings(
+    start_date: date = Query(..., description="First day (UTC)"),
+    end_date: date = Query(..., description="Last day (UTC), inclusive"),
+    level: str = Query("cluster", pattern="^(cluster|day|action)$", description="cluster, day or action"),
+    compress: bool = Query(True, alias="gzip", description="Gzip the CSV"),
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Export savings as CSV
+
+    Rows are streamed from a server-side cursor and encoded as they are
+    sent, so year-long per-action exports use constant memory. The stream
+    uses its own database session, which stays open until the last chunk
+    has been sent.
+
+    Args:
+        start_date: First day
+        end_date: Last day, inclusive
+        level: Detail level
+        compress: Gzip the CSV
+        current_user: Authenticated user
+
+    Returns:
+        Streaming CSV download
+    """
+    if not current_user.organization_id:
+        raise AuthorizationError("User does not belong to an organization")
+    if end_date < start_date:
+        raise InvalidInputError("end_date", "must not be before start_date")
+
+    organization_id = current_user.organization_id
+    header, query = savings_export_query(organization_id, start_date, end_date, level)
+
+    def content():
+        db = SessionLocal()
+        try:
+            yield from iter_csv_chunks(header, stream_rows(db, query), compress=compress)
+        finally:
+            db.close()
+
+    filename = export_filename(organization_id, start_date, end_date, level, compress)
+    return StreamingResponse(
+        content(),
+        media_type="application/gzip" if compress else "text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
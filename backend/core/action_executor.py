@@ -19,13 +19,15 @@ Dependencies:
 - Database for audit logging
 """
 
+import json
 import logging
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from enum import Enum
 import time
 
-import boto3
 from botocore.exceptions import ClientError
 from sqlalchemy.orm import Session
 
@@ -35,15 +37,43 @@ from backend.models import (
     Instance
 )
 from backend.models.audit_log import AuditLog as ActionLog
+from backend.models.base import SessionLocal
 from backend.core.redis_client import get_redis_client
+from backend.core.aws_session import get_aws_client_pool
+from backend.core.deadline_pool import run_with_deadlines
+from backend.core.spot_fulfillment import (
+    get_spot_fulfillment_tracker,
+    FULFILLMENT_TIMEOUT_SECONDS
+)
 
 logger = logging.getLogger(__name__)
 
+# Redis set of plan executions that have not finished yet
+ACTIVE_PLANS_KEY = "execution_plans:active"
+
+# Plan state is kept for a week; the run lock expires if a worker dies
+PLAN_STATE_TTL_SECONDS = 7 * 86400
+PLAN_LOCK_SECONDS = 900
+
+# Concurrent actions within one phase of a cluster's plan, and across all
+# plans touching the same AWS account
+CLUSTER_MAX_CONCURRENCY = 10
+ACCOUNT_MAX_CONCURRENCY = 20
+
+# Default per-action timeout (overridable with an action's "timeout_seconds"),
+# counted from the moment the phase submits the action
+ACTION_TIMEOUT_SECONDS = 600
+
+# Upper bound of a whole phase, kept below PLAN_LOCK_SECONDS so a phase has
+# ended (or abandoned its stuck actions) before its run lock can expire
+PHASE_TIMEOUT_SECONDS = PLAN_LOCK_SECONDS - 120
+
 
 class ExecutionStatus(Enum):
     """Action execution status"""
     PENDING = "pending"
     RUNNING = "running"
+    IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
     FAILED = "failed"
     ROLLED_BACK = "rolled_back"
@@ -73,7 +103,12 @@ class ActionExecutor:
         dry_run: bool = False
     ) -> Dict[str, Any]:
         """
-        Execute complete action plan
+        Start executing a phased action plan
+
+        Phases that are due run immediately; the first phase with a delay is
+        dispatched as its own Celery task (with a countdown) instead of
+        sleeping, and progress is persisted in Redis between phases so a
+        restarted worker resumes the plan.
 
         Args:
             cluster_id: UUID of cluster
@@ -82,7 +117,8 @@ class ActionExecutor:
             dry_run: If True, simulate without actually executing
 
         Returns:
-            Dict with execution results
+            Dict with execution results so far (status "waiting" while
+            later phases are scheduled, "completed" when done)
         """
         logger.info(
             f"[CORE-EXEC] Executing action plan for cluster {cluster_id} "
@@ -94,83 +130,396 @@ class ActionExecutor:
         if not cluster:
             raise ValueError(f"Cluster {cluster_id} not found")
 
-        results = {
+        execution_id = str(uuid.uuid4())
+        phases = execution_plan.get("phases", [])
+
+        state = {
+            "execution_id": execution_id,
             "cluster_id": cluster_id,
             "job_id": job_id,
             "dry_run": dry_run,
-            "started_at": datetime.utcnow().isoformat(),
-            "phases": [],
-            "summary": {
-                "total_actions": 0,
-                "completed": 0,
-                "failed": 0,
-                "skipped": 0
+            "plan": execution_plan,
+            "phase_index": 0,
+            "phase_results": [],
+            "next_phase_at": self._next_phase_at(phases, 0, dry_run),
+            "results": {
+                "execution_id": execution_id,
+                "cluster_id": cluster_id,
+                "job_id": job_id,
+                "dry_run": dry_run,
+                "status": ExecutionStatus.PENDING.value,
+                "started_at": datetime.utcnow().isoformat(),
+                "phases": [],
+                "summary": {
+                    "total_actions": 0,
+                    "completed": 0,
+                    "failed": 0,
+                    "in_progress": 0,
+                    "skipped": 0
+                }
             }
         }
 
-        # Execute each phase
-        for phase in execution_plan.get("phases", []):
-            phase_num = phase["phase"]
-            delay = phase.get("delay_seconds", 0)
+        self._save_plan_state(state)
+        self.redis_client.sadd(ACTIVE_PLANS_KEY, execution_id)
 
-            logger.info(
-                f"[CORE-EXEC] Starting Phase {phase_num} "
-                f"(delay: {delay}s, actions: {len(phase['actions'])})"
-            )
+        return self._advance_plan(state, cluster)
+
+    def resume_action_plan(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Resume a persisted action plan (phase task entry point)
+
+        Runs every phase that is due, then schedules the next one. Safe to
+        call repeatedly: a per-plan lock keeps concurrent deliveries from
+        running the same phase twice, and actions already recorded for a
+        phase are not re-executed.
+
+        Args:
+            execution_id: Plan execution UUID
+
+        Returns:
+            Dict with execution results so far, or None if plan is unknown
+        """
+        state = self._load_plan_state(execution_id)
+        if not state:
+            logger.warning(f"[CORE-EXEC] Execution {execution_id} not found")
+            self.redis_client.srem(ACTIVE_PLANS_KEY, execution_id)
+            return None
+
+        if state["results"]["status"] == ExecutionStatus.COMPLETED.value:
+            return state["results"]
+
+        cluster = self.db.query(Cluster).filter(
+            Cluster.id == state["cluster_id"]
+        ).first()
+        if not cluster:
+            raise ValueError(f"Cluster {state['cluster_id']} not found")
+
+        return self._advance_plan(state, cluster)
+
+    def resume_stalled_plans(self, grace_seconds: int = 120) -> int:
+        """
+        Re-dispatch active plans whose next phase is overdue
+
+        Covers phase tasks lost to a broker or worker restart.
+
+        Args:
+            grace_seconds: How long past due a phase may be before re-dispatch
+
+        Returns:
+            Number of plans re-dispatched
+        """
+        resumed = 0
+        now = time.time()
+
+        for execution_id in self.redis_client.smembers(ACTIVE_PLANS_KEY):
+            state = self._load_plan_state(execution_id)
+            if not state:
+                self.redis_client.srem(ACTIVE_PLANS_KEY, execution_id)
+                continue
 
-            # Wait for delay (except first phase)
-            if delay > 0 and not dry_run:
-                logger.info(f"[CORE-EXEC] Waiting {delay} seconds before Phase {phase_num}")
-                time.sleep(delay)
+            if state["next_phase_at"] + grace_seconds < now:
+                logger.warning(f"[CORE-EXEC] Resuming stalled execution {execution_id}")
+                self._schedule_next_phase(execution_id, 0)
+                resumed += 1
 
-            # Execute actions in this phase
-            phase_results = []
+        return resumed
+
+    def _advance_plan(self, state: Dict[str, Any], cluster: Cluster) -> Dict[str, Any]:
+        """
+        Run due phases of a plan, then schedule or finish
+
+        Args:
+            state: Persisted plan state (mutated)
+            cluster: Cluster record
+
+        Returns:
+            Dict with execution results so far
+        """
+        execution_id = state["execution_id"]
+        lock_key = f"execution_plan_lock:{execution_id}"
+
+        if not self.redis_client.set(lock_key, "1", nx=True, ex=PLAN_LOCK_SECONDS):
+            logger.info(f"[CORE-EXEC] Execution {execution_id} already running, skipping")
+            return state["results"]
+
+        try:
+            phases = state["plan"].get("phases", [])
+            results = state["results"]
+            results["status"] = ExecutionStatus.RUNNING.value
+
+            while state["phase_index"] < len(phases):
+                wait = state["next_phase_at"] - time.time()
+                if wait > 0:
+                    results["status"] = "waiting"
+                    results["next_phase_at"] = datetime.utcfromtimestamp(
+                        state["next_phase_at"]
+                    ).isoformat()
+                    self._save_plan_state(state)
+                    self._schedule_next_phase(execution_id, wait)
+                    return results
+
+                # Each phase gets the full lock period
+                self.redis_client.expire(lock_key, PLAN_LOCK_SECONDS)
+                self._run_phase(state, phases[state["phase_index"]], cluster)
+
+                state["phase_index"] += 1
+                state["phase_results"] = []
+                state["next_phase_at"] = self._next_phase_at(
+                    phases, state["phase_index"], state["dry_run"]
+                )
+                self._save_plan_state(state)
+
+            results["status"] = ExecutionStatus.COMPLETED.value
+            results.pop("next_phase_at", None)
+            results["completed_at"] = datetime.utcnow().isoformat()
+            self._save_plan_state(state)
+            self.redis_client.srem(ACTIVE_PLANS_KEY, execution_id)
+
+            logger.info(f"[CORE-EXEC] Execution complete: {results['summary']}")
+
+            return results
+
+        finally:
+            self.redis_client.delete(lock_key)
+
+    def _run_phase(
+        self,
+        state: Dict[str, Any],
+        phase: Dict[str, Any],
+        cluster: Cluster
+    ) -> None:
+        """
+        Execute the actions of one phase, persisting after each action
+
+        Independent actions run concurrently, bounded per cluster (pool
+        size) and per AWS account (shared Redis slots), with a per-action
+        timeout counted from submit and capped at PHASE_TIMEOUT_SECONDS.
+        Results keep the order of the phase's actions.
+
+        Args:
+            state: Persisted plan state (mutated)
+            phase: Phase from the execution plan
+            cluster: Cluster record
+        """
+        results = state["results"]
+        dry_run = state["dry_run"]
+        actions = phase["actions"]
+        phase_results = state["phase_results"]
+
+        logger.info(
+            f"[CORE-EXEC] Starting Phase {phase['phase']} "
+            f"(delay: {phase.get('delay_seconds', 0)}s, actions: {len(actions)})"
+        )
+
+        if not phase_results:
+            phase_results.extend([None] * len(actions))
+
+        # Skip actions recorded before a restart
+        pending = [i for i, r in enumerate(phase_results) if r is None]
+
+        def record(index: int, action_result: Dict[str, Any]) -> None:
+            phase_results[index] = action_result
+            results["summary"]["total_actions"] += 1
+
+            if action_result["status"] == ExecutionStatus.COMPLETED.value:
+                results["summary"]["completed"] += 1
+            elif action_result["status"] == ExecutionStatus.FAILED.value:
+                results["summary"]["failed"] += 1
+            elif action_result["status"] == ExecutionStatus.IN_PROGRESS.value:
+                summary = results["summary"]
+                summary["in_progress"] = summary.get("in_progress", 0) + 1
+            else:
+                results["summary"]["skipped"] += 1
+
+            self._save_plan_state(state)
+
+        # A single action also goes through the pool, for its timeout
+        self._run_concurrently(
+            [(i, actions[i]) for i in pending], cluster, dry_run, record
+        )
 
-            for action in phase["actions"]:
-                results["summary"]["total_actions"] += 1
+        # Add phase results
+        results["phases"].append({
+            "phase": phase["phase"],
+            "name": phase["name"],
+            "actions_executed": len(phase_results),
+            "results": phase_results
+        })
 
+    def _execute_safely(
+        self,
+        action: Dict[str, Any],
+        cluster: Cluster,
+        dry_run: bool
+    ) -> Dict[str, Any]:
+        """Execute single action, converting exceptions into a failed result"""
+        try:
+            return self.execute_action(action=action, cluster=cluster, dry_run=dry_run)
+
+        except Exception as e:
+            logger.error(f"[CORE-EXEC] Error executing action: {str(e)}")
+
+            return {
+                "action": action,
+                "status": ExecutionStatus.FAILED.value,
+                "error": str(e)
+            }
+
+    def _run_concurrently(
+        self,
+        indexed_actions: List[Any],
+        cluster: Cluster,
+        dry_run: bool,
+        record
+    ) -> None:
+        """
+        Run independent actions on a bounded thread pool
+
+        Each action gets its own database session (sessions are not
+        thread-safe) and takes a per-account slot before calling AWS. An
+        action's deadline is set when the phase submits it, so time spent
+        queued or waiting for a slot counts against its timeout; actions
+        past their deadline are recorded as failed and their threads are
+        abandoned rather than joined.
+
+        Args:
+            indexed_actions: List of (index, action) pairs
+            cluster: Cluster record
+            dry_run: If True, simulate only
+            record: Callback(index, result), invoked on this thread only
+        """
+        cluster_id = cluster.id
+        account_id = cluster.account_id
+        submitted_at = time.time()
+
+        def timeout_of(action: Dict[str, Any]) -> float:
+            return min(
+                action.get("timeout_seconds", ACTION_TIMEOUT_SECONDS),
+                PHASE_TIMEOUT_SECONDS
+            )
+
+        def deadline_for(indexed_action) -> float:
+            return submitted_at + timeout_of(indexed_action[1])
+
+        def run(indexed_action) -> Dict[str, Any]:
+            with self._account_slot(account_id, deadline_for(indexed_action)):
+                db = SessionLocal()
                 try:
-                    # Execute single action
-                    action_result = self.execute_action(
-                        action=action,
-                        cluster=cluster,
-                        dry_run=dry_run
-                    )
-
-                    phase_results.append(action_result)
-
-                    if action_result["status"] == ExecutionStatus.COMPLETED.value:
-                        results["summary"]["completed"] += 1
-                    elif action_result["status"] == ExecutionStatus.FAILED.value:
-                        results["summary"]["failed"] += 1
-                    else:
-                        results["summary"]["skipped"] += 1
-
-                except Exception as e:
-                    logger.error(f"[CORE-EXEC] Error executing action: {str(e)}")
-
-                    # Log failed action
-                    action_result = {
-                        "action": action,
-                        "status": ExecutionStatus.FAILED.value,
-                        "error": str(e)
-                    }
-                    phase_results.append(action_result)
-                    results["summary"]["failed"] += 1
-
-            # Add phase results
-            results["phases"].append({
-                "phase": phase_num,
-                "name": phase["name"],
-                "actions_executed": len(phase_results),
-                "results": phase_results
+                    worker_cluster = db.query(Cluster).filter(
+                        Cluster.id == cluster_id
+                    ).first()
+                    executor = ActionExecutor(db, self.redis_client)
+                    return executor._execute_safely(indexed_action[1], worker_cluster, dry_run)
+                finally:
+                    db.close()
+
+        def on_result(indexed_action, result, error) -> None:
+            index, action = indexed_action
+            if error is not None:
+                logger.error(f"[CORE-EXEC] Error executing action: {str(error)}")
+                result = {
+                    "action": action,
+                    "status": ExecutionStatus.FAILED.value,
+                    "error": str(error)
+                }
+            record(index, result)
+
+        def on_timeout(indexed_action) -> None:
+            index, action = indexed_action
+            timeout = timeout_of(action)
+            logger.error(
+                f"[CORE-EXEC] Action {action.get('type')} timed out after {timeout}s"
+            )
+            record(index, {
+                "action": action,
+                "status": ExecutionStatus.FAILED.value,
+                "error": f"Timed out after {timeout}s"
             })
 
-        results["completed_at"] = datetime.utcnow().isoformat()
+        run_with_deadlines(
+            indexed_actions,
+            run,
+            deadline_for,
+            on_result,
+            on_timeout,
+            max_workers=CLUSTER_MAX_CONCURRENCY
+        )
+
+    @contextmanager
+    def _account_slot(self, account_id: str, deadline: float):
+        """
+        Hold one of the account's concurrent-action slots
+
+        Slots are members of a Redis sorted set shared by all workers, one
+        per holder, scored with the holder's lease expiry (its deadline).
+        Expired leases are pruned before counting, so a slot kept by an
+        abandoned or dead holder frees itself once its lease runs out.
 
-        logger.info(f"[CORE-EXEC] Execution complete: {results['summary']}")
+        Args:
+            account_id: Account UUID
+            deadline: Epoch time after which waiting for a slot gives up
+
+        Raises:
+            TimeoutError: No slot became free before the deadline
+        """
+        key = f"exec_account_slots:{account_id}"
+        holder = uuid.uuid4().hex
+        delay = 0.25
+
+        while True:
+            now = time.time()
+            pipe = self.redis_client.pipeline()
+            pipe.zremrangebyscore(key, "-inf", now)
+            pipe.zadd(key, {holder: max(deadline, now)})
+            pipe.zcard(key)
+            pipe.expire(key, PLAN_LOCK_SECONDS)
+            if pipe.execute()[2] <= ACCOUNT_MAX_CONCURRENCY:
+                break
+
+            self.redis_client.zrem(key, holder)
+            if now + delay >= deadline:
+                raise TimeoutError(f"No free action slot for account {account_id}")
+            time.sleep(delay)
+            delay = min(delay * 2, 5.0)
+
+        try:
+            yield
+        finally:
+            self.redis_client.zrem(key, holder)
+
+    def _next_phase_at(
+        self,
+        phases: List[Dict[str, Any]],
+        index: int,
+        dry_run: bool
+    ) -> float:
+        """Epoch time at which phase `index` becomes due"""
+        if index >= len(phases) or dry_run:
+            return time.time()
+        return time.time() + phases[index].get("delay_seconds", 0)
 
-        return results
+    def _schedule_next_phase(self, execution_id: str, countdown: float) -> None:
+        """Dispatch the next phase as its own task instead of sleeping"""
+        from backend.workers.tasks.optimization import execute_plan_phase
+
+        logger.info(
+            f"[CORE-EXEC] Scheduling next phase of {execution_id} in {countdown:.0f}s"
+        )
+        execute_plan_phase.apply_async(args=[execution_id], countdown=countdown)
+
+    def _save_plan_state(self, state: Dict[str, Any]) -> None:
+        """Persist plan state to Redis"""
+        self.redis_client.setex(
+            f"execution_plan:{state['execution_id']}",
+            PLAN_STATE_TTL_SECONDS,
+            json.dumps(state, default=str)
+        )
+
+    def _load_plan_state(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Load plan state from Redis"""
+        raw = self.redis_client.get(f"execution_plan:{execution_id}")
+        return json.loads(raw) if raw else None
 
     def execute_action(
         self,
@@ -235,6 +584,9 @@ class ActionExecutor:
         3. Drain old On-Demand instance
         4. Terminate old instance
 
+        Only step 1 runs here; the request is then handed to the
+        SpotFulfillmentTracker, which finishes steps 2-4 asynchronously.
+
         Args:
             action: Action details
             cluster: Cluster record
@@ -275,23 +627,13 @@ class ActionExecutor:
                 Account.id == cluster.account_id
             ).first()
 
-            # Assume IAM role
-            sts_client = boto3.client('sts')
-            assumed_role = sts_client.assume_role(
-                RoleArn=account.role_arn,
-                RoleSessionName=f"SpotOptimizer-Exec-{cluster.id}",
-                ExternalId=account.external_id
-            )
-
-            credentials = assumed_role['Credentials']
-
-            # Create EC2 client
-            ec2_client = boto3.client(
+            # EC2 client for the account's assumed role (pooled)
+            ec2_client = get_aws_client_pool().get_client(
                 'ec2',
-                region_name=cluster.region,
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken']
+                cluster.region,
+                role_arn=account.role_arn,
+                external_id=account.external_id,
+                session_name=f"SpotOptimizer-Exec-{cluster.id}"
             )
 
             # Step 1: Launch new Spot instance
@@ -332,34 +674,32 @@ class ActionExecutor:
 
             logger.info(f"[CORE-EXEC] Spot request created: {spot_request_id}")
 
-            # Step 2: Wait for Spot instance to launch
-            # TODO: Implement proper waiter with timeout
-
-            # Step 3: Drain old instance (Kubernetes)
-            # TODO: Implement Kubernetes drain logic
-
-            # Step 4: Terminate old instance
-            logger.info(f"[CORE-EXEC] Terminating old instance {old_instance_id}")
-
-            ec2_client.terminate_instances(
-                InstanceIds=[old_instance_id]
+            # Steps 2-3 (wait for fulfillment, terminate old instance)
+            # are completed by the shared fulfillment tracker, so this
+            # worker is not blocked while the request is pending
+            get_spot_fulfillment_tracker(self.db, self.redis_client).track(
+                spot_request_id=spot_request_id,
+                cluster_id=cluster.id,
+                account_id=account.id,
+                region=cluster.region,
+                old_instance_id=old_instance_id,
+                action=action,
+                timeout_seconds=action.get("fulfillment_timeout_seconds", FULFILLMENT_TIMEOUT_SECONDS)
             )
 
-            # Log successful action
             self._log_action(
                 cluster_id=cluster.id,
                 action_type="spot_replacement",
-                status="completed",
+                status=ExecutionStatus.IN_PROGRESS.value,
                 details={
                     **action,
-                    "spot_request_id": spot_request_id,
-                    "old_instance_terminated": old_instance_id
+                    "spot_request_id": spot_request_id
                 }
             )
 
             return {
                 "action": action,
-                "status": ExecutionStatus.COMPLETED.value,
+                "status": ExecutionStatus.IN_PROGRESS.value,
                 "spot_request_id": spot_request_id,
                 "old_instance_id": old_instance_id
             }
@@ -0,0 +1,305 @@
+"""
+AWS Session Pool (CORE-AWS)
+Shared assumed-role credential cache and boto3 client pool
+
+Assuming a customer role and building a boto3 client both cost a network
+round trip or a service-model load, so doing it per action or per scan adds
+up quickly. This module keeps:
+
+- Assumed-role credentials per (role_arn, external_id), reused until shortly
+  before they expire
+- Clients per (role_arn, region, service), rebuilt only when the credentials
+  behind them have been refreshed
+
+Everything is guarded by locks so workers' thread pools can share one pool,
+and hit/miss counters are exposed through stats().
+
+The STS and client factories are injectable, so the pool can be exercised
+against moto or plain stub objects without touching AWS.
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional, Tuple
+
+import boto3
+
+logger = logging.getLogger(__name__)
+
+# Refresh assumed-role credentials this long before they expire
+CREDENTIAL_REFRESH_MARGIN_SECONDS = 300
+
+# Lifetime assumed when STS does not report an expiration
+DEFAULT_CREDENTIAL_LIFETIME_SECONDS = 3600
+
+DEFAULT_SESSION_NAME = "SpotOptimizer"
+
+
+def _default_sts_client_factory():
+    return boto3.client('sts')
+
+
+def _default_client_factory(
+    service: str,
+    region: str,
+    credentials: Optional[Dict[str, Any]]
+):
+    if credentials is None:
+        return boto3.client(service, region_name=region)
+
+    return boto3.client(
+        service,
+        region_name=region,
+        aws_access_key_id=credentials['AccessKeyId'],
+        aws_secret_access_key=credentials['SecretAccessKey'],
+        aws_session_token=credentials['SessionToken']
+    )
+
+
+def _expiration_epoch(credentials: Dict[str, Any], now: float) -> float:
+    expiration = credentials.get('Expiration')
+    if isinstance(expiration, datetime):
+        return expiration.timestamp()
+    if isinstance(expiration, (int, float)):
+        return float(expiration)
+    return now + DEFAULT_CREDENTIAL_LIFETIME_SECONDS
+
+
+class AWSClientPool:
+    """
+    Thread-safe cache of assumed-role credentials and boto3 clients
+
+    Clients built from default (instance/environment) credentials are pooled
+    under role_arn None and never expire from the pool.
+    """
+
+    def __init__(
+        self,
+        sts_client_factory: Optional[Callable[[], Any]] = None,
+        client_factory: Optional[Callable[[str, str, Optional[Dict[str, Any]]], Any]] = None,
+        refresh_margin_seconds: int = CREDENTIAL_REFRESH_MARGIN_SECONDS,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize pool
+
+        Args:
+            sts_client_factory: Returns the STS client used for assume_role
+            client_factory: Builds a client from (service, region, credentials)
+            refresh_margin_seconds: Refresh credentials this long before expiry
+            clock: Time source (epoch seconds)
+        """
+        self._sts_client_factory = sts_client_factory or _default_sts_client_factory
+        self._client_factory = client_factory or _default_client_factory
+        self._refresh_margin = refresh_margin_seconds
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._role_locks: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+        self._sts_client = None
+
+        # (role_arn, external_id) -> (credentials, expires_at)
+        self._credentials: Dict[Tuple[str, Optional[str]], Tuple[Dict[str, Any], float]] = {}
+        # (role_arn, external_id, region, service) -> (client, credentials it was built with)
+        self._clients: Dict[Tuple[Optional[str], Optional[str], str, str], Tuple[Any, Any]] = {}
+
+        self._counters = {
+            "credential_hits": 0,
+            "credential_misses": 0,
+            "client_hits": 0,
+            "client_misses": 0,
+        }
+
+    def get_credentials(
+        self,
+        role_arn: str,
+        external_id: Optional[str] = None,
+        session_name: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get assumed-role credentials, calling STS only when needed
+
+        Args:
+            role_arn: IAM role to assume
+            external_id: External ID required by the role trust policy
+            session_name: Role session name used if STS is called
+            force_refresh: Always call STS (e.g. to verify a role)
+
+        Returns:
+            STS Credentials dict (AccessKeyId, SecretAccessKey, SessionToken, Expiration)
+
+        Raises:
+            botocore.exceptions.ClientError: If the role cannot be assumed
+        """
+        key = (role_arn, external_id)
+
+        if not force_refresh:
+            cached = self._cached_credentials(key)
+            if cached is not None:
+                return cached
+
+        # One STS call per role at a time; other threads wait and reuse it
+        with self._role_lock(key):
+            if not force_refresh:
+                cached = self._cached_credentials(key)
+                if cached is not None:
+                    return cached
+
+            credentials = self._assume_role(role_arn, external_id, session_name)
+            expires_at = _expiration_epoch(credentials, self._clock())
+
+            with self._lock:
+                self._credentials[key] = (credentials, expires_at)
+                self._counters["credential_misses"] += 1
+
+        logger.info(f"[CORE-AWS] Assumed role {role_arn}")
+        return credentials
+
+    def get_client(
+        self,
+        service: str,
+        region: str,
+        role_arn: Optional[str] = None,
+        external_id: Optional[str] = None,
+        session_name: Optional[str] = None
+    ):
+        """
+        Get pooled boto3 client for a service, region and (optional) role
+
+        Args:
+            service: AWS service name ('ec2', 'eks', 'autoscaling', ...)
+            region: AWS region
+            role_arn: IAM role to assume (None = default credentials)
+            external_id: External ID required by the role trust policy
+            session_name: Role session name used if STS is called
+
+        Returns:
+            boto3 client
+        """
+        credentials = None
+        if role_arn:
+            credentials = self.get_credentials(role_arn, external_id, session_name)
+
+        key = (role_arn, external_id if role_arn else None, region, service)
+
+        with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is not None and pooled[1] is credentials:
+                self._counters["client_hits"] += 1
+                return pooled[0]
+
+        # Built outside the lock: loading a service model takes a while and
+        # a duplicate client built by a racing thread is harmless
+        client = self._client_factory(service, region, credentials)
+
+        with self._lock:
+            pooled = self._clients.get(key)
+            if pooled is not None and pooled[1] is credentials:
+                self._counters["client_hits"] += 1
+                return pooled[0]
+            self._clients[key] = (client, credentials)
+            self._counters["client_misses"] += 1
+
+        return client
+
+    def invalidate(self, role_arn: Optional[str] = None):
+        """
+        Drop cached credentials and clients
+
+        Args:
+            role_arn: Only drop entries for this role (None = everything)
+        """
+        with self._lock:
+            if role_arn is None:
+                self._credentials.clear()
+                self._clients.clear()
+                return
+
+            for key in [k for k in self._credentials if k[0] == role_arn]:
+                del self._credentials[key]
+            for key in [k for k in self._clients if k[0] == role_arn]:
+                del self._clients[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters and hit rates
+
+        Returns:
+            Dict with hits, misses, hit rates and current cache sizes
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["cached_credentials"] = len(self._credentials)
+            stats["pooled_clients"] = len(self._clients)
+
+        for kind in ("credential", "client"):
+            total = stats[f"{kind}_hits"] + stats[f"{kind}_misses"]
+            stats[f"{kind}_hit_rate"] = (
+                round(stats[f"{kind}_hits"] / total, 4) if total else 0.0
+            )
+
+        return stats
+
+    def _cached_credentials(self, key: Tuple[str, Optional[str]]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._credentials.get(key)
+            if entry is None or entry[1] - self._refresh_margin <= self._clock():
+                return None
+            self._counters["credential_hits"] += 1
+            return entry[0]
+
+    def _role_lock(self, key: Tuple[str, Optional[str]]) -> threading.Lock:
+        with self._lock:
+            lock = self._role_locks.get(key)
+            if lock is None:
+                lock = self._role_locks[key] = threading.Lock()
+            return lock
+
+    def _assume_role(
+        self,
+        role_arn: str,
+        external_id: Optional[str],
+        session_name: Optional[str]
+    ) -> Dict[str, Any]:
+        with self._lock:
+            if self._sts_client is None:
+                self._sts_client = self._sts_client_factory()
+            sts_client = self._sts_client
+
+        assume_kwargs = {
+            'RoleArn': role_arn,
+            'RoleSessionName': (session_name or DEFAULT_SESSION_NAME)[:64]
+        }
+        if external_id:
+            assume_kwargs['ExternalId'] = external_id
+
+        return sts_client.assume_role(**assume_kwargs)['Credentials']
+
+
+_pool: Optional[AWSClientPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_aws_client_pool() -> AWSClientPool:
+    """
+    Get process-wide AWS client pool
+
+    A new pool is created after fork, since boto3 clients and their
+    connection pools must not be shared between processes.
+
+    Returns:
+        AWSClientPool instance
+    """
+    global _pool, _pool_pid
+
+    pid = os.getpid()
+    with _pool_lock:
+        if _pool is None or _pool_pid != pid:
+            _pool = AWSClientPool()
+            _pool_pid = pid
+        return _pool
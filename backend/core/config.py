@@ -88,6 +88,9 @@ class Settings(BaseSettings):
     AGENT_HEARTBEAT_INTERVAL_SECONDS: int = Field(default=60, ge=10, le=300, description="Agent heartbeat interval")
     AGENT_COMMAND_TIMEOUT_HOURS: int = Field(default=1, ge=1, le=24, description="Agent command timeout")
 
+    # AWS Event Ingestion (EventBridge API destination)
+    EVENT_INGEST_TOKEN: Optional[str] = Field(None, description="Shared token for POST /events/batch (unset = disabled)")
+
     # Prometheus Monitoring
     PROMETHEUS_ENABLED: bool = Field(default=False, description="Enable Prometheus metrics")
     PROMETHEUS_PORT: int = Field(default=9090, ge=1024, le=65535, description="Prometheus metrics port")
@@ -0,0 +1,98 @@
+"""
+Deadline Thread Pool (CORE-POOL)
+Bounded thread pool for blocking AWS calls, with deadlines set at submit time
+
+Shared by the action executor (actions of a plan phase) and the discovery
+worker ((account, region) scans). Each item gets an absolute deadline when
+the batch is submitted, so time spent queued behind the pool size or
+waiting on a shared slot counts against it; the whole batch therefore ends
+by the latest deadline, whatever happens in the worker threads.
+
+Items past their deadline are reported through on_timeout. Queued items
+are cancelled; running ones cannot be interrupted, so their threads are
+abandoned rather than joined.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Longest wait between two checks of the deadlines
+POLL_SECONDS = 1.0
+
+
+def run_with_deadlines(
+    items: Sequence[T],
+    worker: Callable[[T], Any],
+    deadline_for: Callable[[T], float],
+    on_result: Callable[[T, Any, Optional[BaseException]], None],
+    on_timeout: Callable[[T], None],
+    max_workers: int
+) -> int:
+    """
+    Run worker(item) for every item on a bounded thread pool
+
+    Callbacks are invoked on the calling thread only, once per item.
+
+    Args:
+        items: Work items
+        worker: Blocking function called with one item
+        deadline_for: Epoch time by which an item must have finished
+        on_result: Callback(item, result, error) for finished items
+            (error is the raised exception, result is then None)
+        on_timeout: Callback(item) for items past their deadline
+        max_workers: Pool size
+
+    Returns:
+        Number of items that timed out
+    """
+    if not items:
+        return 0
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    futures = {}
+    for item in items:
+        future = pool.submit(worker, item)
+        futures[future] = (item, deadline_for(item))
+
+    pending = set(futures)
+    timed_out = 0
+    abandoned = False
+
+    try:
+        while pending:
+            nearest = min(futures[future][1] for future in pending)
+            timeout = min(POLL_SECONDS, max(0.0, nearest - time.time()))
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                item = futures[future][0]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    on_result(item, None, e)
+                else:
+                    on_result(item, result, None)
+
+            now = time.time()
+            for future in list(pending):
+                item, deadline = futures[future]
+                if now < deadline:
+                    continue
+                pending.discard(future)
+                timed_out += 1
+                if not future.cancel():
+                    abandoned = True
+                on_timeout(item)
+
+    finally:
+        if abandoned:
+            logger.warning(f"[CORE-POOL] Abandoning threads of {timed_out} timed out items")
+        pool.shutdown(wait=not abandoned, cancel_futures=True)
+
+    return timed_out
@@ -20,26 +20,47 @@ Dependencies:
 - Global Risk Tracker for pool safety
 """
 
+import bisect
+import hashlib
+import json
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
-from decimal import Decimal
 
 from sqlalchemy.orm import Session
 
-from app.database.models import (
-    Cluster,
-    ClusterPolicy,
-    OptimizationJob,
-    ActionLog
-)
-from app.modules.ml_model_server import get_ml_model_server
-from app.modules.risk_tracker import get_risk_tracker
-from app.core.redis_client import get_redis_client
+from backend.models import Cluster, ClusterPolicy
+from backend.modules.ml_model_server import get_ml_model_server
+from backend.modules.risk_tracker import get_risk_tracker
+from backend.core.redis_client import get_redis_client
+from backend.core.policy_validator import CompiledPolicy, get_compiled_policy
 
 logger = logging.getLogger(__name__)
 
+# Below this many clusters, process pool startup costs more than it saves
+FLEET_POOL_MIN_CLUSTERS = 8
+
+# Evaluated plans are kept for incremental re-evaluation for 24 hours
+PLAN_TTL_SECONDS = 86400
+
+# Execution phase layout keyed by action priority: (phase, name, delay_seconds)
+_PHASE_LAYOUT = {
+    1: (1, "Critical Actions", 0),            # Execute immediately
+    2: (2, "High Priority Actions", 60),      # 1 minute after Phase 1
+    3: (3, "Medium Priority Actions", 300),   # 5 minutes after Phase 1
+    4: (4, "Low Priority Actions", 600),      # 10 minutes after Phase 1
+}
+
+# Keys added to actions by the pipeline (excluded from input fingerprints)
+_DECISION_KEYS = ("plan_index", "priority", "priority_label", "rejection_reason")
+
+# Cluster attributes copied into picklable snapshots for fleet evaluation
+_CLUSTER_FIELDS = ("id", "name", "region", "account_id")
+
 
 class ActionType(Enum):
     """Types of optimization actions"""
@@ -83,7 +104,7 @@ class DecisionEngine:
         self.db = db
         self.redis_client = redis_client or get_redis_client()
         self.ml_model_server = get_ml_model_server(db, self.redis_client)
-        self.risk_tracker = get_risk_tracker(db, self.redis_client)
+        self.risk_tracker = get_risk_tracker(self.redis_client)
 
     def evaluate_action_plan(
         self,
@@ -118,12 +139,276 @@ class DecisionEngine:
             ClusterPolicy.cluster_id == cluster_id
         ).first()
 
-        # Step 1: Validate each action against policy
+        risky_pools = self._get_risky_pools(proposed_actions)
+
+        result = self._evaluate_loaded(
+            cluster_id, proposed_actions, cluster, policy, job_id, risky_pools
+        )
+
+        self._store_plan(cluster_id, result, proposed_actions, policy, risky_pools)
+
+        return result
+
+    def evaluate_fleet(
+        self,
+        proposed_actions_by_cluster: Dict[str, List[Dict[str, Any]]],
+        job_id: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate proposed action plans for many clusters in one call
+
+        Clusters and policies are loaded with one query each, then
+        validation, conflict detection and prioritization run per cluster
+        in a process pool.
+
+        Args:
+            proposed_actions_by_cluster: Dict of cluster UUID -> proposed actions
+            job_id: Optional optimization job ID (shared by all clusters)
+            max_workers: Optional process pool size (defaults to CPU count)
+
+        Returns:
+            Dict with per-cluster results and errors
+        """
+        cluster_ids = list(proposed_actions_by_cluster.keys())
+
+        logger.info(
+            f"[CORE-DECIDE] Evaluating fleet plan for {len(cluster_ids)} clusters"
+        )
+
+        clusters = {
+            str(c.id): c for c in self.db.query(Cluster).filter(
+                Cluster.id.in_(cluster_ids)
+            ).all()
+        } if cluster_ids else {}
+
+        policies = {
+            str(p.cluster_id): p for p in self.db.query(ClusterPolicy).filter(
+                ClusterPolicy.cluster_id.in_(cluster_ids)
+            ).all()
+        } if cluster_ids else {}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+
+        # One Redis round trip for the risk flags of every cluster's pools
+        risky_pools = self._get_risky_pools(
+            [a for actions in proposed_actions_by_cluster.values() for a in actions]
+        )
+
+        work = []
+        for cluster_id in cluster_ids:
+            cluster = clusters.get(str(cluster_id))
+            if not cluster:
+                errors[cluster_id] = f"Cluster {cluster_id} not found"
+                continue
+
+            work.append((
+                cluster_id,
+                proposed_actions_by_cluster[cluster_id],
+                _snapshot(cluster, _CLUSTER_FIELDS),
+                get_compiled_policy(policies.get(str(cluster_id))),
+                job_id,
+                risky_pools
+            ))
+
+        # Celery prefork children are daemonic and may not spawn processes,
+        # so small batches and daemon workers evaluate inline instead
+        use_pool = (
+            len(work) >= FLEET_POOL_MIN_CLUSTERS
+            and max_workers != 1
+            and not multiprocessing.current_process().daemon
+        )
+
+        if use_pool:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_evaluate_cluster_snapshot, *args): args[0]
+                    for args in work
+                }
+
+                for future in as_completed(futures):
+                    cluster_id = futures[future]
+                    try:
+                        results[cluster_id] = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"[CORE-DECIDE] Fleet evaluation failed for "
+                            f"cluster {cluster_id}: {str(e)}"
+                        )
+                        errors[cluster_id] = str(e)
+        else:
+            for args in work:
+                cluster_id = args[0]
+                try:
+                    results[cluster_id] = _evaluate_cluster_snapshot(*args)
+                except Exception as e:
+                    logger.error(
+                        f"[CORE-DECIDE] Fleet evaluation failed for "
+                        f"cluster {cluster_id}: {str(e)}"
+                    )
+                    errors[cluster_id] = str(e)
+
+        for cluster_id, result in results.items():
+            self._store_plan(
+                cluster_id,
+                result,
+                proposed_actions_by_cluster[cluster_id],
+                policies.get(str(cluster_id)),
+                risky_pools
+            )
+
+        logger.info(
+            f"[CORE-DECIDE] Fleet evaluation complete: {len(results)} evaluated, "
+            f"{len(errors)} failed"
+        )
+
+        return {
+            "job_id": job_id,
+            "timestamp": datetime.utcnow().isoformat(),
+            "summary": {
+                "clusters": len(cluster_ids),
+                "evaluated": len(results),
+                "failed": len(errors),
+                "approved_actions": sum(
+                    r["summary"]["approved"] for r in results.values()
+                )
+            },
+            "results": results,
+            "errors": errors
+        }
+
+    def reevaluate_plan(self, cluster_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Incrementally re-evaluate a stored plan after a policy or risk change
+
+        Only actions whose input fingerprint (relevant policy fields, pool
+        risk flag, action content) changed are re-validated; the stored
+        execution plan is patched in place rather than rebuilt.
+
+        Args:
+            cluster_id: UUID of cluster
+
+        Returns:
+            Patched evaluation result, or None if no plan is stored
+        """
+        record = self._load_plan(cluster_id)
+        if not record:
+            logger.info(f"[CORE-DECIDE] No stored plan for cluster {cluster_id}")
+            return None
+
+        policy = get_compiled_policy(self.db.query(ClusterPolicy).filter(
+            ClusterPolicy.cluster_id == cluster_id
+        ).first())
+
+        proposed = record["proposed"]
+        fingerprints = record["fingerprints"]
+        risky_pools = self._get_risky_pools(proposed)
+
+        changed = []
+        for index, action in enumerate(proposed):
+            fingerprint = _action_fingerprint(action, policy, risky_pools)
+            if fingerprint != fingerprints["actions"][index]:
+                fingerprints["actions"][index] = fingerprint
+                changed.append(index)
+
+        fingerprints["policy_version"] = _policy_version(policy)
+        fingerprints["risk_flags"] = {
+            pool: pool in risky_pools for pool in fingerprints["risk_flags"]
+        }
+
+        result = record["result"]
+
+        if changed:
+            logger.info(
+                f"[CORE-DECIDE] Re-evaluating {len(changed)}/{len(proposed)} "
+                f"actions for cluster {cluster_id}"
+            )
+            self._patch_plan(record, changed, policy, risky_pools)
+            result["reevaluated_at"] = datetime.utcnow().isoformat()
+
+        result["summary"]["reevaluated"] = len(changed)
+
+        self._save_record(cluster_id, record)
+
+        return result
+
+    def reevaluate_for_pool(
+        self,
+        availability_zone: str,
+        instance_type: str
+    ) -> Dict[str, Any]:
+        """
+        Re-evaluate every stored plan that touches a (newly flagged) pool
+
+        Args:
+            availability_zone: AZ of the pool
+            instance_type: Instance type of the pool
+
+        Returns:
+            Dict of cluster UUID -> patched evaluation result
+        """
+        pool = f"{availability_zone}:{instance_type}"
+        cluster_ids = self.redis_client.smembers(f"decision_plan_pool:{pool}")
+
+        results = {}
+        for cluster_id in cluster_ids:
+            cluster_id = cluster_id.decode() if isinstance(cluster_id, bytes) else cluster_id
+            try:
+                result = self.reevaluate_plan(cluster_id)
+                if result is not None:
+                    results[cluster_id] = result
+            except Exception as e:
+                logger.error(
+                    f"[CORE-DECIDE] Re-evaluation failed for cluster "
+                    f"{cluster_id}: {str(e)}"
+                )
+
+        logger.info(
+            f"[CORE-DECIDE] Re-evaluated {len(results)} plans touching pool {pool}"
+        )
+
+        return results
+
+    def _evaluate_loaded(
+        self,
+        cluster_id: str,
+        proposed_actions: List[Dict[str, Any]],
+        cluster: Cluster,
+        policy: Optional[ClusterPolicy],
+        job_id: Optional[str] = None,
+        risky_pools: Optional[set] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the evaluation pipeline against an already-loaded cluster and policy
+
+        The pipeline steps never touch the database or Redis, so this is
+        also used by process pool workers with detached snapshots.
+
+        Args:
+            cluster_id: UUID of cluster
+            proposed_actions: List of proposed optimization actions
+            cluster: Cluster record (or snapshot)
+            policy: Cluster policy (or compiled policy, may be None)
+            job_id: Optional optimization job ID
+            risky_pools: Pools ("az:instance_type") flagged by the Global Risk Tracker
+
+        Returns:
+            Dict with approved actions and metadata
+        """
+        risky_pools = risky_pools or set()
+        policy = get_compiled_policy(policy)
+
+        # Step 1: Validate all actions against the compiled policy
         validated_actions = []
         rejected_actions = []
 
-        for action in proposed_actions:
-            is_valid, reason = self._validate_action(action, cluster, policy)
+        verdicts = policy.validate_all(proposed_actions)
+
+        for index, (action, (is_valid, reason)) in enumerate(zip(proposed_actions, verdicts)):
+            action["plan_index"] = index
+            if is_valid:
+                is_valid, reason = self._check_pool_risk(action, risky_pools)
 
             if is_valid:
                 validated_actions.append(action)
@@ -179,64 +464,311 @@ class DecisionEngine:
 
         return result
 
-    def _validate_action(
+    def _validate_with_risk(
         self,
         action: Dict[str, Any],
         cluster: Cluster,
-        policy: Optional[ClusterPolicy]
+        policy: Optional[ClusterPolicy],
+        risky_pools: set
     ) -> Tuple[bool, Optional[str]]:
         """
-        Validate single action against cluster policy
+        Validate action against policy, then against Global Risk Tracker flags
 
         Args:
             action: Proposed action
             cluster: Cluster record
             policy: Cluster policy (may be None)
+            risky_pools: Currently flagged pools
 
         Returns:
             Tuple of (is_valid, rejection_reason)
         """
-        action_type = action.get("type", "")
+        is_valid, reason = self._validate_action(action, cluster, policy)
+        if not is_valid:
+            return is_valid, reason
+
+        return self._check_pool_risk(action, risky_pools)
+
+    def _check_pool_risk(
+        self,
+        action: Dict[str, Any],
+        risky_pools: set
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Reject actions launching into pools flagged by the Global Risk Tracker
 
-        # If no policy, allow all actions
-        if not policy:
-            return True, None
+        Args:
+            action: Proposed action
+            risky_pools: Currently flagged pools
 
-        # Check if action type is enabled
-        if action_type == ActionType.SPOT_REPLACEMENT.value:
-            if not policy.allow_spot_replacement:
-                return False, "Spot replacement disabled by policy"
+        Returns:
+            Tuple of (is_valid, rejection_reason)
+        """
+        pool = _action_pool(action)
+        if pool and pool in risky_pools:
+            return False, f"Instance pool {pool} is flagged as risky"
 
-        elif action_type == ActionType.RIGHT_SIZE.value:
-            if not policy.allow_rightsizing:
-                return False, "Right-sizing disabled by policy"
+        return True, None
 
-        elif action_type == ActionType.CONSOLIDATE.value:
-            if not policy.allow_consolidation:
-                return False, "Consolidation disabled by policy"
+    def _get_risky_pools(self, actions: List[Dict[str, Any]]) -> set:
+        """
+        Look up Global Risk Tracker flags for the pools targeted by actions
 
-        elif action_type == ActionType.HIBERNATE.value:
-            if not policy.allow_hibernation:
-                return False, "Hibernation disabled by policy"
+        Args:
+            actions: List of actions
 
-        # Check risk threshold
-        action_risk = action.get("risk_score", 0.0)
-        if action_risk > policy.max_risk_threshold:
-            return False, f"Risk score {action_risk} exceeds threshold {policy.max_risk_threshold}"
+        Returns:
+            Set of flagged pools ("az:instance_type")
+        """
+        pools = sorted({p for p in (_action_pool(a) for a in actions) if p})
+        if not pools or self.redis_client is None:
+            return set()
 
-        # Check min nodes constraint
-        if action_type in [ActionType.CONSOLIDATE.value, ActionType.SCALE_DOWN.value]:
-            projected_nodes = action.get("projected_node_count", 0)
-            if projected_nodes < policy.min_nodes:
-                return False, f"Would violate min nodes constraint ({policy.min_nodes})"
+        try:
+            flags = self.redis_client.mget([f"RISK:{pool}" for pool in pools])
+        except Exception as e:
+            logger.warning(f"[CORE-DECIDE] Could not read risk flags: {str(e)}")
+            return set()
 
-        # Check max nodes constraint
-        if action_type == ActionType.SCALE_UP.value:
-            projected_nodes = action.get("projected_node_count", 0)
-            if policy.max_nodes and projected_nodes > policy.max_nodes:
-                return False, f"Would exceed max nodes constraint ({policy.max_nodes})"
+        return {pool for pool, flag in zip(pools, flags) if flag}
 
-        return True, None
+    def _store_plan(
+        self,
+        cluster_id: str,
+        result: Dict[str, Any],
+        proposed_actions: List[Dict[str, Any]],
+        policy: Optional[ClusterPolicy],
+        risky_pools: set
+    ) -> None:
+        """
+        Persist evaluated plan with fingerprints of its inputs
+
+        Args:
+            cluster_id: UUID of cluster
+            result: Evaluation result
+            proposed_actions: Actions as proposed
+            policy: Cluster policy used for evaluation
+            risky_pools: Flagged pools at evaluation time
+        """
+        approved = result["approved_actions"]
+        rejected = result["rejected_actions"]
+
+        proposed = [_strip_decision(a) for a in proposed_actions]
+        policy = get_compiled_policy(policy)
+
+        statuses = ["dropped"] * len(proposed)
+        for action in approved:
+            statuses[action["plan_index"]] = "approved"
+        for action in rejected:
+            statuses[action["plan_index"]] = "rejected"
+
+        pools = sorted({p for p in (_action_pool(a) for a in proposed) if p})
+
+        record = {
+            "result": result,
+            "proposed": proposed,
+            "statuses": statuses,
+            "fingerprints": {
+                "policy_version": _policy_version(policy),
+                "action_set": _fingerprint(proposed),
+                "risk_flags": {pool: pool in risky_pools for pool in pools},
+                "actions": [
+                    _action_fingerprint(a, policy, risky_pools) for a in proposed
+                ]
+            }
+        }
+
+        self._save_record(cluster_id, record, pools)
+
+    def _save_record(
+        self,
+        cluster_id: str,
+        record: Dict[str, Any],
+        pools: Optional[List[str]] = None
+    ) -> None:
+        """Write plan record (and pool -> cluster index) to Redis"""
+        if self.redis_client is None:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.setex(
+                f"decision_plan:{cluster_id}",
+                PLAN_TTL_SECONDS,
+                json.dumps(record, default=str)
+            )
+            for pool in pools or []:
+                pipe.sadd(f"decision_plan_pool:{pool}", cluster_id)
+                pipe.expire(f"decision_plan_pool:{pool}", PLAN_TTL_SECONDS)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"[CORE-DECIDE] Could not store plan for {cluster_id}: {str(e)}")
+
+    def _load_plan(self, cluster_id: str) -> Optional[Dict[str, Any]]:
+        """Read stored plan record from Redis"""
+        raw = self.redis_client.get(f"decision_plan:{cluster_id}")
+        return json.loads(raw) if raw else None
+
+    def _patch_plan(
+        self,
+        record: Dict[str, Any],
+        changed: List[int],
+        policy: Optional[ClusterPolicy],
+        risky_pools: set
+    ) -> None:
+        """
+        Re-validate changed actions and patch the stored result in place
+
+        Actions that become invalid are pulled from their phase (together with
+        approved actions depending on them); actions that become valid are
+        checked for conflicts against the approved set and inserted into the
+        phase for their priority.
+
+        Args:
+            record: Stored plan record (mutated)
+            changed: Indices of actions whose inputs changed
+            policy: Current cluster policy
+            risky_pools: Currently flagged pools
+        """
+        proposed = record["proposed"]
+        statuses = record["statuses"]
+        result = record["result"]
+
+        approved = {a["plan_index"]: a for a in result["approved_actions"]}
+        rejected = {a["plan_index"]: a for a in result["rejected_actions"]}
+
+        by_resource = {}
+        for index, action in approved.items():
+            if action.get("target_resource"):
+                by_resource[action["target_resource"]] = index
+
+        ids = {a["id"]: i for i, a in enumerate(proposed) if a.get("id")}
+        peers: Dict[Any, List[int]] = {}
+        for i, a in enumerate(proposed):
+            for dep in a.get("depends_on") or []:
+                peers.setdefault(("dep", dep), []).append(i)
+            if a.get("target_resource"):
+                peers.setdefault(("res", a["target_resource"]), []).append(i)
+
+        def related(index: int) -> List[int]:
+            # Actions whose outcome may change when this one's does
+            action = proposed[index]
+            return (
+                peers.get(("dep", action.get("id")), [])
+                + peers.get(("res", action.get("target_resource")), [])
+            )
+
+        def remove(index: int) -> None:
+            action = approved.pop(index)
+            if by_resource.get(action.get("target_resource")) == index:
+                del by_resource[action["target_resource"]]
+            queue.extend(i for i in related(index) if i != index)
+
+        # Rejection and dependency outcomes are final once computed and
+        # conflicts always move towards the higher-savings action, so the
+        # worklist settles after a bounded number of passes
+        queue = sorted(changed)
+        revalidate = set(changed)
+
+        while queue:
+            index = queue.pop(0)
+
+            if index in revalidate:
+                revalidate.discard(index)
+                action = dict(proposed[index], plan_index=index)
+                is_valid, reason = self._validate_with_risk(
+                    action, None, policy, risky_pools
+                )
+
+                if not is_valid:
+                    action["rejection_reason"] = reason
+                    rejected[index] = action
+                    if statuses[index] == "approved":
+                        remove(index)
+                    elif statuses[index] != "rejected":
+                        queue.extend(related(index))
+                    statuses[index] = "rejected"
+                    continue
+
+                if statuses[index] == "rejected":
+                    del rejected[index]
+                    statuses[index] = "dropped"
+                    queue.extend(related(index))
+            elif statuses[index] == "rejected":
+                continue
+            else:
+                action = approved.get(index) or dict(proposed[index], plan_index=index)
+
+            missing = [
+                dep for dep in (action.get("depends_on") or [])
+                if dep not in ids or statuses[ids[dep]] == "rejected"
+            ]
+            if missing:
+                if statuses[index] == "approved":
+                    remove(index)
+                statuses[index] = "dropped"
+                continue
+
+            if statuses[index] == "approved":
+                continue
+
+            # Same-resource conflict: higher savings wins, ties keep lower index
+            resource = action.get("target_resource")
+            other = by_resource.get(resource) if resource else None
+            if other is not None:
+                result["summary"]["conflicts_detected"] += 1
+                mine = (action.get("estimated_savings", 0), -index)
+                theirs = (approved[other].get("estimated_savings", 0), -other)
+                if theirs >= mine:
+                    continue
+                remove(other)
+                statuses[other] = "dropped"
+
+            self._prioritize_actions([action], None, policy)
+            approved[index] = action
+            statuses[index] = "approved"
+            if resource:
+                by_resource[resource] = index
+
+        approved_actions = sorted(
+            approved.values(), key=lambda a: (a["priority"], a["plan_index"])
+        )
+
+        _patch_execution_plan(result["execution_plan"], approved)
+
+        result["approved_actions"] = approved_actions
+        result["rejected_actions"] = sorted(
+            rejected.values(), key=lambda a: a["plan_index"]
+        )
+        result["requires_approval"] = self._check_approval_required(
+            approved_actions, policy
+        )
+        result["summary"].update({
+            "validated": sum(1 for s in statuses if s != "rejected"),
+            "rejected": sum(1 for s in statuses if s == "rejected"),
+            "approved": len(approved_actions)
+        })
+
+    def _validate_action(
+        self,
+        action: Dict[str, Any],
+        cluster: Cluster,
+        policy: Optional[ClusterPolicy]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Validate single action against cluster policy
+
+        Uses the policy's compiled validator (cached per policy version).
+
+        Args:
+            action: Proposed action
+            cluster: Cluster record
+            policy: Cluster policy or compiled policy (may be None)
+
+        Returns:
+            Tuple of (is_valid, rejection_reason)
+        """
+        return get_compiled_policy(policy).validate(action)
 
     def _detect_conflicts(
         self,
@@ -462,7 +994,8 @@ class DecisionEngine:
         Returns:
             True if approval required
         """
-        if not policy:
+        policy = get_compiled_policy(policy)
+        if policy.permissive:
             return False
 
         # Check policy requirement
@@ -500,48 +1033,18 @@ class DecisionEngine:
         Returns:
             Dict with execution plan
         """
-        # Group actions into phases
+        # Group actions into phases by priority
         phases = []
 
-        # Phase 1: Critical actions (execute immediately)
-        critical = [a for a in actions if a["priority"] == ActionPriority.CRITICAL.value]
-        if critical:
-            phases.append({
-                "phase": 1,
-                "name": "Critical Actions",
-                "actions": critical,
-                "delay_seconds": 0
-            })
-
-        # Phase 2: High priority actions
-        high = [a for a in actions if a["priority"] == ActionPriority.HIGH.value]
-        if high:
-            phases.append({
-                "phase": 2,
-                "name": "High Priority Actions",
-                "actions": high,
-                "delay_seconds": 60  # 1 minute after Phase 1
-            })
-
-        # Phase 3: Medium priority actions
-        medium = [a for a in actions if a["priority"] == ActionPriority.MEDIUM.value]
-        if medium:
-            phases.append({
-                "phase": 3,
-                "name": "Medium Priority Actions",
-                "actions": medium,
-                "delay_seconds": 300  # 5 minutes after Phase 1
-            })
-
-        # Phase 4: Low priority actions
-        low = [a for a in actions if a["priority"] == ActionPriority.LOW.value]
-        if low:
-            phases.append({
-                "phase": 4,
-                "name": "Low Priority Actions",
-                "actions": low,
-                "delay_seconds": 600  # 10 minutes after Phase 1
-            })
+        for priority, (phase_num, name, delay) in _PHASE_LAYOUT.items():
+            phase_actions = [a for a in actions if a["priority"] == priority]
+            if phase_actions:
+                phases.append({
+                    "phase": phase_num,
+                    "name": name,
+                    "actions": phase_actions,
+                    "delay_seconds": delay
+                })
 
         return {
             "total_phases": len(phases),
@@ -553,6 +1056,131 @@ class DecisionEngine:
         }
 
 
+def _fingerprint(value: Any) -> str:
+    """Stable short hash of a JSON-serializable value"""
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def _strip_decision(action: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an action without the keys added by evaluation"""
+    return {k: v for k, v in action.items() if k not in _DECISION_KEYS}
+
+
+def _action_pool(action: Dict[str, Any]) -> Optional[str]:
+    """Instance pool ("az:instance_type") an action launches into, if any"""
+    az = action.get("availability_zone")
+    instance_type = action.get("recommended_instance_type")
+    if az and instance_type:
+        return f"{az}:{instance_type}"
+    return None
+
+
+def _policy_version(policy: Any) -> Optional[str]:
+    """Policy version identifier (id and last update time)"""
+    if policy is None:
+        return None
+    return f"{policy.id}:{policy.updated_at}"
+
+
+def _action_fingerprint(
+    action: Dict[str, Any],
+    policy: Any,
+    risky_pools: set
+) -> str:
+    """
+    Fingerprint of everything an action's validation depends on
+
+    Covers the action itself, the compiled policy rule for its type, and the
+    risk flag of the pool it targets.
+    """
+    compiled = get_compiled_policy(policy)
+    pool = _action_pool(action)
+
+    return _fingerprint({
+        "action": _strip_decision(action),
+        "policy": [
+            compiled.max_risk_threshold,
+            compiled.rule_for(action.get("type", ""))
+        ],
+        "risky": bool(pool and pool in risky_pools)
+    })
+
+
+def _patch_execution_plan(
+    plan: Dict[str, Any],
+    approved: Dict[int, Dict[str, Any]]
+) -> None:
+    """
+    Patch a phased execution plan in place to match the approved actions
+
+    Removed actions are dropped from their phase and new ones are inserted
+    (ordered by plan index) into the phase for their priority; untouched
+    phases keep their existing action lists.
+    """
+    phases = {p["phase"]: p for p in plan["phases"]}
+    placed = set()
+
+    for phase in phases.values():
+        phase["actions"] = [
+            a for a in phase["actions"] if a["plan_index"] in approved
+        ]
+        placed.update(a["plan_index"] for a in phase["actions"])
+
+    for index in sorted(set(approved) - placed):
+        action = approved[index]
+        phase_num, name, delay = _PHASE_LAYOUT[action["priority"]]
+        phase = phases.setdefault(phase_num, {
+            "phase": phase_num,
+            "name": name,
+            "actions": [],
+            "delay_seconds": delay
+        })
+        keys = [a["plan_index"] for a in phase["actions"]]
+        phase["actions"].insert(bisect.bisect(keys, index), action)
+
+    plan["phases"] = [phases[n] for n in sorted(phases) if phases[n]["actions"]]
+    plan["total_phases"] = len(plan["phases"])
+    plan["total_actions"] = len(approved)
+    plan["estimated_duration_seconds"] = max(
+        (p["delay_seconds"] for p in plan["phases"]), default=0
+    ) + 60
+
+
+def _snapshot(record: Any, fields: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """Copy selected ORM attributes into a plain, picklable dict"""
+    if record is None:
+        return None
+    return {field: getattr(record, field, None) for field in fields}
+
+
+def _evaluate_cluster_snapshot(
+    cluster_id: str,
+    proposed_actions: List[Dict[str, Any]],
+    cluster_data: Dict[str, Any],
+    policy: CompiledPolicy,
+    job_id: Optional[str] = None,
+    risky_pools: Optional[set] = None
+) -> Dict[str, Any]:
+    """
+    Evaluate one cluster's actions from snapshots (process pool entry point)
+
+    Builds an engine without a database session or Redis client, which the
+    pipeline steps do not need.
+    """
+    engine = DecisionEngine.__new__(DecisionEngine)
+    engine.db = None
+    engine.redis_client = None
+    engine.ml_model_server = None
+    engine.risk_tracker = None
+
+    cluster = SimpleNamespace(**cluster_data)
+
+    return engine._evaluate_loaded(
+        cluster_id, proposed_actions, cluster, policy, job_id, risky_pools
+    )
+
+
 def get_decision_engine(db: Session, redis_client=None) -> DecisionEngine:
     """
     Factory function to create Decision Engine instance
@@ -0,0 +1,321 @@
+"""
+Hibernation Timer (WORK-HIB-01)
+Next-transition timer wheel for hibernation schedules
+
+Instead of evaluating every schedule every minute, the next transition of
+each schedule (SLEEP, WAKE or PREWARM) is computed once as a UTC instant and
+kept in a Redis sorted set. The scheduler tick pops only what is due, so its
+cost depends on the number of due transitions, not on the number of
+schedules:
+
+- hibernation:transitions        ZSET  schedule_id -> next transition (epoch)
+- hibernation:transition_action  HASH  schedule_id -> SLEEP | WAKE | PREWARM
+- hibernation:transitions:built  set once the wheel has been filled
+
+Due entries are claimed with a lease rather than removed: pop_due() moves
+them RETRY_SECONDS into the future, and advance()/retry()/unschedule()
+overwrite the lease once the transition has been handled. A tick that dies
+in between leaves the lease to expire, and the transition fires again.
+
+A schedule's entry is recomputed only when it fires or when the schedule is
+edited (reschedule()). Edits enqueue an immediate reconcile to the state the
+schedule wants right now; transitions after that are computed from the
+matrix in the schedule's timezone, so DST changes are picked up when the
+next entry is computed.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+
+import pytz
+from sqlalchemy.orm import Session
+
+from backend.models.hibernation_schedule import HibernationSchedule
+from backend.core.redis_client import get_redis_client
+from backend.core.schedule_mask import (
+    HOURS_PER_WEEK,
+    is_awake,
+    next_set,
+    next_unset,
+    schedule_mask
+)
+
+logger = logging.getLogger(__name__)
+
+TRANSITIONS_KEY = "hibernation:transitions"
+ACTIONS_KEY = "hibernation:transition_action"
+BUILT_KEY = "hibernation:transitions:built"
+
+# Default pre-warm lead: boot clusters this many minutes before wake
+PREWARM_MINUTES = 30
+
+# A failed transition is retried after this long; also the lease of a
+# claimed transition whose tick never reported back
+RETRY_SECONDS = 60
+
+# Transitions popped per tick
+POP_BATCH_SIZE = 1000
+
+# Claims due entries atomically by moving them to the lease expiry, so
+# overlapping ticks never claim the same transition
+# KEYS: transitions ZSET; ARGV: now, lease expiry, batch size
+_CLAIM_DUE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[3])
+for _, schedule_id in ipairs(due) do
+    redis.call('ZADD', KEYS[1], ARGV[2], schedule_id)
+end
+return due
+"""
+
+
+def _hour_of_week(wall_time: datetime) -> int:
+    return wall_time.weekday() * 24 + wall_time.hour
+
+
+def desired_action(mask: int, timezone: str, at: float) -> str:
+    """
+    Action matching the state a schedule wants at a point in time
+
+    Args:
+        mask: Schedule mask (core/schedule_mask.py)
+        timezone: Schedule timezone
+        at: Epoch seconds
+
+    Returns:
+        "WAKE" or "SLEEP"
+    """
+    local = datetime.fromtimestamp(at, pytz.UTC).astimezone(pytz.timezone(timezone))
+    return "WAKE" if is_awake(mask, _hour_of_week(local)) else "SLEEP"
+
+
+def next_transition(
+    mask: int,
+    timezone: str,
+    after: float,
+    prewarm_minutes: int = PREWARM_MINUTES
+) -> Optional[Tuple[float, str]]:
+    """
+    First transition of a schedule strictly after a point in time
+
+    The next state change is found with a bit search from the current local
+    hour of the week and converted back to UTC in the schedule's timezone.
+    A WAKE is preceded by a PREWARM prewarm_minutes earlier unless that
+    instant has already passed.
+
+    Args:
+        mask: Schedule mask (core/schedule_mask.py)
+        timezone: Schedule timezone
+        after: Epoch seconds
+        prewarm_minutes: Pre-warm lead (0 = no pre-warm)
+
+    Returns:
+        (epoch seconds, "SLEEP" | "WAKE" | "PREWARM"), or None if the
+        schedule never changes state
+    """
+    tz = pytz.timezone(timezone)
+    local = datetime.fromtimestamp(after, pytz.UTC).astimezone(tz)
+    hour_start = local.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    start_hour = _hour_of_week(hour_start)
+
+    awake = is_awake(mask, start_hour)
+    offset = 0
+    # Changes landing in a repeated DST hour can already be past; look on
+    while offset <= HOURS_PER_WEEK:
+        position = (start_hour + offset) % HOURS_PER_WEEK
+        find = next_unset if awake else next_set
+        change = find(mask, position + 1)
+        if change is None:
+            return None
+        offset += (change - position) % HOURS_PER_WEEK or HOURS_PER_WEEK
+        awake = not awake
+
+        wall_time = hour_start + timedelta(hours=offset)
+        at = tz.normalize(tz.localize(wall_time, is_dst=False)).timestamp()
+        if at <= after:
+            continue
+
+        if not awake:
+            return at, "SLEEP"
+        prewarm_at = at - prewarm_minutes * 60
+        if prewarm_minutes and prewarm_at > after:
+            return prewarm_at, "PREWARM"
+        return at, "WAKE"
+
+    return None
+
+
+class HibernationTimer:
+    """
+    Redis-backed queue of the next transition of every hibernation schedule
+    """
+
+    def __init__(self, db: Session, redis_client=None):
+        """
+        Initialize timer
+
+        Args:
+            db: Database session
+            redis_client: Optional Redis client
+        """
+        self.db = db
+        self.redis_client = redis_client or get_redis_client()
+        self._claim_due = self.redis_client.register_script(_CLAIM_DUE_SCRIPT)
+
+    def reschedule(self, schedule: HibernationSchedule, now: Optional[float] = None) -> str:
+        """
+        Queue an immediate reconcile for a created or edited schedule
+
+        The reconcile applies the state the schedule wants right now (a
+        no-op if the cluster is already there) and then queues the next
+        transition.
+
+        Args:
+            schedule: HibernationSchedule record
+            now: Epoch seconds (default now)
+
+        Returns:
+            Action queued ("WAKE" or "SLEEP")
+        """
+        now = now or time.time()
+        action = desired_action(schedule_mask(schedule), schedule.timezone, now)
+        self._set(str(schedule.id), now, action)
+        return action
+
+    def advance(
+        self,
+        schedule: HibernationSchedule,
+        now: Optional[float] = None
+    ) -> Optional[Tuple[float, str]]:
+        """
+        Queue the next transition of a schedule after one has fired
+
+        Args:
+            schedule: HibernationSchedule record
+            now: Epoch seconds (default now)
+
+        Returns:
+            (epoch seconds, action), or None if the schedule has no transitions
+        """
+        now = now or time.time()
+        transition = next_transition(
+            schedule_mask(schedule),
+            schedule.timezone,
+            now,
+            prewarm_minutes=(
+                schedule.prewarm_minutes if schedule.prewarm_minutes is not None else PREWARM_MINUTES
+            )
+        )
+        if transition is None:
+            self.unschedule(str(schedule.id))
+            return None
+
+        self._set(str(schedule.id), *transition)
+        return transition
+
+    def retry(self, schedule_id: str, action: str, now: Optional[float] = None) -> None:
+        """Queue a failed transition again after RETRY_SECONDS"""
+        self._set(schedule_id, (now or time.time()) + RETRY_SECONDS, action)
+
+    def unschedule(self, schedule_id: str) -> None:
+        """Drop a deleted or deactivated schedule from the wheel"""
+        pipe = self.redis_client.pipeline()
+        pipe.zrem(TRANSITIONS_KEY, schedule_id)
+        pipe.hdel(ACTIONS_KEY, schedule_id)
+        pipe.execute()
+
+    def pop_due(self, now: Optional[float] = None) -> List[Tuple[str, str]]:
+        """
+        Claim all transitions due by now
+
+        Claimed entries are leased for RETRY_SECONDS (moved to now +
+        RETRY_SECONDS in one atomic script), so overlapping ticks never fire
+        a transition twice. The caller must advance(), retry() or
+        unschedule() every claimed schedule; if it does not (crash, error),
+        the lease runs out and the transition is popped again.
+
+        Args:
+            now: Epoch seconds (default now)
+
+        Returns:
+            [(schedule_id, action), ...] in due order
+        """
+        now = now or time.time()
+        due_ids = self._claim_due(
+            keys=[TRANSITIONS_KEY],
+            args=[now, now + RETRY_SECONDS, POP_BATCH_SIZE]
+        )
+        if not due_ids:
+            return []
+
+        actions = self.redis_client.hmget(ACTIONS_KEY, due_ids)
+
+        # Entries without an action cannot fire; drop them instead of
+        # leasing them again on every tick
+        orphans = [schedule_id for schedule_id, action in zip(due_ids, actions) if not action]
+        if orphans:
+            self.redis_client.zrem(TRANSITIONS_KEY, *orphans)
+
+        return [
+            (schedule_id, action)
+            for schedule_id, action in zip(due_ids, actions)
+            if action
+        ]
+
+    def ensure_built(self, now: Optional[float] = None) -> int:
+        """
+        Fill the wheel from the database if it has never been built
+
+        Runs on the first tick (or after Redis lost its data) and queues a
+        reconcile for every active schedule.
+
+        Returns:
+            Number of schedules queued (0 if already built)
+        """
+        if self.redis_client.exists(BUILT_KEY):
+            return 0
+
+        now = now or time.time()
+        schedules = self.db.query(HibernationSchedule).filter(
+            HibernationSchedule.is_active == "Y"
+        ).all()
+
+        pipe = self.redis_client.pipeline()
+        for schedule in schedules:
+            action = desired_action(schedule_mask(schedule), schedule.timezone, now)
+            pipe.zadd(TRANSITIONS_KEY, {str(schedule.id): now})
+            pipe.hset(ACTIONS_KEY, str(schedule.id), action)
+        pipe.set(BUILT_KEY, "1")
+        pipe.execute()
+
+        logger.info(f"[WORK-HIB-01] Built hibernation timer wheel with {len(schedules)} schedules")
+        return len(schedules)
+
+    def stats(self) -> Dict[str, Any]:
+        """Number of queued transitions and when the next one is due"""
+        head = self.redis_client.zrange(TRANSITIONS_KEY, 0, 0, withscores=True)
+        return {
+            "queued": self.redis_client.zcard(TRANSITIONS_KEY),
+            "next_due": head[0][1] if head else None
+        }
+
+    def _set(self, schedule_id: str, at: float, action: str) -> None:
+        pipe = self.redis_client.pipeline()
+        pipe.zadd(TRANSITIONS_KEY, {schedule_id: at})
+        pipe.hset(ACTIONS_KEY, schedule_id, action)
+        pipe.execute()
+
+
+def get_hibernation_timer(db: Session, redis_client=None) -> HibernationTimer:
+    """
+    Factory function to create Hibernation Timer instance
+
+    Args:
+        db: Database session
+        redis_client: Optional Redis client
+
+    Returns:
+        HibernationTimer instance
+    """
+    return HibernationTimer(db, redis_client)
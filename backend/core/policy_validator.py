@@ -0,0 +1,224 @@
+"""
+Compiled Policy Validators (CORE-DECIDE)
+Fast, picklable action validators compiled from cluster policies
+
+Each ClusterPolicy is compiled once into a small rule table keyed by action
+type and cached by (policy_id, updated_at). Validation of a whole action list
+then runs without touching ORM attributes, and compiled policies can be sent
+to process pool workers as plain data.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+# Maximum number of compiled policies kept per process
+COMPILED_POLICY_CACHE_SIZE = 1024
+
+# Action type -> (policy flag enabling it, rejection reason when disabled)
+_TYPE_FLAGS = {
+    "spot_replacement": ("allow_spot_replacement", "Spot replacement disabled by policy"),
+    "right_size": ("allow_rightsizing", "Right-sizing disabled by policy"),
+    "consolidate": ("allow_consolidation", "Consolidation disabled by policy"),
+    "hibernate": ("allow_hibernation", "Hibernation disabled by policy"),
+}
+
+# Action types bounded below by min_nodes / above by max_nodes
+_MIN_NODE_TYPES = ("consolidate", "scale_down")
+_MAX_NODE_TYPES = ("scale_up",)
+
+# Rule for action types the policy says nothing specific about
+_DEFAULT_RULE = (None, None, None)
+
+# Risk threshold when the policy config does not set max_risk_threshold
+# (risk scores are in [0, 1], so the default rejects nothing on risk)
+DEFAULT_MAX_RISK_THRESHOLD = 1.0
+
+
+class CompiledPolicy:
+    """
+    Validation rules of one policy version as plain data
+
+    Rules are (disabled_reason, min_nodes, max_nodes) tuples keyed by action
+    type; a None policy compiles to a validator that allows everything.
+    """
+
+    __slots__ = ("id", "updated_at", "require_approval", "max_risk_threshold", "rules")
+
+    def __init__(
+        self,
+        policy_id: Optional[str],
+        updated_at: Any,
+        require_approval: bool,
+        max_risk_threshold: Optional[float],
+        rules: Dict[str, Tuple[Optional[str], Optional[int], Optional[int]]]
+    ):
+        self.id = policy_id
+        self.updated_at = updated_at
+        self.require_approval = require_approval
+        self.max_risk_threshold = max_risk_threshold
+        self.rules = rules
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+    @property
+    def permissive(self) -> bool:
+        """True if compiled from no policy (all actions allowed)"""
+        return self.max_risk_threshold is None
+
+    def rule_for(self, action_type: str) -> Tuple[Optional[str], Optional[int], Optional[int]]:
+        """Rule tuple applied to an action type"""
+        return self.rules.get(action_type, _DEFAULT_RULE)
+
+    def validate(self, action: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+        """
+        Validate single action
+
+        Args:
+            action: Proposed action
+
+        Returns:
+            Tuple of (is_valid, rejection_reason)
+        """
+        return self.validate_all([action])[0]
+
+    def validate_all(
+        self,
+        actions: List[Dict[str, Any]]
+    ) -> List[Tuple[bool, Optional[str]]]:
+        """
+        Validate a list of actions in one pass
+
+        Args:
+            actions: Proposed actions
+
+        Returns:
+            List of (is_valid, rejection_reason), one per action
+        """
+        if self.permissive:
+            return [(True, None)] * len(actions)
+
+        rules = self.rules
+        threshold = self.max_risk_threshold
+        results = []
+
+        for action in actions:
+            disabled, min_nodes, max_nodes = rules.get(action.get("type", ""), _DEFAULT_RULE)
+
+            if disabled:
+                results.append((False, disabled))
+                continue
+
+            action_risk = action.get("risk_score", 0.0)
+            if action_risk > threshold:
+                results.append(
+                    (False, f"Risk score {action_risk} exceeds threshold {threshold}")
+                )
+                continue
+
+            if min_nodes is not None and action.get("projected_node_count", 0) < min_nodes:
+                results.append(
+                    (False, f"Would violate min nodes constraint ({min_nodes})")
+                )
+                continue
+
+            if max_nodes is not None and action.get("projected_node_count", 0) > max_nodes:
+                results.append(
+                    (False, f"Would exceed max nodes constraint ({max_nodes})")
+                )
+                continue
+
+            results.append((True, None))
+
+        return results
+
+
+def compile_policy(policy: Any) -> CompiledPolicy:
+    """
+    Compile a cluster policy into a validator
+
+    Rules are read from the policy's JSONB config; keys that are not set
+    fall back to explicit defaults (every action type allowed, no node
+    bounds, no approval requirement, DEFAULT_MAX_RISK_THRESHOLD).
+
+    Args:
+        policy: ClusterPolicy (may be None)
+
+    Returns:
+        CompiledPolicy instance
+    """
+    if policy is None:
+        return CompiledPolicy(None, None, False, None, {})
+
+    config = policy.config or {}
+    policy_min_nodes = config.get("min_nodes")
+    policy_max_nodes = config.get("max_nodes") or None
+
+    rules = {}
+    action_types = set(_TYPE_FLAGS) | set(_MIN_NODE_TYPES) | set(_MAX_NODE_TYPES)
+
+    for action_type in action_types:
+        disabled = None
+        if action_type in _TYPE_FLAGS:
+            flag, reason = _TYPE_FLAGS[action_type]
+            if not config.get(flag, True):
+                disabled = reason
+
+        min_nodes = policy_min_nodes if action_type in _MIN_NODE_TYPES else None
+        max_nodes = policy_max_nodes if action_type in _MAX_NODE_TYPES else None
+
+        rules[action_type] = (disabled, min_nodes, max_nodes)
+
+    max_risk_threshold = config.get("max_risk_threshold")
+    if max_risk_threshold is None:
+        max_risk_threshold = DEFAULT_MAX_RISK_THRESHOLD
+
+    return CompiledPolicy(
+        policy_id=policy.id,
+        updated_at=policy.updated_at,
+        require_approval=bool(config.get("require_approval", False)),
+        max_risk_threshold=float(max_risk_threshold),
+        rules=rules
+    )
+
+
+_compiled_policies: "OrderedDict[Tuple[Any, Any], CompiledPolicy]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_policy(policy: Any) -> CompiledPolicy:
+    """
+    Get compiled validator for a policy, compiling once per policy version
+
+    Args:
+        policy: ClusterPolicy, already-compiled policy, or None
+
+    Returns:
+        CompiledPolicy instance
+    """
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    if policy is None:
+        return compile_policy(None)
+
+    key = (policy.id, policy.updated_at)
+
+    with _compiled_lock:
+        compiled = _compiled_policies.get(key)
+        if compiled is not None:
+            _compiled_policies.move_to_end(key)
+            return compiled
+
+    compiled = compile_policy(policy)
+
+    with _compiled_lock:
+        _compiled_policies[key] = compiled
+        while len(_compiled_policies) > COMPILED_POLICY_CACHE_SIZE:
+            _compiled_policies.popitem(last=False)
+
+    return compiled
@@ -0,0 +1,119 @@
+"""
+Schedule Masks (WORK-HIB-01)
+168-bit weekly hibernation schedules
+
+A weekly schedule is one Python int with bit i set when the cluster should
+be awake during hour i of the week (Mon 00:00 = 0 .. Sun 23:00 = 167), and
+is stored as 21 big-endian bytes. Lookups, next-change searches, awake-hour
+counts and fleet unions/intersections are single integer operations instead
+of walks over a 168-element list.
+"""
+
+from typing import Iterable, List, Optional, Union
+
+HOURS_PER_WEEK = 168
+MASK_BYTES = 21
+FULL_MASK = (1 << HOURS_PER_WEEK) - 1
+
+# A matrix as stored in JSONB (list of 0/1), a '0'/'1' string, packed bytes or a mask
+ScheduleLike = Union[int, bytes, str, Iterable[int]]
+
+
+def to_mask(matrix: ScheduleLike) -> int:
+    """
+    Convert any schedule representation to a mask
+
+    Args:
+        matrix: 168-element list of 0/1, 168-character '0'/'1' string,
+                21 packed bytes or a mask
+
+    Returns:
+        168-bit mask
+    """
+    if isinstance(matrix, int):
+        return matrix & FULL_MASK
+    if isinstance(matrix, (bytes, bytearray, memoryview)):
+        return from_bytes(bytes(matrix))
+
+    mask = 0
+    for hour, value in enumerate(matrix):
+        if value == 1 or value == "1":
+            mask |= 1 << hour
+    return mask
+
+
+def to_matrix(mask: int) -> List[int]:
+    """Expand a mask to the 168-element 0/1 list used by the API"""
+    return [(mask >> hour) & 1 for hour in range(HOURS_PER_WEEK)]
+
+
+def to_bytes(mask: int) -> bytes:
+    """Pack a mask into 21 bytes"""
+    return mask.to_bytes(MASK_BYTES, "big")
+
+
+def from_bytes(packed: bytes) -> int:
+    """Unpack 21 bytes into a mask"""
+    return int.from_bytes(packed, "big") & FULL_MASK
+
+
+def schedule_mask(schedule) -> int:
+    """
+    Mask of a HibernationSchedule
+
+    Uses the packed schedule_bits column when set, else the JSONB matrix.
+    """
+    packed = getattr(schedule, "schedule_bits", None)
+    if packed:
+        return from_bytes(packed)
+    return to_mask(schedule.schedule_matrix)
+
+
+def is_awake(mask: int, hour: int) -> bool:
+    """Whether the schedule is awake during an hour of the week"""
+    return bool((mask >> (hour % HOURS_PER_WEEK)) & 1)
+
+
+def next_set(mask: int, hour: int) -> Optional[int]:
+    """
+    First awake hour at or after an hour of the week (wrapping around)
+
+    Args:
+        mask: Schedule mask
+        hour: Hour of the week to start from
+
+    Returns:
+        Hour of the week, or None if the schedule is never awake
+    """
+    hour %= HOURS_PER_WEEK
+    rotated = ((mask >> hour) | (mask << (HOURS_PER_WEEK - hour))) & FULL_MASK
+    if not rotated:
+        return None
+    offset = (rotated & -rotated).bit_length() - 1
+    return (hour + offset) % HOURS_PER_WEEK
+
+
+def next_unset(mask: int, hour: int) -> Optional[int]:
+    """First sleeping hour at or after an hour of the week (None if always awake)"""
+    return next_set(~mask & FULL_MASK, hour)
+
+
+def awake_hours(mask: int) -> int:
+    """Number of awake hours per week"""
+    return mask.bit_count()
+
+
+def fleet_union(masks: Iterable[int]) -> int:
+    """Hours in which at least one schedule is awake"""
+    union = 0
+    for mask in masks:
+        union |= mask
+    return union
+
+
+def fleet_intersection(masks: Iterable[int]) -> int:
+    """Hours in which every schedule is awake (0 for no schedules)"""
+    intersection = None
+    for mask in masks:
+        intersection = mask if intersection is None else intersection & mask
+    return intersection or 0
@@ -0,0 +1,508 @@
+"""
+Spot Fulfillment Tracker (CORE-EXEC)
+Shared, event-assisted waiter for pending Spot replacement requests
+
+Instead of each replacement blocking a worker until its Spot request is
+fulfilled, the executor registers the request here and returns. One polling
+loop (Celery beat + wake-ups from EC2 state-change events) then:
+
+- Describes all due Spot requests of an account/region in batched calls
+- Uses instance states cached by the event processor, and describes only
+  the instances it has no event for
+- Backs off exponentially per request while it is still pending
+- Finishes the replacement (terminates the old instance) once the new
+  instance is running, and fails/cancels requests past their deadline
+
+The old instance is terminated without a Kubernetes cordon/drain first:
+the platform holds no cluster API credentials, so its pods are evicted by
+the node shutdown itself (and rescheduled once the kubelet reports the
+node gone) rather than drained gracefully beforehand.
+
+State lives in Redis so any worker can run the loop:
+- spot_fulfillment:pending   HASH  request_id -> JSON record
+- spot_fulfillment:due       ZSET  request_id -> next check (epoch)
+- spot_fulfillment:instance:{instance_id} -> request_id
+"""
+
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+from sqlalchemy.orm import Session
+
+from backend.models import Account
+from backend.models.audit_log import AuditLog, AuditOutcome, ResourceType
+from backend.core.redis_client import get_redis_client
+from backend.core.aws_session import get_aws_client_pool
+
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "spot_fulfillment:pending"
+DUE_KEY = "spot_fulfillment:due"
+INSTANCE_KEY = "spot_fulfillment:instance:{}"
+POLL_LOCK_KEY = "spot_fulfillment:poll_lock"
+
+# Per-request backoff between checks: 5s, 10s, 20s, ... capped at 60s
+BACKOFF_BASE_SECONDS = 5
+BACKOFF_MAX_SECONDS = 60
+
+# Give up (and cancel the request) after this long
+FULFILLMENT_TIMEOUT_SECONDS = 600
+
+# AWS accepts up to 1000 IDs per describe call; keep pages small
+DESCRIBE_BATCH_SIZE = 100
+
+# Requests handled per poll pass
+POLL_BATCH_SIZE = 500
+POLL_LOCK_SECONDS = 60
+
+_REQUEST_FAILED_STATES = ("cancelled", "failed", "closed")
+_INSTANCE_FAILED_STATES = ("shutting-down", "terminated", "stopping", "stopped")
+_INSTANCE_GONE_STATES = ("shutting-down", "terminated")
+
+
+class SpotFulfillmentTracker:
+    """
+    Tracks many pending Spot requests with one shared polling loop
+    """
+
+    def __init__(self, db: Session, redis_client=None):
+        """
+        Initialize tracker
+
+        Args:
+            db: Database session
+            redis_client: Optional Redis client
+        """
+        self.db = db
+        self.redis_client = redis_client or get_redis_client()
+
+    def track(
+        self,
+        spot_request_id: str,
+        cluster_id: str,
+        account_id: str,
+        region: str,
+        old_instance_id: Optional[str],
+        action: Dict[str, Any],
+        timeout_seconds: int = FULFILLMENT_TIMEOUT_SECONDS
+    ) -> None:
+        """
+        Register a Spot request to be completed by the polling loop
+
+        Args:
+            spot_request_id: Spot instance request ID
+            cluster_id: Cluster UUID
+            account_id: Account UUID (for role assumption)
+            region: AWS region
+            old_instance_id: Instance to terminate once fulfilled
+            action: Originating action (logged on completion)
+            timeout_seconds: Deadline for fulfillment
+        """
+        now = time.time()
+        record = {
+            "spot_request_id": spot_request_id,
+            "cluster_id": cluster_id,
+            "account_id": account_id,
+            "region": region,
+            "old_instance_id": old_instance_id,
+            "instance_id": None,
+            "action": action,
+            "created_at": now,
+            "deadline": now + timeout_seconds,
+            "attempts": 0
+        }
+
+        pipe = self.redis_client.pipeline()
+        pipe.hset(PENDING_KEY, spot_request_id, json.dumps(record, default=str))
+        pipe.zadd(DUE_KEY, {spot_request_id: now + BACKOFF_BASE_SECONDS})
+        pipe.execute()
+
+        logger.info(f"[CORE-EXEC] Tracking Spot request {spot_request_id}")
+
+    def pending_count(self) -> int:
+        """Number of Spot requests still being tracked"""
+        return self.redis_client.zcard(DUE_KEY)
+
+    def notify_instance_state(self, instance_id: str, state: str) -> bool:
+        """
+        Feed an EC2 state-change event into the tracker
+
+        Makes the owning request due immediately, so it completes on the
+        next poll pass instead of after its backoff.
+
+        Args:
+            instance_id: EC2 instance ID
+            state: New instance state
+
+        Returns:
+            True if the instance belongs to a tracked Spot request
+        """
+        spot_request_id = self.redis_client.get(INSTANCE_KEY.format(instance_id))
+        if not spot_request_id:
+            return False
+
+        if self.redis_client.zscore(DUE_KEY, spot_request_id) is None:
+            return False
+
+        self.redis_client.zadd(DUE_KEY, {spot_request_id: 0})
+        logger.info(
+            f"[CORE-EXEC] Spot request {spot_request_id} instance {instance_id} "
+            f"is {state}, checking now"
+        )
+        return True
+
+    def poll(self) -> Dict[str, int]:
+        """
+        Check all due Spot requests once
+
+        Returns:
+            {"checked": 12, "fulfilled": 3, "failed": 1, "pending": 8}
+        """
+        summary = {"checked": 0, "fulfilled": 0, "failed": 0, "pending": 0}
+
+        if not self.redis_client.set(POLL_LOCK_KEY, "1", nx=True, ex=POLL_LOCK_SECONDS):
+            logger.debug("[CORE-EXEC] Spot fulfillment poll already running")
+            return summary
+
+        try:
+            now = time.time()
+            due_ids = self.redis_client.zrangebyscore(
+                DUE_KEY, 0, now, start=0, num=POLL_BATCH_SIZE
+            )
+            if not due_ids:
+                return summary
+
+            raw_records = self.redis_client.hmget(PENDING_KEY, due_ids)
+
+            records = []
+            for spot_request_id, raw in zip(due_ids, raw_records):
+                if raw is None:
+                    self.redis_client.zrem(DUE_KEY, spot_request_id)
+                    continue
+                records.append(json.loads(raw))
+
+            accounts = {
+                str(account.id): account
+                for account in self.db.query(Account).filter(
+                    Account.id.in_({r["account_id"] for r in records})
+                ).all()
+            } if records else {}
+
+            groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+            for record in records:
+                groups[(record["account_id"], record["region"])].append(record)
+
+            for (account_id, region), group in groups.items():
+                account = accounts.get(account_id)
+                if not account:
+                    for record in group:
+                        self._finish(record, "failed", error=f"Account {account_id} not found")
+                    summary["checked"] += len(group)
+                    summary["failed"] += len(group)
+                    continue
+
+                outcome = self._poll_group(account, region, group, now)
+                for key, count in outcome.items():
+                    summary[key] += count
+
+            if summary["checked"]:
+                logger.info(f"[CORE-EXEC] Spot fulfillment poll: {summary}")
+
+            return summary
+
+        finally:
+            self.redis_client.delete(POLL_LOCK_KEY)
+
+    def _poll_group(
+        self,
+        account: Account,
+        region: str,
+        records: List[Dict[str, Any]],
+        now: float
+    ) -> Dict[str, int]:
+        """
+        Check the due requests of one account/region with batched calls
+
+        Args:
+            account: Account record
+            region: AWS region
+            records: Tracked request records
+            now: Poll start time
+
+        Returns:
+            Counts of checked/fulfilled/failed/pending requests
+        """
+        summary = {"checked": len(records), "fulfilled": 0, "failed": 0, "pending": 0}
+
+        ec2_client = get_aws_client_pool().get_client(
+            'ec2',
+            region,
+            role_arn=account.role_arn,
+            external_id=account.external_id,
+            session_name=f"SpotOptimizer-Fulfillment-{account.id}"
+        )
+
+        requests = self._describe_spot_requests(
+            ec2_client, [r["spot_request_id"] for r in records]
+        )
+
+        # Map requests to their instances
+        pipe = self.redis_client.pipeline()
+        for record in records:
+            request = requests.get(record["spot_request_id"])
+            if request and request.get("InstanceId") and not record["instance_id"]:
+                record["instance_id"] = request["InstanceId"]
+                pipe.setex(
+                    INSTANCE_KEY.format(record["instance_id"]),
+                    FULFILLMENT_TIMEOUT_SECONDS * 2,
+                    record["spot_request_id"]
+                )
+        pipe.execute()
+
+        instance_states = self._instance_states(
+            ec2_client, [r["instance_id"] for r in records if r["instance_id"]]
+        )
+
+        fulfilled, failed, expired, waiting = [], [], [], []
+
+        for record in records:
+            request = requests.get(record["spot_request_id"]) or {}
+            instance_state = instance_states.get(record["instance_id"])
+
+            if instance_state == "running":
+                fulfilled.append(record)
+            elif instance_state in _INSTANCE_FAILED_STATES:
+                failed.append((record, f"Spot instance {record['instance_id']} is {instance_state}"))
+            elif request.get("State") in _REQUEST_FAILED_STATES and not record["instance_id"]:
+                status = request.get("Status", {})
+                failed.append((record, f"Spot request {request['State']}: {status.get('Code', 'unknown')}"))
+            elif now > record["deadline"]:
+                expired.append(record)
+            else:
+                waiting.append(record)
+
+        if expired:
+            try:
+                ec2_client.cancel_spot_instance_requests(
+                    SpotInstanceRequestIds=[r["spot_request_id"] for r in expired]
+                )
+            except ClientError as e:
+                logger.error(f"[CORE-EXEC] Error cancelling Spot requests: {str(e)}")
+            failed.extend((r, "Spot request not fulfilled before timeout") for r in expired)
+
+        # Cancelling a request leaves its instance running; terminate the
+        # instances failed replacements did launch so they stop billing
+        orphaned = [
+            record["instance_id"] for record, _ in failed
+            if record["instance_id"]
+            and instance_states.get(record["instance_id"]) not in _INSTANCE_GONE_STATES
+        ]
+        if orphaned:
+            logger.info(f"[CORE-EXEC] Terminating instances of failed Spot replacements {orphaned}")
+            errors = self._terminate(ec2_client, orphaned)
+            failed = [
+                (record, f"{error}; launched instance not terminated: {errors[record['instance_id']]}")
+                if record["instance_id"] in errors else (record, error)
+                for record, error in failed
+            ]
+
+        if fulfilled:
+            self._complete(ec2_client, fulfilled)
+
+        for record, error in failed:
+            self._finish(record, "failed", error=error)
+
+        # Still pending: back off exponentially
+        pipe = self.redis_client.pipeline()
+        for record in waiting:
+            record["attempts"] += 1
+            delay = min(BACKOFF_BASE_SECONDS * (2 ** record["attempts"]), BACKOFF_MAX_SECONDS)
+            pipe.hset(PENDING_KEY, record["spot_request_id"], json.dumps(record, default=str))
+            pipe.zadd(DUE_KEY, {record["spot_request_id"]: now + delay})
+        pipe.execute()
+
+        summary["fulfilled"] = len(fulfilled)
+        summary["failed"] = len(failed)
+        summary["pending"] = len(waiting)
+        return summary
+
+    def _describe_spot_requests(
+        self,
+        ec2_client,
+        spot_request_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Describe Spot requests in batches; unknown IDs are left out"""
+        requests = {}
+
+        for start in range(0, len(spot_request_ids), DESCRIBE_BATCH_SIZE):
+            batch = spot_request_ids[start:start + DESCRIBE_BATCH_SIZE]
+            try:
+                response = ec2_client.describe_spot_instance_requests(
+                    SpotInstanceRequestIds=batch
+                )
+            except ClientError as e:
+                # New requests may not be visible yet (eventual consistency);
+                # they stay pending and are retried after backoff
+                logger.warning(f"[CORE-EXEC] Error describing Spot requests: {str(e)}")
+                continue
+
+            for request in response.get('SpotInstanceRequests', []):
+                requests[request['SpotInstanceRequestId']] = request
+
+        return requests
+
+    def _instance_states(
+        self,
+        ec2_client,
+        instance_ids: List[str]
+    ) -> Dict[str, str]:
+        """
+        Get instance states, preferring states cached from EC2 events
+
+        Only instances without a cached event state are described.
+        """
+        if not instance_ids:
+            return {}
+
+        cached = self.redis_client.mget([f"instance_state:{i}" for i in instance_ids])
+        states = {i: s for i, s in zip(instance_ids, cached) if s}
+        missing = [i for i in instance_ids if i not in states]
+
+        for start in range(0, len(missing), DESCRIBE_BATCH_SIZE):
+            batch = missing[start:start + DESCRIBE_BATCH_SIZE]
+            try:
+                response = ec2_client.describe_instances(InstanceIds=batch)
+            except ClientError as e:
+                logger.warning(f"[CORE-EXEC] Error describing Spot instances: {str(e)}")
+                continue
+
+            for reservation in response.get('Reservations', []):
+                for instance in reservation.get('Instances', []):
+                    states[instance['InstanceId']] = instance['State']['Name']
+
+        return states
+
+    def _complete(self, ec2_client, records: List[Dict[str, Any]]) -> None:
+        """
+        Finish replacements whose Spot instance is running
+
+        The replaced instances are terminated directly, without draining
+        their node first (see module docstring).
+
+        Args:
+            ec2_client: EC2 client of the records' account/region
+            records: Fulfilled request records
+        """
+        old_instance_ids = [r["old_instance_id"] for r in records if r["old_instance_id"]]
+
+        errors = {}
+        if old_instance_ids:
+            logger.info(f"[CORE-EXEC] Terminating replaced instances {old_instance_ids}")
+            errors = self._terminate(ec2_client, old_instance_ids)
+
+        for record in records:
+            error = errors.get(record["old_instance_id"])
+            if error:
+                self._finish(record, "failed", error=f"Replaced instance not terminated: {error}")
+            else:
+                self._finish(record, "completed")
+
+    def _terminate(self, ec2_client, instance_ids: List[str]) -> Dict[str, str]:
+        """
+        Terminate instances, isolating failures to the instances they concern
+
+        All instances are terminated in one call; if it fails, each one is
+        retried on its own so a bad ID only fails itself. Instances that no
+        longer exist count as terminated.
+
+        Args:
+            ec2_client: EC2 client of the instances' account/region
+            instance_ids: Instance IDs
+
+        Returns:
+            Error message per instance that could not be terminated
+        """
+        try:
+            ec2_client.terminate_instances(InstanceIds=instance_ids)
+            return {}
+        except ClientError as e:
+            if len(instance_ids) == 1:
+                return self._terminate_error(instance_ids[0], e)
+            logger.warning(f"[CORE-EXEC] Batch termination failed, retrying per instance: {str(e)}")
+
+        errors = {}
+        for instance_id in instance_ids:
+            try:
+                ec2_client.terminate_instances(InstanceIds=[instance_id])
+            except ClientError as e:
+                errors.update(self._terminate_error(instance_id, e))
+        return errors
+
+    @staticmethod
+    def _terminate_error(instance_id: str, error: ClientError) -> Dict[str, str]:
+        if error.response['Error']['Code'] == 'InvalidInstanceID.NotFound':
+            logger.info(f"[CORE-EXEC] Instance {instance_id} already gone")
+            return {}
+        logger.error(f"[CORE-EXEC] Error terminating instance {instance_id}: {str(error)}")
+        return {instance_id: str(error)}
+
+    def _finish(
+        self,
+        record: Dict[str, Any],
+        status: str,
+        error: Optional[str] = None
+    ) -> None:
+        """Stop tracking a request and record its outcome"""
+        spot_request_id = record["spot_request_id"]
+
+        pipe = self.redis_client.pipeline()
+        pipe.hdel(PENDING_KEY, spot_request_id)
+        pipe.zrem(DUE_KEY, spot_request_id)
+        if record["instance_id"]:
+            pipe.delete(INSTANCE_KEY.format(record["instance_id"]))
+        pipe.execute()
+
+        details = {
+            **record["action"],
+            "spot_request_id": spot_request_id,
+            "new_instance_id": record["instance_id"],
+            "fulfillment_seconds": round(time.time() - record["created_at"], 1)
+        }
+        if status == "completed":
+            details["old_instance_terminated"] = record["old_instance_id"]
+            logger.info(f"[CORE-EXEC] Spot replacement {spot_request_id} completed")
+        else:
+            details["error"] = error
+            logger.error(f"[CORE-EXEC] Spot replacement {spot_request_id} failed: {error}")
+
+        try:
+            self.db.add(AuditLog(
+                actor_id="system",
+                actor_name="spot-fulfillment",
+                event="spot_replacement",
+                resource=str(record["cluster_id"]),
+                resource_type=ResourceType.CLUSTER,
+                outcome=AuditOutcome.SUCCESS if status == "completed" else AuditOutcome.FAILURE,
+                diff_after=details
+            ))
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"[CORE-EXEC] Error logging action: {str(e)}")
+
+
+def get_spot_fulfillment_tracker(db: Session, redis_client=None) -> SpotFulfillmentTracker:
+    """
+    Factory function to create Spot Fulfillment Tracker instance
+
+    Args:
+        db: Database session
+        redis_client: Optional Redis client
+
+    Returns:
+        SpotFulfillmentTracker instance
+    """
+    return SpotFulfillmentTracker(db, redis_client)
@@ -14,6 +14,8 @@ from backend.models.optimization_job import OptimizationJob
 from backend.models.lab_experiment import LabExperiment
 from backend.models.agent_action import AgentAction
 from backend.models.api_key import APIKey
+from backend.models.savings_rollup import SavingsDailyRollup
+from backend.models.cluster_event import ClusterEvent
 
 __all__ = [
     "User",
@@ -29,4 +31,6 @@ __all__ = [
     "LabExperiment",
     "AgentAction",
     "APIKey",
+    "SavingsDailyRollup",
+    "ClusterEvent",
 ]
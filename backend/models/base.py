@@ -70,6 +70,8 @@ def create_tables():
     from backend.models.agent_action import AgentAction
     from backend.models.api_key import APIKey
     from backend.models.invitation import OrganizationInvitation
+    from backend.models.savings_rollup import SavingsDailyRollup
+    from backend.models.cluster_event import ClusterEvent
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
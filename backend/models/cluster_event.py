@@ -0,0 +1,41 @@
+"""
+ClusterEvent model - Processed AWS events (EventBridge / CloudWatch)
+"""
+from sqlalchemy import Column, String, DateTime, Index
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime
+from backend.models.base import Base, generate_uuid
+
+
+class ClusterEvent(Base):
+    """
+    Cluster Event model
+
+    Audit trail of processed AWS events with their handler results, used
+    for event replay (WORK-EVT-01)
+    """
+    __tablename__ = "cluster_events"
+
+    # Primary key
+    id = Column(String(36), primary_key=True, default=generate_uuid, index=True)
+
+    # Deduplication fingerprint (event:{event_id} in Redis)
+    event_id = Column(String(64), nullable=True, index=True)
+
+    # Event metadata
+    event_type = Column(String(255), nullable=False)  # EventBridge detail-type
+    event_source = Column(String(255), nullable=False)  # e.g., aws.ec2
+
+    # Payload and handler result (JSONB)
+    event_data = Column(JSONB, nullable=False)
+    processing_result = Column(JSONB, nullable=True)
+
+    # Timestamps
+    processed_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    __table_args__ = (
+        Index("idx_cluster_events_type_processed", "event_type", "processed_at"),
+    )
+
+    def __repr__(self):
+        return f"<ClusterEvent(id={self.id}, event_type={self.event_type})>"
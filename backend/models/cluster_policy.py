@@ -30,7 +30,17 @@ class ClusterPolicy(Base):
     #   "binpack_enabled": true,
     #   "binpack_threshold": 30,  # percentage
     #   "fallback_on_demand": true,
-    #   "excluded_namespaces": ["kube-system", "kube-public"]
+    #   "excluded_namespaces": ["kube-system", "kube-public"],
+    #   # Action validation (backend/core/policy_validator.py), all optional:
+    #   "allow_spot_replacement": true,
+    #   "allow_rightsizing": true,
+    #   "allow_consolidation": true,
+    #   "allow_hibernation": true,
+    #   "allow_zero_nodes": false,
+    #   "min_nodes": 1,
+    #   "max_nodes": 50,
+    #   "require_approval": false,
+    #   "max_risk_threshold": 0.7
     # }
     config = Column(JSONB, nullable=False, default={})
 
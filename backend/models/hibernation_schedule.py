@@ -1,7 +1,7 @@
 """
 HibernationSchedule model - Weekly hibernation schedules
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, LargeBinary, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -28,9 +28,16 @@ class HibernationSchedule(Base):
     # Example: [0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, ...]
     schedule_matrix = Column(JSONB, nullable=False, default=[0] * 168)
 
+    # Same schedule packed as a 168-bit mask (21 bytes, bit i = hour i awake),
+    # used by the scheduler; see core/schedule_mask.py
+    schedule_bits = Column(LargeBinary(21), nullable=True)
+
     # Timezone
     timezone = Column(String(50), nullable=False, default="UTC")
 
+    # Inactive schedules are kept but not applied (Y/N)
+    is_active = Column(String(1), nullable=False, default="Y")
+
     # Pre-warm configuration
     prewarm_enabled = Column(String(1), nullable=False, default="N")  # Y/N
     prewarm_minutes = Column(Integer, nullable=False, default=30)  # Minutes before wake time
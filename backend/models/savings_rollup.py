@@ -0,0 +1,40 @@
+"""
+SavingsDailyRollup model - Daily savings per cluster and category
+"""
+from sqlalchemy import Column, String, Date, DateTime, Float, Integer, ForeignKey, Index
+from datetime import datetime
+from backend.models.base import Base
+
+
+class SavingsDailyRollup(Base):
+    """
+    Savings Daily Rollup model
+
+    One row per (cluster, category, day) summing the actions of completed
+    optimization jobs created that day. Maintained incrementally when a job
+    completes and rebuilt by the rollup backfill (modules/savings_rollup.py).
+    """
+    __tablename__ = "savings_daily_rollups"
+
+    # Composite primary key
+    cluster_id = Column(String(36), ForeignKey("clusters.id", ondelete="CASCADE"), primary_key=True)
+    category = Column(String(32), primary_key=True)  # spot_optimization, rightsizing, consolidation, hibernation, other
+    day = Column(Date, primary_key=True)
+
+    # Denormalized for per-organization reads
+    organization_id = Column(String(36), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+
+    # Aggregates
+    savings = Column(Float, nullable=False, default=0.0)
+    opportunities_found = Column(Integer, nullable=False, default=0)
+    opportunities_executed = Column(Integer, nullable=False, default=0)
+
+    # Timestamps
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_savings_rollup_org_day", "organization_id", "day"),
+    )
+
+    def __repr__(self):
+        return f"<SavingsDailyRollup(cluster_id={self.cluster_id}, category={self.category}, day={self.day})>"
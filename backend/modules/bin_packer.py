@@ -3,15 +3,25 @@ Bin Packing Module (MOD-PACK-01)
 Identifies fragmentation and waste in clusters, generates consolidation plans
 """
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime
 
+import numpy as np
+
 from backend.models.instance import Instance
 from backend.models.cluster import Cluster
+from backend.core.redis_client import get_redis_client
+from backend.modules.cluster_snapshot import (
+    ClusterSnapshot, build_snapshot, GIB, DEFAULT_MAX_PODS, DEFAULT_HOURLY_PRICE
+)
+from backend.modules.packing_engine import pack_nodes, pack_into_bins, verify_packing
+from backend.modules.workload_store import load_workload
 
 logger = logging.getLogger(__name__)
 
+HOURS_PER_MONTH = 730
+
 
 class BinPackingModule:
     """
@@ -21,12 +31,53 @@ class BinPackingModule:
     - Calculate node utilization and identify waste
     - Generate pod consolidation plans
     - Respect PodDisruptionBudgets during migrations
+    - Run what-if consolidation scenarios against a cluster snapshot
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis_client=None):
         self.db = db
+        self.redis_client = redis_client or get_redis_client()
+
+    def load_snapshot(self, cluster_id: str) -> ClusterSnapshot:
+        """
+        Load an immutable snapshot of a cluster for analysis and simulation
+
+        One instances query plus one workload store read; the snapshot can
+        then be passed to analyze_fragmentation, generate_migration_plan and
+        simulate as often as needed.
+
+        Args:
+            cluster_id: UUID of the cluster
+
+        Returns:
+            ClusterSnapshot
+        """
+        instances = self.db.query(Instance).filter(
+            Instance.cluster_id == cluster_id,
+            Instance.deleted_at.is_(None)
+        ).all()
+        workload_nodes, workload_pods, workload_pdbs = load_workload(self.redis_client, cluster_id)
+
+        snapshot = build_snapshot(
+            cluster_id,
+            instances,
+            workload_nodes,
+            workload_pods,
+            workload_pdbs,
+            self._get_instance_capacity
+        )
 
-    def analyze_fragmentation(self, cluster_id: str) -> Dict[str, Any]:
+        logger.info(
+            f"[MOD-PACK-01] Loaded snapshot of cluster {cluster_id}: "
+            f"{snapshot.node_count} nodes, {snapshot.pod_count} pods, {len(snapshot.pdb_names)} PDBs"
+        )
+        return snapshot
+
+    def analyze_fragmentation(
+        self,
+        cluster_id: str,
+        snapshot: Optional[ClusterSnapshot] = None
+    ) -> Dict[str, Any]:
         """
         Analyze cluster fragmentation and resource waste
 
@@ -38,6 +89,7 @@ class BinPackingModule:
 
         Args:
             cluster_id: UUID of the cluster to analyze
+            snapshot: Previously loaded snapshot (loaded if omitted)
 
         Returns:
             {
@@ -67,13 +119,13 @@ class BinPackingModule:
         """
         logger.info(f"[MOD-PACK-01] Analyzing fragmentation for cluster {cluster_id}")
 
-        # Query all instances in cluster
-        instances = self.db.query(Instance).filter(
-            Instance.cluster_id == cluster_id,
-            Instance.deleted_at.is_(None)
-        ).all()
+        if snapshot is None:
+            snapshot = self.load_snapshot(cluster_id)
 
-        if not instances:
+        # Instance-backed nodes only (agent-only nodes have no utilization)
+        nodes = np.flatnonzero(snapshot.from_instance)
+
+        if len(nodes) == 0:
             logger.warning(f"[MOD-PACK-01] No instances found for cluster {cluster_id}")
             return {
                 "total_nodes": 0,
@@ -84,19 +136,20 @@ class BinPackingModule:
                 "node_details": []
             }
 
-        total_nodes = len(instances)
+        total_nodes = len(nodes)
         underutilized_nodes = 0
         wasted_cpu = 0.0
         wasted_memory = 0.0
         node_details = []
 
-        for instance in instances:
-            cpu_util = instance.cpu_util or 0
-            memory_util = instance.memory_util or 0
+        for index in nodes:
+            cpu_util = float(snapshot.cpu_util[index])
+            memory_util = float(snapshot.memory_util[index])
             avg_util = (cpu_util + memory_util) / 2
+            instance_type = snapshot.instance_types[index]
 
             # Get instance capacity (simplified - in production, query from instance_family table)
-            capacity = self._get_instance_capacity(instance.instance_type)
+            capacity = self._get_instance_capacity(instance_type)
 
             # Calculate waste
             cpu_waste = capacity['cpu'] * (1 - cpu_util / 100)
@@ -113,8 +166,8 @@ class BinPackingModule:
                 wasted_memory += memory_waste
 
             node_details.append({
-                "instance_id": instance.instance_id,
-                "instance_type": instance.instance_type,
+                "instance_id": snapshot.node_ids[index],
+                "instance_type": instance_type,
                 "cpu_util": round(cpu_util, 1),
                 "memory_util": round(memory_util, 1),
                 "avg_util": round(avg_util, 1),
@@ -133,7 +186,7 @@ class BinPackingModule:
 
         # Calculate savings (assuming average $0.096/hr for m5.xlarge)
         avg_price_per_hour = 0.096
-        monthly_savings = nodes_can_remove * avg_price_per_hour * 730  # hours per month
+        monthly_savings = nodes_can_remove * avg_price_per_hour * HOURS_PER_MONTH
 
         result = {
             "total_nodes": total_nodes,
@@ -160,16 +213,25 @@ class BinPackingModule:
     def generate_migration_plan(
         self,
         cluster_id: str,
-        aggressiveness: float = 0.5
+        aggressiveness: float = 0.5,
+        max_nodes: Optional[int] = 3,
+        strategy: str = "best_fit",
+        snapshot: Optional[ClusterSnapshot] = None
     ) -> Dict[str, Any]:
         """
         Generate pod migration plan for consolidation
 
         Logic:
-        1. Identify source nodes (underutilized)
-        2. Identify target nodes (can accept more workload)
-        3. Create migration plan respecting PodDisruptionBudgets
-        4. Return step-by-step execution plan
+        1. Build CPU/memory/pod-slot vectors from the pod requests and node
+           capacity reported by the agent (nodes without agent data fall
+           back to their utilization as a single workload)
+        2. Identify source nodes (underutilized, no unmanaged pods, no
+           PodDisruptionBudget that currently allows zero disruptions)
+        3. Pack each source node's pods onto the remaining nodes
+           (first-fit-decreasing with best-fit or first-fit targets);
+           only nodes whose pods all fit are drained
+        4. Verify the result and return a step-by-step execution plan
+           respecting PodDisruptionBudgets
 
         Args:
             cluster_id: UUID of the cluster
@@ -177,6 +239,10 @@ class BinPackingModule:
                            0.2 = Conservative (only <20% utilized)
                            0.5 = Moderate (only <50% utilized)
                            0.8 = Aggressive (up to <80% utilized)
+                           Targets are filled up to 70-95% accordingly.
+            max_nodes: Maximum nodes to free per run (None = no limit)
+            strategy: "best_fit" or "first_fit" target selection
+            snapshot: Previously loaded snapshot (loaded if omitted)
 
         Returns:
             {
@@ -185,7 +251,7 @@ class BinPackingModule:
                 "phases": [
                     {
                         "phase": 1,
-                        "description": "Drain low-utilization nodes",
+                        "description": "Migrate 5 pods from i-0x123 to 2 node(s)",
                         "steps": [
                             {
                                 "action": "CORDON_NODE",
@@ -196,8 +262,13 @@ class BinPackingModule:
                                 "action": "EVICT_PODS",
                                 "source_node": "i-0x123",
                                 "destination_node": "i-0x456",
+                                "destinations": [
+                                    {"destination_node": "i-0x456", "pods": ["default/web-1", ...]},
+                                    ...
+                                ],
                                 "pod_count": 5,
-                                "respect_pdb": True
+                                "respect_pdb": True,
+                                "pdbs": ["default/web-pdb", ...]
                             },
                             {
                                 "action": "TERMINATE_NODE",
@@ -217,20 +288,11 @@ class BinPackingModule:
         """
         logger.info(f"[MOD-PACK-01] Generating migration plan for cluster {cluster_id} (aggressiveness: {aggressiveness})")
 
-        # Analyze current state
-        analysis = self.analyze_fragmentation(cluster_id)
+        if snapshot is None:
+            snapshot = self.load_snapshot(cluster_id)
+        node_ids = snapshot.node_ids
 
-        # Identify source and target nodes
-        utilization_threshold = aggressiveness * 100  # Convert to percentage
-        source_nodes = [
-            node for node in analysis['node_details']
-            if node['avg_util'] < utilization_threshold
-        ]
-
-        target_nodes = [
-            node for node in analysis['node_details']
-            if node['avg_util'] >= 50 and node['avg_util'] < 80  # Healthy range
-        ]
+        source_nodes = self._source_nodes(snapshot, aggressiveness)
 
         if not source_nodes:
             logger.info(f"[MOD-PACK-01] No migration opportunities found at aggressiveness {aggressiveness}")
@@ -242,56 +304,75 @@ class BinPackingModule:
                 "dry_run": False
             }
 
-        # Build migration plan in phases
+        fill_limit = self._fill_limit(aggressiveness)
+        packing, verified = self._pack(snapshot, source_nodes, max_nodes, fill_limit, strategy)
+
+        # Group moves by source node and destination
+        destinations_by_source: Dict[int, Dict[int, List[str]]] = {
+            source: {} for source in packing["drained"]
+        }
+        pdbs_by_source: Dict[int, set] = {source: set() for source in packing["drained"]}
+        for pod, target in packing["moves"]:
+            source = int(snapshot.pod_nodes[pod])
+            destinations_by_source[source].setdefault(int(target), []).append(
+                snapshot.pod_names[pod]
+            )
+            if snapshot.pod_pdbs[pod] >= 0:
+                pdbs_by_source[source].add(snapshot.pdb_names[snapshot.pod_pdbs[pod]])
+
+        # Build migration plan in phases (one per freed node)
         phases = []
         total_migrations = 0
 
-        for i, source in enumerate(source_nodes[:3], 1):  # Limit to 3 nodes per run for safety
-            # Estimate pod count (simplified - in production, query from K8s API)
-            estimated_pods = max(1, int(source['avg_util'] / 10))  # ~10% util per pod
+        for i, source in enumerate(packing["drained"], 1):
+            destinations = destinations_by_source[source]
+            pod_count = sum(len(pods) for pods in destinations.values())
+            primary = max(destinations, key=lambda t: len(destinations[t])) if destinations else None
 
-            # Select target node (round-robin)
-            target = target_nodes[i % len(target_nodes)] if target_nodes else None
-
-            if not target:
-                logger.warning(f"[MOD-PACK-01] No target node available for {source['instance_id']}")
-                continue
+            steps = [
+                {
+                    "action": "CORDON_NODE",
+                    "target": node_ids[source],
+                    "reason": "Prevent new pod scheduling during migration"
+                },
+                {
+                    "action": "EVICT_PODS",
+                    "source_node": node_ids[source],
+                    "destination_node": node_ids[primary] if primary is not None else None,
+                    "destinations": [
+                        {"destination_node": node_ids[target], "pods": pods}
+                        for target, pods in destinations.items()
+                    ],
+                    "pod_count": pod_count,
+                    "respect_pdb": True,
+                    "pdbs": sorted(pdbs_by_source[source]),
+                    "max_unavailable": "25%",
+                    "timeout": "10m"
+                }
+            ]
+            for target in destinations:
+                steps.append({
+                    "action": "WAIT_FOR_READY",
+                    "target": node_ids[target],
+                    "condition": "all_pods_running",
+                    "timeout": "5m"
+                })
+            steps.append({
+                "action": "TERMINATE_NODE",
+                "target": node_ids[source],
+                "method": "graceful",
+                "wait_for": "pod_drain_complete"
+            })
 
-            phase = {
+            phases.append({
                 "phase": i,
-                "description": f"Migrate workload from {source['instance_id']} to {target['instance_id']}",
-                "steps": [
-                    {
-                        "action": "CORDON_NODE",
-                        "target": source['instance_id'],
-                        "reason": "Prevent new pod scheduling during migration"
-                    },
-                    {
-                        "action": "EVICT_PODS",
-                        "source_node": source['instance_id'],
-                        "destination_node": target['instance_id'],
-                        "pod_count": estimated_pods,
-                        "respect_pdb": True,
-                        "max_unavailable": "25%",
-                        "timeout": "10m"
-                    },
-                    {
-                        "action": "WAIT_FOR_READY",
-                        "target": target['instance_id'],
-                        "condition": "all_pods_running",
-                        "timeout": "5m"
-                    },
-                    {
-                        "action": "TERMINATE_NODE",
-                        "target": source['instance_id'],
-                        "method": "graceful",
-                        "wait_for": "pod_drain_complete"
-                    }
-                ]
-            }
-
-            phases.append(phase)
-            total_migrations += estimated_pods
+                "description": (
+                    f"Migrate {pod_count} pods from {node_ids[source]} "
+                    f"to {len(destinations)} node(s)"
+                ),
+                "steps": steps
+            })
+            total_migrations += pod_count
 
         # Estimate duration (simplified: 15 min per phase)
         estimated_duration_minutes = len(phases) * 15
@@ -307,7 +388,7 @@ class BinPackingModule:
                 },
                 {
                     "action": "SCALE_UP_ASG",
-                    "count": len(source_nodes),
+                    "count": len(phases),
                     "description": "Restore original node count"
                 }
             ]
@@ -322,8 +403,13 @@ class BinPackingModule:
             "metadata": {
                 "cluster_id": cluster_id,
                 "aggressiveness": aggressiveness,
+                "strategy": strategy,
+                "fill_limit": round(fill_limit, 2),
+                "nodes_freed": len(phases),
+                "verified": verified,
+                "estimated_nodes": int(snapshot.estimated.sum()),
                 "source_node_count": len(source_nodes),
-                "target_node_count": len(target_nodes),
+                "target_node_count": len({int(t) for t in packing["moves"][:, 1]}),
                 "created_at": datetime.utcnow().isoformat()
             }
         }
@@ -331,8 +417,228 @@ class BinPackingModule:
         logger.info(f"[MOD-PACK-01] Generated plan with {len(phases)} phases, {total_migrations} total migrations")
         return plan
 
+    def simulate(
+        self,
+        snapshot: ClusterSnapshot,
+        remove_nodes: Optional[List[str]] = None,
+        instance_type: Optional[str] = None,
+        hourly_price: Optional[float] = None,
+        aggressiveness: float = 0.5,
+        max_nodes: Optional[int] = None,
+        strategy: str = "best_fit"
+    ) -> Dict[str, Any]:
+        """
+        Run one what-if consolidation scenario against a snapshot
+
+        Runs fully in memory; the snapshot is not modified. Scenarios:
+        - remove_nodes: Can exactly these nodes be drained onto the rest?
+        - instance_type: How many nodes of this type would hold all movable
+          pods (DaemonSet overhead of the heaviest node reserved on each)?
+        - neither: How many nodes would a run at this aggressiveness free?
+
+        Args:
+            snapshot: Cluster snapshot from load_snapshot()
+            remove_nodes: Instance IDs (or node names) to drain
+            instance_type: Instance type to move the whole cluster to
+            hourly_price: Hourly price of instance_type (default price if omitted)
+            aggressiveness: 0.0-1.0, sets source threshold and target fill limit
+            max_nodes: Maximum nodes to free (aggressiveness scenario only)
+            strategy: "best_fit" or "first_fit"
+
+        Returns:
+            {
+                "scenario": {"remove_nodes": [...], "instance_type": None, ...},
+                "feasible": True,
+                "current_nodes": 15,
+                "projected_nodes": 12,
+                "nodes_freed": ["i-0x123", ...],
+                "blocked_nodes": [],
+                "current_monthly_cost": 1051.2,
+                "projected_monthly_cost": 840.96,
+                "monthly_savings": 210.24,
+                "fill_limit": 0.82,
+                "verified": True
+            }
+
+        Raises:
+            ValueError: If a node in remove_nodes is not in the snapshot
+        """
+        fill_limit = self._fill_limit(aggressiveness)
+        current_cost = float(snapshot.hourly_price.sum()) * HOURS_PER_MONTH
+
+        result = {
+            "scenario": {
+                "remove_nodes": list(remove_nodes) if remove_nodes else None,
+                "instance_type": instance_type,
+                "aggressiveness": aggressiveness,
+                "max_nodes": max_nodes,
+                "strategy": strategy
+            },
+            "feasible": True,
+            "current_nodes": snapshot.node_count,
+            "nodes_freed": [],
+            "blocked_nodes": [],
+            "current_monthly_cost": round(current_cost, 2),
+            "fill_limit": round(fill_limit, 2),
+            "verified": True
+        }
+
+        if instance_type:
+            spec = self._get_instance_capacity(instance_type)
+            bin_capacity = np.array([spec["cpu"] * 1000, spec["memory"] * GIB, DEFAULT_MAX_PODS])
+            overhead = snapshot.overhead.max(axis=0) if snapshot.node_count else None
+
+            packing = pack_into_bins(
+                snapshot.pod_requests[snapshot.movable],
+                bin_capacity,
+                overhead=overhead,
+                fill_limit=fill_limit,
+                strategy=strategy
+            )
+            projected_nodes = packing["bins"]
+            projected_cost = projected_nodes * (hourly_price or DEFAULT_HOURLY_PRICE) * HOURS_PER_MONTH
+            result["feasible"] = packing["unplaceable"] == 0
+            result["unplaceable_pods"] = packing["unplaceable"]
+
+        else:
+            excluded = snapshot.unschedulable
+            if remove_nodes:
+                indexes = []
+                for node_id in remove_nodes:
+                    try:
+                        indexes.append(snapshot.node_index(node_id))
+                    except ValueError:
+                        raise ValueError(f"Node {node_id} is not part of cluster {snapshot.cluster_id}")
+
+                # Removed nodes may not receive each other's pods
+                excluded = excluded.copy()
+                excluded[indexes] = True
+                blocked = [i for i in indexes if not snapshot.drainable[i]]
+                candidates = [i for i in indexes if snapshot.drainable[i]]
+                max_drain = None
+            else:
+                blocked = []
+                candidates = self._source_nodes(snapshot, aggressiveness)
+                max_drain = max_nodes
+
+            packing, verified = self._pack(
+                snapshot, candidates, max_drain, fill_limit, strategy, excluded=excluded
+            )
+            drained = packing["drained"]
+            if remove_nodes:
+                # Every listed node has to be freed
+                blocked.extend(packing["rejected"])
+
+            projected_nodes = snapshot.node_count - len(drained)
+            projected_cost = current_cost - float(snapshot.hourly_price[drained].sum()) * HOURS_PER_MONTH
+            result["feasible"] = not blocked
+            result["nodes_freed"] = [snapshot.node_ids[i] for i in drained]
+            result["blocked_nodes"] = [snapshot.node_ids[i] for i in blocked]
+            result["verified"] = verified
+
+        result["projected_nodes"] = projected_nodes
+        result["projected_monthly_cost"] = round(projected_cost, 2)
+        result["monthly_savings"] = round(current_cost - projected_cost, 2)
+
+        return result
+
+    def simulate_scenarios(
+        self,
+        snapshot: ClusterSnapshot,
+        scenarios: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several what-if scenarios against one snapshot
+
+        Args:
+            snapshot: Cluster snapshot from load_snapshot()
+            scenarios: simulate() keyword arguments per scenario, e.g.
+                       [{"remove_nodes": ["i-0x1", "i-0x2"]},
+                        {"instance_type": "m5.2xlarge", "hourly_price": 0.384},
+                        {"aggressiveness": 0.2}, {"aggressiveness": 0.8}]
+
+        Returns:
+            simulate() results, in scenario order
+        """
+        results = [self.simulate(snapshot, **scenario) for scenario in scenarios]
+
+        logger.info(
+            f"[MOD-PACK-01] Simulated {len(results)} scenarios for cluster {snapshot.cluster_id} "
+            f"({snapshot.node_count} nodes, {snapshot.pod_count} pods)"
+        )
+        return results
+
     # Private helper methods
 
+    @staticmethod
+    def _fill_limit(aggressiveness: float) -> float:
+        """Share of target CPU/memory that may be filled; higher when more aggressive"""
+        return min(0.95, 0.7 + 0.25 * aggressiveness)
+
+    def _source_nodes(self, snapshot: ClusterSnapshot, aggressiveness: float) -> List[int]:
+        """
+        Drainable nodes below the aggressiveness threshold, cheapest to empty first
+        """
+        utilization_threshold = aggressiveness * 100  # Convert to percentage
+
+        movable = snapshot.movable
+        pod_nodes = snapshot.pod_nodes[movable]
+        movable_load = np.zeros(snapshot.node_count)
+        np.add.at(
+            movable_load,
+            pod_nodes,
+            (snapshot.pod_requests[movable, :2] / snapshot.capacity[pod_nodes, :2]).sum(axis=1)
+        )
+
+        return [
+            int(i) for i in np.argsort(movable_load, kind="stable")
+            if snapshot.utilization[i] < utilization_threshold and snapshot.drainable[i]
+        ]
+
+    def _pack(
+        self,
+        snapshot: ClusterSnapshot,
+        candidates: List[int],
+        max_drain: Optional[int],
+        fill_limit: float,
+        strategy: str,
+        excluded: Optional[np.ndarray] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Run the packing engine on a snapshot and verify the result
+
+        Returns:
+            Tuple of (packing result, verified); an unverified result is
+            replaced by an empty one
+        """
+        packing = pack_nodes(
+            snapshot.capacity,
+            snapshot.used,
+            snapshot.pod_requests,
+            snapshot.pod_nodes,
+            snapshot.movable,
+            candidates=candidates,
+            max_drain=max_drain,
+            fill_limit=fill_limit,
+            strategy=strategy,
+            excluded=snapshot.unschedulable if excluded is None else excluded
+        )
+        verified = verify_packing(
+            snapshot.capacity,
+            snapshot.used,
+            snapshot.pod_requests,
+            snapshot.pod_nodes,
+            snapshot.movable,
+            packing["drained"],
+            packing["moves"],
+            fill_limit=fill_limit
+        )
+        if not verified:
+            logger.error(f"[MOD-PACK-01] Packing result for cluster {snapshot.cluster_id} failed verification")
+            packing = {"drained": [], "moves": packing["moves"][:0], "rejected": list(candidates)}
+
+        return packing, verified
+
     def _get_instance_capacity(self, instance_type: str) -> Dict[str, float]:
         """Get CPU and memory capacity for instance type"""
         # Simplified capacity table - in production, query from instance_family table
@@ -355,9 +661,9 @@ class BinPackingModule:
 # Singleton instance
 _bin_packer_instance = None
 
-def get_bin_packer(db: Session) -> BinPackingModule:
+def get_bin_packer(db: Session, redis_client=None) -> BinPackingModule:
     """Get or create Bin Packer singleton"""
     global _bin_packer_instance
     if _bin_packer_instance is None:
-        _bin_packer_instance = BinPackingModule(db)
+        _bin_packer_instance = BinPackingModule(db, redis_client)
     return _bin_packer_instance
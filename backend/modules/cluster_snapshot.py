@@ -0,0 +1,261 @@
+"""
+Cluster Snapshot (MOD-PACK-01)
+Immutable, array-backed view of a cluster's nodes, pods and PDBs
+
+A snapshot is built once from the instances table and the agent workload
+store, then shared by fragmentation analysis, migration planning and any
+number of what-if simulations without further queries. All arrays are
+read-only; scenarios copy what they change.
+
+Units: CPU in millicores, memory in bytes, pods in slots.
+"""
+
+import time
+from typing import Dict, Any, List, Tuple, Callable
+
+import numpy as np
+
+GIB = 1024 ** 3
+
+# Kubernetes default max pods per node, used when the agent has not reported
+DEFAULT_MAX_PODS = 110
+
+# Hourly price assumed for nodes without a recorded price (m5.xlarge)
+DEFAULT_HOURLY_PRICE = 0.096
+
+# Pods recreated per node by Kubernetes itself (not migrated)
+NODE_BOUND_OWNERS = ("DaemonSet", "Node")
+
+
+def _frozen(values, dtype) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+class ClusterSnapshot:
+    """
+    Read-only node/pod/PDB arrays of one cluster at one point in time
+
+    Nodes: node_ids, instance_types, from_instance, cpu_util, memory_util,
+    hourly_price, capacity (n, 3), used (n, 3), overhead (n, 3, node-bound
+    pods), utilization, drainable, unschedulable, estimated.
+
+    Pods: pod_names, pod_requests (m, 3), pod_nodes, movable, pod_pdbs.
+
+    PDBs: pdb_names, pdb_disruptions_allowed.
+    """
+
+    __slots__ = (
+        "cluster_id", "created_at",
+        "node_ids", "instance_types", "from_instance", "cpu_util", "memory_util",
+        "hourly_price", "capacity", "used", "overhead", "utilization",
+        "drainable", "unschedulable", "estimated",
+        "pod_names", "pod_requests", "pod_nodes", "movable", "pod_pdbs",
+        "pdb_names", "pdb_disruptions_allowed",
+    )
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            object.__setattr__(self, name, fields[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ClusterSnapshot is immutable")
+
+    @property
+    def node_count(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def pod_count(self) -> int:
+        return len(self.pod_names)
+
+    def node_index(self, node_id: str) -> int:
+        """Index of a node by instance ID (or node name)"""
+        return self.node_ids.index(node_id)
+
+
+def build_snapshot(
+    cluster_id: str,
+    instances: List[Any],
+    workload_nodes: Dict[str, Dict[str, Any]],
+    workload_pods: List[Dict[str, Any]],
+    workload_pdbs: List[Dict[str, Any]],
+    instance_capacity: Callable[[str], Dict[str, float]]
+) -> ClusterSnapshot:
+    """
+    Build a snapshot from instances and agent workload data
+
+    Nodes are the cluster's instances plus any agent-reported nodes not
+    (yet) discovered. Instances without agent data get their current
+    utilization as one movable, estimated workload.
+
+    Args:
+        cluster_id: Cluster UUID
+        instances: Instance records (or equivalent objects)
+        workload_nodes: Agent nodes by node name
+        workload_pods: Agent pods
+        workload_pdbs: Agent PodDisruptionBudgets
+        instance_capacity: instance_type -> {"cpu": vCPUs, "memory": GiB}
+
+    Returns:
+        ClusterSnapshot
+    """
+    agent_by_instance = {
+        node["instance_id"]: node
+        for node in workload_nodes.values()
+        if node["instance_id"]
+    }
+
+    node_ids: List[str] = []
+    instance_types: List[str] = []
+    from_instance: List[bool] = []
+    cpu_util: List[float] = []
+    memory_util: List[float] = []
+    hourly_price: List[float] = []
+    capacity_rows: List[Tuple[float, float, float]] = []
+    unschedulable: List[bool] = []
+    estimated: List[bool] = []
+    index_by_node_name: Dict[str, int] = {}
+
+    pod_names: List[str] = []
+    pod_rows: List[Tuple[float, float, float]] = []
+    pod_nodes: List[int] = []
+    movable: List[bool] = []
+    pod_pdbs: List[int] = []
+
+    for instance in instances:
+        index = len(node_ids)
+        node_ids.append(instance.instance_id)
+        instance_types.append(instance.instance_type)
+        from_instance.append(True)
+        cpu_util.append(instance.cpu_util or 0)
+        memory_util.append(instance.memory_util or 0)
+        hourly_price.append(instance.price or DEFAULT_HOURLY_PRICE)
+
+        agent_node = agent_by_instance.get(instance.instance_id)
+        if agent_node:
+            index_by_node_name[agent_node["node_name"]] = index
+            capacity_rows.append((agent_node["cpu"], agent_node["memory"], agent_node["pods"]))
+            unschedulable.append(agent_node["unschedulable"])
+            estimated.append(False)
+            continue
+
+        spec = instance_capacity(instance.instance_type)
+        cpu = spec["cpu"] * 1000
+        memory = spec["memory"] * GIB
+        capacity_rows.append((cpu, memory, DEFAULT_MAX_PODS))
+        unschedulable.append(False)
+        estimated.append(True)
+
+        pod_names.append(f"{instance.instance_id}/estimated-workload")
+        pod_rows.append((
+            cpu * (instance.cpu_util or 0) / 100,
+            memory * (instance.memory_util or 0) / 100,
+            1
+        ))
+        pod_nodes.append(index)
+        movable.append(True)
+        pod_pdbs.append(-1)
+
+    for node_name, agent_node in workload_nodes.items():
+        if node_name in index_by_node_name:
+            continue
+        index_by_node_name[node_name] = len(node_ids)
+        node_ids.append(agent_node["instance_id"] or node_name)
+        instance_types.append(None)
+        from_instance.append(False)
+        cpu_util.append(np.nan)
+        memory_util.append(np.nan)
+        hourly_price.append(DEFAULT_HOURLY_PRICE)
+        capacity_rows.append((agent_node["cpu"], agent_node["memory"], agent_node["pods"]))
+        unschedulable.append(agent_node["unschedulable"])
+        estimated.append(False)
+
+    # PDBs by namespace, matched on their label selector
+    pdb_names = [pdb["name"] for pdb in workload_pdbs]
+    pdbs_by_namespace: Dict[str, List[Tuple[int, Dict[str, str]]]] = {}
+    for index, pdb in enumerate(workload_pdbs):
+        if pdb["match_labels"]:
+            pdbs_by_namespace.setdefault(pdb["namespace"], []).append(
+                (index, pdb["match_labels"])
+            )
+
+    blocked = set()
+    for pod in workload_pods:
+        index = index_by_node_name.get(pod["node_name"])
+        if index is None:
+            continue
+
+        owner_kind = pod["owner_kind"]
+        labels = pod.get("labels") or {}
+        namespace = pod["name"].split("/", 1)[0]
+
+        pdb_index = -1
+        for candidate, match_labels in pdbs_by_namespace.get(namespace, ()):
+            if all(labels.get(k) == v for k, v in match_labels.items()):
+                pdb_index = candidate
+                break
+
+        pod_names.append(pod["name"])
+        pod_rows.append((pod["cpu"], pod["memory"], 1))
+        pod_nodes.append(index)
+        is_movable = owner_kind is not None and owner_kind not in NODE_BOUND_OWNERS
+        movable.append(is_movable)
+        pod_pdbs.append(pdb_index)
+
+        # Bare pods would not be recreated, and a PDB allowing no
+        # disruptions blocks eviction: either way the node cannot drain
+        if owner_kind is None:
+            blocked.add(index)
+        elif is_movable and pdb_index >= 0 and workload_pdbs[pdb_index]["disruptions_allowed"] <= 0:
+            blocked.add(index)
+
+    node_count = len(node_ids)
+    capacity = np.array(capacity_rows, dtype=float).reshape(node_count, 3)
+    pod_requests = np.array(pod_rows, dtype=float).reshape(len(pod_rows), 3)
+    pod_nodes_array = np.array(pod_nodes, dtype=np.int64)
+    movable_array = np.array(movable, dtype=bool)
+
+    used = np.zeros((node_count, 3))
+    np.add.at(used, pod_nodes_array, pod_requests)
+
+    overhead = np.zeros((node_count, 3))
+    np.add.at(overhead, pod_nodes_array[~movable_array], pod_requests[~movable_array])
+
+    safe_capacity = np.where(capacity[:, :2] > 0, capacity[:, :2], 1.0)
+    utilization = (used[:, :2] / safe_capacity).mean(axis=1) * 100
+
+    drainable = np.ones(node_count, dtype=bool)
+    drainable[list(blocked)] = False
+
+    for array in (capacity, pod_requests, pod_nodes_array, movable_array, used,
+                  overhead, utilization, drainable):
+        array.setflags(write=False)
+
+    return ClusterSnapshot(
+        cluster_id=cluster_id,
+        created_at=time.time(),
+        node_ids=tuple(node_ids),
+        instance_types=tuple(instance_types),
+        from_instance=_frozen(from_instance, bool),
+        cpu_util=_frozen(cpu_util, float),
+        memory_util=_frozen(memory_util, float),
+        hourly_price=_frozen(hourly_price, float),
+        capacity=capacity,
+        used=used,
+        overhead=overhead,
+        utilization=utilization,
+        drainable=drainable,
+        unschedulable=_frozen(unschedulable, bool),
+        estimated=_frozen(estimated, bool),
+        pod_names=tuple(pod_names),
+        pod_requests=pod_requests,
+        pod_nodes=pod_nodes_array,
+        movable=movable_array,
+        pod_pdbs=_frozen(pod_pdbs, np.int64),
+        pdb_names=tuple(pdb_names),
+        pdb_disruptions_allowed=_frozen(
+            [pdb["disruptions_allowed"] for pdb in workload_pdbs], np.int64
+        )
+    )
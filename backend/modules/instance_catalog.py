@@ -0,0 +1,229 @@
+"""
+Instance Catalog (MOD-SIZE-01)
+EC2 instance type specs and prices as arrays for fleet-wide right-sizing
+
+The catalog holds vCPUs, memory, architecture and On-Demand price of every
+supported instance type in parallel NumPy arrays, so fit and price checks
+for thousands of instances against every type run as a handful of array
+operations.
+
+Base prices are us-east-1 Linux On-Demand; prices collected by the pricing
+collector (SVC-PRICE-01) under ondemand_price:{region}:{instance_type}
+override them for the region being analyzed.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ONDEMAND_PRICE_KEY = "ondemand_price:{}:{}"
+
+# family: (architecture, GiB per vCPU, hourly price of the .large size)
+_FAMILIES = {
+    "m5": ("x86_64", 4, 0.096),
+    "m5a": ("x86_64", 4, 0.086),
+    "m6i": ("x86_64", 4, 0.096),
+    "m6a": ("x86_64", 4, 0.0864),
+    "m6g": ("arm64", 4, 0.077),
+    "m7g": ("arm64", 4, 0.0816),
+    "c5": ("x86_64", 2, 0.085),
+    "c5a": ("x86_64", 2, 0.077),
+    "c6i": ("x86_64", 2, 0.085),
+    "c6a": ("x86_64", 2, 0.0765),
+    "c6g": ("arm64", 2, 0.068),
+    "c7g": ("arm64", 2, 0.0725),
+    "r5": ("x86_64", 8, 0.126),
+    "r5a": ("x86_64", 8, 0.113),
+    "r6i": ("x86_64", 8, 0.126),
+    "r6a": ("x86_64", 8, 0.1134),
+    "r6g": ("arm64", 8, 0.1008),
+    "r7g": ("arm64", 8, 0.1071),
+}
+
+# size: multiple of the .large size (2 vCPUs)
+_SIZES = {"large": 1, "xlarge": 2, "2xlarge": 4, "4xlarge": 8, "8xlarge": 16}
+
+# Burstable types: (type, architecture, vCPUs, GiB, hourly price)
+_BURSTABLE = [
+    ("t3.medium", "x86_64", 2, 4, 0.0416),
+    ("t3.large", "x86_64", 2, 8, 0.0832),
+    ("t3.xlarge", "x86_64", 4, 16, 0.1664),
+    ("t3.2xlarge", "x86_64", 8, 32, 0.3328),
+    ("t3a.medium", "x86_64", 2, 4, 0.0376),
+    ("t3a.large", "x86_64", 2, 8, 0.0752),
+    ("t3a.xlarge", "x86_64", 4, 16, 0.1504),
+    ("t3a.2xlarge", "x86_64", 8, 32, 0.3008),
+    ("t4g.medium", "arm64", 2, 4, 0.0336),
+    ("t4g.large", "arm64", 2, 8, 0.0672),
+    ("t4g.xlarge", "arm64", 4, 16, 0.1344),
+    ("t4g.2xlarge", "arm64", 8, 32, 0.2688),
+]
+
+
+def _catalog_rows() -> List[tuple]:
+    rows = []
+    for family, (architecture, gib_per_vcpu, large_price) in _FAMILIES.items():
+        for size, multiple in _SIZES.items():
+            vcpu = 2 * multiple
+            rows.append((
+                f"{family}.{size}", family, architecture, vcpu,
+                vcpu * gib_per_vcpu, round(large_price * multiple, 4), False
+            ))
+    for name, architecture, vcpu, memory, price in _BURSTABLE:
+        rows.append((name, name.split(".")[0], architecture, vcpu, memory, price, True))
+    return rows
+
+
+class InstanceCatalog:
+    """
+    Parallel arrays of instance type specs and prices
+
+    Attributes:
+        names, families, architectures: (n,) string arrays
+        vcpu, memory: (n,) capacity in vCPUs and GiB
+        price: (n,) hourly On-Demand price
+        burstable: (n,) True for T-family types
+    """
+
+    def __init__(self, rows: Optional[List[tuple]] = None):
+        rows = rows if rows is not None else _catalog_rows()
+        names, families, architectures, vcpu, memory, price, burstable = zip(*rows)
+
+        self.names = np.array(names)
+        self.families = np.array(families)
+        self.architectures = np.array(architectures)
+        self.vcpu = np.array(vcpu, dtype=float)
+        self.memory = np.array(memory, dtype=float)
+        self.price = np.array(price, dtype=float)
+        self.burstable = np.array(burstable, dtype=bool)
+        self._index = {name: i for i, name in enumerate(names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, instance_type: str) -> bool:
+        return instance_type in self._index
+
+    def index(self, instance_type: str) -> Optional[int]:
+        """Position of an instance type (None if unknown)"""
+        return self._index.get(instance_type)
+
+    def capacity(self, instance_type: str) -> Optional[Dict[str, float]]:
+        """vCPUs and memory (GiB) of an instance type (None if unknown)"""
+        i = self._index.get(instance_type)
+        if i is None:
+            return None
+        return {"cpu": float(self.vcpu[i]), "memory": float(self.memory[i])}
+
+    def regional_prices(self, redis_client, region: Optional[str]) -> np.ndarray:
+        """
+        Hourly prices for a region, using collected prices where available
+
+        Args:
+            redis_client: Redis client (None = base prices)
+            region: AWS region
+
+        Returns:
+            (n,) price array
+        """
+        if redis_client is None or not region:
+            return self.price
+
+        keys = [ONDEMAND_PRICE_KEY.format(region, name) for name in self.names]
+        collected = redis_client.mget(keys)
+
+        prices = self.price.copy()
+        for i, value in enumerate(collected):
+            if value:
+                prices[i] = float(value)
+        return prices
+
+    def allowed_mask(
+        self,
+        families: Optional[List[str]] = None,
+        architecture: Optional[str] = None,
+        allow_burstable: bool = False
+    ) -> np.ndarray:
+        """
+        Types permitted by a node template
+
+        Args:
+            families: Allowed families (None = all)
+            architecture: Required architecture (None = any)
+            allow_burstable: Include T-family types not listed in families
+
+        Returns:
+            (n,) boolean mask
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if families:
+            mask &= np.isin(self.families, list(families))
+        elif not allow_burstable:
+            mask &= ~self.burstable
+        if architecture:
+            mask &= self.architectures == architecture
+        return mask
+
+
+def cheapest_fits(
+    catalog: InstanceCatalog,
+    cpu_demand: np.ndarray,
+    memory_demand: np.ndarray,
+    allowed: np.ndarray,
+    prices: Optional[np.ndarray] = None,
+    headroom: float = 0.2,
+    top_n: int = 3
+) -> np.ndarray:
+    """
+    Cheapest instance types that hold each demand with headroom
+
+    Evaluates every (instance, type) pair at once: a type fits when the
+    demand stays within (1 - headroom) of its vCPUs and memory.
+
+    Args:
+        catalog: Instance catalog
+        cpu_demand: (k,) peak vCPUs per instance
+        memory_demand: (k,) peak GiB per instance
+        allowed: (k, n) or (n,) mask of types each instance may use
+        prices: (n,) hourly prices (default catalog prices)
+        headroom: Share of capacity kept free
+        top_n: Number of types to return per instance
+
+    Returns:
+        (k, top_n) catalog indexes, cheapest first; -1 where fewer types fit
+    """
+    prices = catalog.price if prices is None else prices
+    usable = 1.0 - headroom
+
+    fits = (
+        (catalog.vcpu * usable >= cpu_demand[:, None])
+        & (catalog.memory * usable >= memory_demand[:, None])
+        & allowed
+    )
+    cost = np.where(fits, prices, np.inf)
+
+    top_n = min(top_n, len(catalog))
+    if top_n < len(catalog):
+        candidates = np.argpartition(cost, top_n - 1, axis=1)[:, :top_n]
+    else:
+        candidates = np.broadcast_to(np.arange(len(catalog)), cost.shape)
+    candidate_cost = np.take_along_axis(cost, candidates, axis=1)
+    order = np.argsort(candidate_cost, axis=1, kind="stable")
+
+    best = np.take_along_axis(candidates, order, axis=1)
+    best_cost = np.take_along_axis(candidate_cost, order, axis=1)
+    return np.where(np.isfinite(best_cost), best, -1)
+
+
+_catalog: Optional[InstanceCatalog] = None
+
+
+def get_instance_catalog() -> InstanceCatalog:
+    """Get shared instance catalog"""
+    global _catalog
+    if _catalog is None:
+        _catalog = InstanceCatalog()
+    return _catalog
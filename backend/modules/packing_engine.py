@@ -0,0 +1,287 @@
+"""
+Packing Engine (MOD-PACK-01)
+Multi-dimensional bin packing used to plan node consolidation
+
+Works on plain NumPy arrays so it can be reused by the migration planner
+and by what-if simulations without touching the database. Every node and
+pod is a vector over three dimensions:
+
+- CPU (millicores)
+- Memory (bytes)
+- Pod slots (1 per pod, node capacity = allocatable pods)
+
+Draining is planned node by node: all movable pods of a candidate node are
+placed on the remaining nodes in first-fit-decreasing order (largest
+dominant resource share first), choosing targets by best fit (least
+leftover headroom) or first fit (fullest node first). A candidate is only
+accepted if every one of its pods fits, so each accepted node is provably
+freed; verify_packing() re-checks a result from scratch.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CPU, MEMORY, PODS = 0, 1, 2
+
+STRATEGIES = ("best_fit", "first_fit")
+
+# Default share of a target node's CPU/memory that may be filled
+DEFAULT_FILL_LIMIT = 0.85
+
+# Float tolerance when comparing summed requests against limits
+_EPSILON = 1e-6
+
+
+def packing_limits(capacity: np.ndarray, fill_limit: float) -> np.ndarray:
+    """
+    Per-node limits: CPU and memory scaled by fill_limit, pod slots as-is
+
+    Args:
+        capacity: (n, 3) node allocatable capacity
+        fill_limit: Share of CPU/memory that may be used on target nodes
+
+    Returns:
+        (n, 3) array of limits
+    """
+    return capacity * np.array([fill_limit, fill_limit, 1.0])
+
+
+def pack_nodes(
+    capacity: np.ndarray,
+    used: np.ndarray,
+    pod_requests: np.ndarray,
+    pod_nodes: np.ndarray,
+    movable: np.ndarray,
+    candidates: List[int],
+    max_drain: Optional[int] = None,
+    fill_limit: float = DEFAULT_FILL_LIMIT,
+    strategy: str = "best_fit",
+    excluded: Optional[np.ndarray] = None
+) -> Dict[str, Any]:
+    """
+    Choose nodes to drain and a target for every pod that has to move
+
+    Args:
+        capacity: (n, 3) node allocatable capacity
+        used: (n, 3) requests currently placed on each node
+        pod_requests: (m, 3) pod requests (pod slot column = 1)
+        pod_nodes: (m,) node index of each pod
+        movable: (m,) False for pods that stay with their node (DaemonSets)
+        candidates: Node indexes to try draining, in order of preference
+        max_drain: Stop after this many nodes are freed (None = no limit)
+        fill_limit: Share of target CPU/memory that may be filled
+        strategy: "best_fit" or "first_fit"
+        excluded: (n,) True for nodes that may not receive pods
+
+    Returns:
+        {
+            "drained": [node indexes, in drain order],
+            "moves": (k, 2) array of (pod index, target node index),
+            "rejected": [candidate indexes whose pods did not fit]
+        }
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown packing strategy: {strategy}")
+
+    node_count = capacity.shape[0]
+    limits = packing_limits(capacity, fill_limit)
+    headroom = limits - used
+
+    receivable = np.ones(node_count, dtype=bool)
+    if excluded is not None:
+        receivable &= ~excluded
+
+    # Nodes that received pods are not drained afterwards (no double moves)
+    pinned = np.zeros(node_count, dtype=bool)
+
+    # Normalizers for best-fit scoring and pod ordering
+    scale = np.where(limits[:, :2] > 0, limits[:, :2], 1.0)
+    mean_capacity = capacity[:, :2].mean(axis=0) if node_count else np.ones(2)
+    mean_capacity = np.where(mean_capacity > 0, mean_capacity, 1.0)
+
+    # Movable pods grouped by node, each group largest-first (the "decreasing"
+    # in first-fit-decreasing)
+    share = (pod_requests[:, :2] / mean_capacity).max(axis=1) if len(pod_requests) else np.zeros(0)
+    movable_idx = np.flatnonzero(movable)
+    order = movable_idx[np.lexsort((-share[movable_idx], pod_nodes[movable_idx]))]
+    sorted_nodes = pod_nodes[order]
+    starts = np.searchsorted(sorted_nodes, np.arange(node_count), side="left")
+    ends = np.searchsorted(sorted_nodes, np.arange(node_count), side="right")
+
+    # First fit tries fuller nodes first, leaving emptier ones to be drained
+    fullness = (used[:, :2] / scale).sum(axis=1)
+    first_fit_order = np.argsort(-fullness, kind="stable")
+
+    drained: List[int] = []
+    rejected: List[int] = []
+    moves: List[tuple] = []
+
+    for source in candidates:
+        if max_drain is not None and len(drained) >= max_drain:
+            break
+        if pinned[source]:
+            continue
+
+        pods = order[starts[source]:ends[source]]
+        receivable[source] = False
+
+        placed = []
+        for pod in pods:
+            request = pod_requests[pod]
+            fits = receivable & np.all(headroom >= request - _EPSILON, axis=1)
+
+            if strategy == "best_fit":
+                if not fits.any():
+                    break
+                slack = ((headroom[:, :2] - request[:2]) / scale).sum(axis=1)
+                target = int(np.argmin(np.where(fits, slack, np.inf)))
+            else:
+                ordered_fits = fits[first_fit_order]
+                position = int(np.argmax(ordered_fits))
+                if not ordered_fits[position]:
+                    break
+                target = int(first_fit_order[position])
+
+            headroom[target] -= request
+            placed.append((int(pod), target))
+
+        if len(placed) < len(pods):
+            # Roll back the partial placement; this node stays
+            for pod, target in placed:
+                headroom[target] += pod_requests[pod]
+            receivable[source] = excluded is None or not excluded[source]
+            rejected.append(int(source))
+            continue
+
+        drained.append(int(source))
+        moves.extend(placed)
+        for _, target in placed:
+            pinned[target] = True
+
+    return {
+        "drained": drained,
+        "moves": np.array(moves, dtype=np.int64).reshape(-1, 2),
+        "rejected": rejected
+    }
+
+
+def verify_packing(
+    capacity: np.ndarray,
+    used: np.ndarray,
+    pod_requests: np.ndarray,
+    pod_nodes: np.ndarray,
+    movable: np.ndarray,
+    drained: List[int],
+    moves: np.ndarray,
+    fill_limit: float = DEFAULT_FILL_LIMIT
+) -> bool:
+    """
+    Independently check that a packing result frees its drained nodes
+
+    Checks that every movable pod on a drained node is moved exactly once,
+    that no pod lands on a drained node, and that every node receiving pods
+    stays within its limits in all dimensions.
+
+    Returns:
+        True if the result is valid
+    """
+    drained_mask = np.zeros(capacity.shape[0], dtype=bool)
+    drained_mask[list(drained)] = True
+
+    moved_pods = moves[:, 0]
+    targets = moves[:, 1]
+
+    if len(np.unique(moved_pods)) != len(moved_pods):
+        return False
+    if drained_mask[targets].any():
+        return False
+    if not drained_mask[pod_nodes[moved_pods]].all():
+        return False
+
+    must_move = np.flatnonzero(movable & drained_mask[pod_nodes])
+    if not np.array_equal(np.sort(must_move), np.sort(moved_pods)):
+        return False
+
+    new_used = used.copy()
+    np.subtract.at(new_used, pod_nodes[moved_pods], pod_requests[moved_pods])
+    np.add.at(new_used, targets, pod_requests[moved_pods])
+
+    receiving = np.unique(targets)
+    limits = packing_limits(capacity, fill_limit)
+    return bool(np.all(new_used[receiving] <= limits[receiving] + _EPSILON))
+
+
+def pack_into_bins(
+    pod_requests: np.ndarray,
+    bin_capacity: np.ndarray,
+    overhead: Optional[np.ndarray] = None,
+    fill_limit: float = DEFAULT_FILL_LIMIT,
+    strategy: str = "best_fit"
+) -> Dict[str, Any]:
+    """
+    Count identical nodes needed to hold a set of pods
+
+    Classic first-fit-decreasing bin packing: pods are placed largest-first
+    into open nodes (best-fit or first-fit), opening a new node only when
+    none fits.
+
+    Args:
+        pod_requests: (m, 3) requests of the pods to place
+        bin_capacity: (3,) allocatable capacity of the node type
+        overhead: (3,) requests present on every node (DaemonSets)
+        fill_limit: Share of CPU/memory that may be filled
+        strategy: "best_fit" or "first_fit"
+
+    Returns:
+        {
+            "bins": 12,
+            "assignment": (m,) node number per pod (-1 = does not fit any node),
+            "unplaceable": 0
+        }
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown packing strategy: {strategy}")
+
+    limit = packing_limits(bin_capacity.reshape(1, 3), fill_limit)[0]
+    if overhead is not None:
+        limit = limit - overhead
+
+    pod_count = len(pod_requests)
+    assignment = np.full(pod_count, -1, dtype=np.int64)
+    if pod_count == 0:
+        return {"bins": 0, "assignment": assignment, "unplaceable": 0}
+
+    scale = np.where(limit[:2] > 0, limit[:2], 1.0)
+    share = (pod_requests[:, :2] / scale).max(axis=1)
+    order = np.argsort(-share, kind="stable")
+
+    headroom = np.empty((pod_count, 3))
+    open_bins = 0
+    unplaceable = 0
+
+    for pod in order:
+        request = pod_requests[pod]
+        if np.any(request > limit + _EPSILON):
+            unplaceable += 1
+            continue
+
+        fits = np.all(headroom[:open_bins] >= request - _EPSILON, axis=1)
+        if fits.any():
+            if strategy == "best_fit":
+                slack = ((headroom[:open_bins, :2] - request[:2]) / scale).sum(axis=1)
+                target = int(np.argmin(np.where(fits, slack, np.inf)))
+            else:
+                target = int(np.argmax(fits))
+        else:
+            target = open_bins
+            headroom[target] = limit
+            open_bins += 1
+
+        headroom[target] -= request
+        assignment[pod] = target
+
+    return {"bins": open_bins, "assignment": assignment, "unplaceable": unplaceable}
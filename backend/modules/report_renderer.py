@@ -0,0 +1,93 @@
+"""
+Report Renderer (WORK-RPT-01)
+HTML savings reports from cached Jinja templates
+
+Templates live in backend/templates/reports:
+
+- report.html   the email document
+- _macros.html  partials (metric card, category item, cluster row)
+- _styles.css   inlined stylesheet
+
+The Jinja environment is built once per process. Parsed templates stay in
+its template cache (auto_reload is off), and compiled bytecode is kept in a
+FileSystemBytecodeCache, so new worker processes load the compiled code
+instead of parsing the sources again. Rendering a report is then only the
+execution of compiled Python code.
+"""
+
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates", "reports"
+)
+
+# Compiled template bytecode, shared by the worker processes of a host
+BYTECODE_CACHE_DIR = os.environ.get(
+    "REPORT_TEMPLATE_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "spot-optimizer-report-templates")
+)
+
+REPORT_TEMPLATE = "report.html"
+
+# (savings_by_category key, label) in display order
+CATEGORIES = (
+    ("spot_optimization", "🎯 Spot Instance Optimization"),
+    ("rightsizing", "📏 Right-Sizing"),
+    ("consolidation", "📦 Consolidation"),
+    ("hibernation", "💤 Hibernation"),
+)
+
+
+def _money(value: Any) -> str:
+    return f"{float(value or 0):,.2f}"
+
+
+_environment: Optional[Environment] = None
+
+
+def get_report_environment() -> Environment:
+    """Get the shared report template environment"""
+    global _environment
+    if _environment is None:
+        os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+        environment = Environment(
+            loader=FileSystemLoader(TEMPLATE_DIR),
+            autoescape=select_autoescape(["html"]),
+            bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR),
+            auto_reload=False,
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        environment.filters["money"] = _money
+        _environment = environment
+    return _environment
+
+
+def warm_report_templates() -> None:
+    """Compile the report templates ahead of the first render"""
+    environment = get_report_environment()
+    for name in environment.list_templates():
+        environment.get_template(name)
+    logger.info(f"[WORK-RPT-01] Report templates compiled")
+
+
+def render_report_html(report_data: Dict[str, Any], report_type: str = "weekly") -> str:
+    """
+    Render a savings report email
+
+    Args:
+        report_data: Result of aggregate_savings_data()
+        report_type: "weekly" or "monthly"
+
+    Returns:
+        HTML string
+    """
+    template = get_report_environment().get_template(REPORT_TEMPLATE)
+    return template.render(report=report_data, report_type=report_type, categories=CATEGORIES)
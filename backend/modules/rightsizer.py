@@ -3,14 +3,30 @@ Right-Sizing Module (MOD-SIZE-01)
 Analyzes resource usage vs requests and generates resize recommendations
 """
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
+import numpy as np
+
 from backend.models.instance import Instance
+from backend.models.cluster import Cluster
+from backend.models.cluster_policy import ClusterPolicy
+from backend.models.node_template import NodeTemplate
+from backend.core.redis_client import get_redis_client
+from backend.modules.instance_catalog import get_instance_catalog, cheapest_fits
+from backend.modules.usage_sketch import load_usage_quantiles
 
 logger = logging.getLogger(__name__)
 
+HOURS_PER_MONTH = 730
+
+# Share of the new type's CPU/memory kept free above peak usage
+DEFAULT_HEADROOM = 0.2
+
+# Hourly price assumed for instances of unknown type without a recorded price
+DEFAULT_HOURLY_PRICE = 0.096
+
 
 class RightSizingModule:
     """
@@ -18,20 +34,34 @@ class RightSizingModule:
 
     Responsibilities:
     - Analyze CPU/memory usage vs allocated resources
-    - Recommend smaller instance types when overprovisioned
+    - Recommend the cheapest instance types that fit peak usage
     - Calculate potential savings from right-sizing
+
+    Usage comes from the per-instance quantile sketches fed by the agent
+    (median as typical usage, p95 as peak). Instances without agent
+    samples fall back to their current utilization, with peak estimated
+    as 1.5x.
+
+    Candidates are every catalog type allowed by the cluster's node
+    template (families and architecture); without a template, types of
+    the instance's own architecture. Prices are regional On-Demand prices,
+    so deltas compare like with like regardless of lifecycle.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, redis_client=None, headroom: float = DEFAULT_HEADROOM):
         self.db = db
+        self.redis_client = redis_client or get_redis_client()
+        self.catalog = get_instance_catalog()
+        self.headroom = headroom
         self.analysis_days = 14
 
-    def analyze_resource_usage(self, cluster_id: str) -> Dict[str, Any]:
+    def analyze_resource_usage(self, cluster_id: str, days: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze 14-day resource usage patterns
 
         Args:
             cluster_id: UUID of cluster to analyze
+            days: Analysis window in days (default 14)
 
         Returns:
             {
@@ -45,75 +75,79 @@ class RightSizingModule:
                         "average_usage": {"cpu": 1.2, "memory": 4.5},
                         "peak_usage": {"cpu": 2.0, "memory": 8.0},
                         "utilization_percent": {"cpu": 30, "memory": 28},
-                        "recommendation": "Downsize to m5.large",
-                        "potential_savings_monthly": 46.08
+                        "percentiles": {"cpu": {"p50": 30, "p95": 50, "p99": 62, "samples": 20160}, ...},
+                        "usage_source": "agent",  # or "snapshot"
+                        "recommendation": "Downsize to m6g.large",
+                        "recommended_type": "m6g.large",
+                        "current_price": 0.192,
+                        "new_price": 0.077,
+                        "alternatives": [
+                            {"instance_type": "m6g.large", "hourly_price": 0.077, "price_delta": -0.115},
+                            ...
+                        ],
+                        "potential_savings_monthly": 83.95
                     }
                 ],
                 "total_potential_savings": 150.50
             }
         """
-        logger.info(f"[MOD-SIZE-01] Analyzing resource usage for cluster {cluster_id}")
+        days = days or self.analysis_days
+        logger.info(f"[MOD-SIZE-01] Analyzing resource usage for cluster {cluster_id} ({days} days)")
 
         instances = self.db.query(Instance).filter(
             Instance.cluster_id == cluster_id
         ).all()
 
+        # One pipelined read for all instances
+        usage = load_usage_quantiles(
+            self.redis_client,
+            [instance.instance_id for instance in instances],
+            days=days
+        )
+
         overprovisioned = []
         total_savings = 0.0
 
-        for instance in instances:
-            cpu_util = instance.cpu_util or 0
-            memory_util = instance.memory_util or 0
-
-            # If both CPU and memory are <50% utilized, it's overprovisioned
-            if cpu_util < 50 and memory_util < 50:
-                capacity = self._get_instance_capacity(instance.instance_type)
-
-                # Calculate average usage (simplified - in production, query Prometheus)
-                avg_cpu = capacity['cpu'] * (cpu_util / 100)
-                avg_memory = capacity['memory'] * (memory_util / 100)
-
-                # Simulate peak as 1.5x average
-                peak_cpu = avg_cpu * 1.5
-                peak_memory = avg_memory * 1.5
-
-                # Get smaller instance type recommendation
-                recommendation = self._get_downsize_recommendation(
-                    instance.instance_type,
-                    peak_cpu,
-                    peak_memory
-                )
-
-                if recommendation:
-                    current_price = instance.price or 0.096
-                    new_price = current_price * 0.5  # ~50% cheaper
-                    monthly_savings = (current_price - new_price) * 730
-
-                    overprovisioned.append({
-                        "instance_id": instance.instance_id,
-                        "instance_type": instance.instance_type,
-                        "capacity": capacity,
-                        "average_usage": {
-                            "cpu": round(avg_cpu, 1),
-                            "memory": round(avg_memory, 1)
-                        },
-                        "peak_usage": {
-                            "cpu": round(peak_cpu, 1),
-                            "memory": round(peak_memory, 1)
-                        },
-                        "utilization_percent": {
-                            "cpu": round(cpu_util, 1),
-                            "memory": round(memory_util, 1)
-                        },
-                        "recommendation": recommendation,
-                        "potential_savings_monthly": round(monthly_savings, 2)
-                    })
-
-                    total_savings += monthly_savings
+        for sizing in self._size_instances(cluster_id, instances, usage):
+            if not sizing["alternatives"]:
+                continue
+
+            monthly_savings = (sizing["current_price"] - sizing["new_price"]) * HOURS_PER_MONTH
+            instance = sizing.pop("instance")
+            capacity = sizing.pop("capacity")
+            cpu_util, memory_util, peak_cpu, peak_memory = sizing.pop("usage")
+
+            overprovisioned.append({
+                "instance_id": instance.instance_id,
+                "instance_type": instance.instance_type,
+                "capacity": capacity,
+                "average_usage": {
+                    "cpu": round(capacity['cpu'] * cpu_util / 100, 1),
+                    "memory": round(capacity['memory'] * memory_util / 100, 1)
+                },
+                "peak_usage": {
+                    "cpu": round(peak_cpu, 1),
+                    "memory": round(peak_memory, 1)
+                },
+                "utilization_percent": {
+                    "cpu": round(cpu_util, 1),
+                    "memory": round(memory_util, 1)
+                },
+                "percentiles": sizing["percentiles"],
+                "usage_source": "agent" if sizing["percentiles"] else "snapshot",
+                "recommendation": f"Downsize to {sizing['recommended_type']}",
+                "recommended_type": sizing["recommended_type"],
+                "current_price": sizing["current_price"],
+                "new_price": sizing["new_price"],
+                "alternatives": sizing["alternatives"],
+                "potential_savings_monthly": round(monthly_savings, 2)
+            })
+
+            total_savings += monthly_savings
 
         result = {
             "cluster_id": cluster_id,
-            "analysis_period_days": self.analysis_days,
+            "analysis_period_days": days,
             "overprovisioned_instances": overprovisioned,
             "total_potential_savings": round(total_savings, 2)
         }
@@ -128,69 +162,171 @@ class RightSizingModule:
         if not instance:
             return {"error": "Instance not found"}
 
-        cpu_util = instance.cpu_util or 0
-        memory_util = instance.memory_util or 0
-        capacity = self._get_instance_capacity(instance.instance_type)
+        usage = load_usage_quantiles(self.redis_client, [instance_id], days=self.analysis_days)
+        sizing = self._size_instances(instance.cluster_id, [instance], usage)[0]
 
-        peak_cpu = capacity['cpu'] * (cpu_util / 100) * 1.5
-        peak_memory = capacity['memory'] * (memory_util / 100) * 1.5
-
-        recommendation = self._get_downsize_recommendation(instance.instance_type, peak_cpu, peak_memory)
-
-        if recommendation:
-            current_price = instance.price or 0.096
-            new_price = current_price * 0.5
-            monthly_savings = (current_price - new_price) * 730
+        if sizing["alternatives"]:
+            hourly_savings = sizing["current_price"] - sizing["new_price"]
+            cpu_util = sizing["usage"][0]
 
             return {
                 "instance_id": instance_id,
                 "current_type": instance.instance_type,
-                "recommended_type": recommendation,
+                "recommended_type": sizing["recommended_type"],
+                "alternatives": sizing["alternatives"],
                 "confidence": "HIGH" if cpu_util < 30 else "MEDIUM",
                 "estimated_savings": {
-                    "hourly": round(current_price - new_price, 4),
-                    "monthly": round(monthly_savings, 2)
+                    "hourly": round(hourly_savings, 4),
+                    "monthly": round(hourly_savings * HOURS_PER_MONTH, 2)
                 }
             }
 
         return {"instance_id": instance_id, "recommendation": "No resize needed"}
 
-    def _get_instance_capacity(self, instance_type: str) -> Dict[str, float]:
-        """Get instance capacity"""
-        capacities = {
-            "t3.medium": {"cpu": 2, "memory": 4},
-            "c5.large": {"cpu": 2, "memory": 4},
-            "c5.xlarge": {"cpu": 4, "memory": 8},
-            "m5.large": {"cpu": 2, "memory": 8},
-            "m5.xlarge": {"cpu": 4, "memory": 16},
-            "m5.2xlarge": {"cpu": 8, "memory": 32},
-            "r5.large": {"cpu": 2, "memory": 16},
-            "r5.xlarge": {"cpu": 4, "memory": 32},
-        }
-        return capacities.get(instance_type, {"cpu": 4, "memory": 16})
-
-    def _get_downsize_recommendation(self, current_type: str, peak_cpu: float, peak_memory: float) -> str:
-        """Recommend smaller instance type based on peak usage"""
-        # Simple downsize mapping
-        downsize_map = {
-            "m5.2xlarge": "m5.xlarge",
-            "m5.xlarge": "m5.large",
-            "c5.2xlarge": "c5.xlarge",
-            "c5.xlarge": "c5.large",
-            "r5.2xlarge": "r5.xlarge",
-            "r5.xlarge": "r5.large",
-        }
+    def _size_instances(
+        self,
+        cluster_id: str,
+        instances: List[Instance],
+        usage: Dict[str, Dict[str, Dict[str, Any]]],
+        top_n: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the cheapest allowed types fitting each instance's peak usage
+
+        The fit and price check of all instances against the whole catalog
+        is one vectorized pass.
+
+        Args:
+            cluster_id: Cluster the instances belong to
+            instances: Instances to size
+            usage: Quantiles from load_usage_quantiles()
+            top_n: Number of alternatives per instance
+
+        Returns:
+            Per instance (same order): instance, capacity, usage (cpu %,
+            memory %, peak vCPUs, peak GiB), percentiles, current_price and
+            the cheaper alternatives (empty if nothing cheaper fits), plus
+            recommended_type/new_price when there is one
+        """
+        catalog = self.catalog
+
+        cluster = self.db.query(Cluster).filter(Cluster.id == cluster_id).first()
+        prices = catalog.regional_prices(self.redis_client, cluster.region if cluster else None)
+
+        template = self._get_node_template(cluster_id)
+        template_mask = None
+        if template:
+            template_mask = catalog.allowed_mask(template.families, template.architecture)
+        masks_by_arch: Dict[tuple, np.ndarray] = {}
+
+        count = len(instances)
+        cpu_demand = np.zeros(count)
+        memory_demand = np.zeros(count)
+        allowed = np.zeros((count, len(catalog)), dtype=bool)
+        sizings = []
+
+        for row, instance in enumerate(instances):
+            current = catalog.index(instance.instance_type)
+            capacity = self._get_instance_capacity(instance.instance_type)
+            percentiles = usage.get(instance.instance_id, {})
+            cpu_util, memory_util, peak_cpu_util, peak_memory_util = self._usage_percent(
+                instance, percentiles
+            )
+
+            cpu_demand[row] = capacity['cpu'] * peak_cpu_util / 100
+            memory_demand[row] = capacity['memory'] * peak_memory_util / 100
+
+            if template_mask is not None:
+                allowed[row] = template_mask
+            else:
+                # No template: stay on the same architecture (AMIs are
+                # per-architecture) and off burstable types unless already on one
+                arch_key = (
+                    catalog.architectures[current] if current is not None else "x86_64",
+                    bool(catalog.burstable[current]) if current is not None else False
+                )
+                if arch_key not in masks_by_arch:
+                    masks_by_arch[arch_key] = catalog.allowed_mask(
+                        architecture=arch_key[0], allow_burstable=arch_key[1]
+                    )
+                allowed[row] = masks_by_arch[arch_key]
+
+            if current is not None:
+                current_price = float(prices[current])
+            else:
+                current_price = instance.price or DEFAULT_HOURLY_PRICE
+
+            sizings.append({
+                "instance": instance,
+                "capacity": capacity,
+                "usage": (cpu_util, memory_util, float(cpu_demand[row]), float(memory_demand[row])),
+                "percentiles": percentiles,
+                "current_price": round(current_price, 4),
+                "alternatives": []
+            })
+
+        if not count:
+            return sizings
+
+        best = cheapest_fits(
+            catalog, cpu_demand, memory_demand, allowed,
+            prices=prices, headroom=self.headroom, top_n=top_n
+        )
+
+        for row, sizing in enumerate(sizings):
+            current_price = sizing["current_price"]
+            alternatives = [
+                {
+                    "instance_type": str(catalog.names[i]),
+                    "hourly_price": round(float(prices[i]), 4),
+                    "price_delta": round(float(prices[i]) - current_price, 4)
+                }
+                for i in best[row]
+                if i >= 0 and prices[i] < current_price
+            ]
+            sizing["alternatives"] = alternatives
+            if alternatives:
+                sizing["recommended_type"] = alternatives[0]["instance_type"]
+                sizing["new_price"] = alternatives[0]["hourly_price"]
+
+        return sizings
+
+    def _get_node_template(self, cluster_id: str) -> Optional[NodeTemplate]:
+        """Node template referenced by the cluster policy (template_id in config)"""
+        policy = self.db.query(ClusterPolicy).filter(ClusterPolicy.cluster_id == cluster_id).first()
+        template_id = (policy.config or {}).get("template_id") if policy else None
+        if not template_id:
+            return None
+        return self.db.query(NodeTemplate).filter(NodeTemplate.id == template_id).first()
+
+    def _usage_percent(
+        self,
+        instance: Instance,
+        percentiles: Dict[str, Dict[str, Any]]
+    ) -> tuple:
+        """
+        Typical and peak CPU/memory utilization of an instance
 
-        smaller_type = downsize_map.get(current_type)
-        if smaller_type:
-            smaller_capacity = self._get_instance_capacity(smaller_type)
-            # Check if smaller instance can handle peak usage with 20% headroom
-            if peak_cpu <= smaller_capacity['cpu'] * 0.8 and peak_memory <= smaller_capacity['memory'] * 0.8:
-                return f"Downsize to {smaller_type}"
+        Returns:
+            Tuple of (cpu, memory, peak cpu, peak memory) in percent
+        """
+        values = []
+        for name, current in (("cpu", instance.cpu_util), ("memory", instance.memory_util)):
+            sketch = percentiles.get(name)
+            if sketch:
+                values.append((sketch["p50"], sketch["p95"]))
+            else:
+                # No agent samples: current value, peak simulated as 1.5x
+                values.append((current or 0, (current or 0) * 1.5))
+
+        (cpu, peak_cpu), (memory, peak_memory) = values
+        return cpu, memory, peak_cpu, peak_memory
 
-        return None
+    def _get_instance_capacity(self, instance_type: str) -> Dict[str, float]:
+        """Get instance capacity"""
+        return self.catalog.capacity(instance_type) or {"cpu": 4, "memory": 16}
 
 
-def get_rightsizer(db: Session) -> RightSizingModule:
+def get_rightsizer(db: Session, redis_client=None) -> RightSizingModule:
     """Get RightSizing module instance"""
-    return RightSizingModule(db)
+    return RightSizingModule(db, redis_client)
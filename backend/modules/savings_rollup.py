@@ -0,0 +1,296 @@
+"""
+Savings Rollup (WORK-RPT-01)
+Daily savings per cluster and category, maintained incrementally
+
+Savings come from the action plans of completed optimization jobs. Instead
+of unnesting every plan in the report period on each read, plans are rolled
+up once into savings_daily_rollups, one row per (cluster, category, UTC day
+of the job's created_at):
+
+- refresh_savings_rollup() recomputes one cluster's day; the optimization
+  task calls it when a job completes
+- rebuild_savings_rollups() recomputes a date range (backfill, repair);
+  run it with scripts/rebuild_savings_rollups.py or the
+  workers.reports.rebuild_savings_rollups task
+- load_savings_rollup() reads a period grouped by cluster and category
+
+Each refresh recomputes whole (cluster, day) cells from the jobs table, so
+running it twice, or rebuilding over rows maintained incrementally, gives
+the same result.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Date, Float, case, cast, delete, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from backend.models.account import Account
+from backend.models.cluster import Cluster
+from backend.models.optimization_job import OptimizationJob, OptimizationJobStatus
+from backend.models.savings_rollup import SavingsDailyRollup
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("spot_optimization", "rightsizing", "consolidation", "hibernation", "other")
+
+
+def savings_actions_query(
+    organization_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    cluster_id: Optional[str] = None
+):
+    """
+    One row per action of completed optimization jobs
+
+    Action plans are unnested in PostgreSQL (jsonb_array_elements over
+    results->'actions') and categorized with a CASE, so callers aggregate
+    with GROUP BY instead of parsing plans in Python.
+
+    Args:
+        organization_id: Restrict to an organization
+        start_date: Period start (job created_at, inclusive)
+        end_date: Period end (exclusive)
+        cluster_id: Restrict to a cluster
+
+    Returns:
+        Select with columns job_id, organization_id, cluster_id,
+        cluster_name, created_at, day, action_type, category, savings,
+        executed (0/1)
+    """
+    # Jobs without an action list unnest to no rows
+    plan_actions = OptimizationJob.results['actions']
+    action = func.jsonb_array_elements(
+        case(
+            (func.jsonb_typeof(plan_actions) == 'array', plan_actions),
+            else_=cast('[]', JSONB)
+        ),
+        type_=JSONB
+    ).column_valued('action')
+    action_type = func.coalesce(action['type'].astext, '')
+    lowered = func.lower(action_type)
+
+    category = case(
+        (lowered.contains('spot'), 'spot_optimization'),
+        (or_(lowered.contains('resize'), lowered.contains('rightsize')), 'rightsizing'),
+        (or_(lowered.contains('consolidat'), lowered.contains('pack')), 'consolidation'),
+        (lowered.contains('hibernat'), 'hibernation'),
+        else_='other'
+    )
+
+    query = select(
+        OptimizationJob.id.label('job_id'),
+        Account.organization_id.label('organization_id'),
+        Cluster.id.label('cluster_id'),
+        Cluster.name.label('cluster_name'),
+        OptimizationJob.created_at.label('created_at'),
+        cast(OptimizationJob.created_at, Date).label('day'),
+        action_type.label('action_type'),
+        category.label('category'),
+        func.coalesce(action['estimated_savings'].astext.cast(Float), 0.0).label('savings'),
+        case((action['status'].astext == 'executed', 1), else_=0).label('executed')
+    ).select_from(OptimizationJob).join(
+        Cluster, Cluster.id == OptimizationJob.cluster_id
+    ).join(
+        Account, Account.id == Cluster.account_id
+    ).where(
+        OptimizationJob.status == OptimizationJobStatus.COMPLETED
+    )
+
+    if organization_id:
+        query = query.where(Account.organization_id == organization_id)
+    if cluster_id:
+        query = query.where(OptimizationJob.cluster_id == cluster_id)
+    if start_date:
+        query = query.where(OptimizationJob.created_at >= start_date)
+    if end_date:
+        query = query.where(OptimizationJob.created_at < end_date)
+    return query
+
+
+def _day_start(day: date) -> datetime:
+    return datetime(day.year, day.month, day.day)
+
+
+def refresh_savings_rollup(
+    db: Session,
+    cluster_id: str,
+    start_day: date,
+    end_day: Optional[date] = None
+) -> int:
+    """
+    Recompute a cluster's rollup rows for a range of days
+
+    Rows are replaced (delete + INSERT ... SELECT) inside the caller's
+    transaction, under a transaction-scoped advisory lock on the cluster so
+    jobs completing concurrently on the same cluster refresh one after the
+    other. The caller commits.
+
+    Args:
+        db: Database session
+        cluster_id: Cluster UUID
+        start_day: First UTC day
+        end_day: Last UTC day, inclusive (default start_day)
+
+    Returns:
+        Number of rollup rows written
+    """
+    end_day = end_day or start_day
+
+    db.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"savings_rollup:{cluster_id}"))))
+
+    db.execute(
+        delete(SavingsDailyRollup).where(
+            SavingsDailyRollup.cluster_id == cluster_id,
+            SavingsDailyRollup.day >= start_day,
+            SavingsDailyRollup.day <= end_day
+        )
+    )
+
+    actions = savings_actions_query(
+        cluster_id=cluster_id,
+        start_date=_day_start(start_day),
+        end_date=_day_start(end_day + timedelta(days=1))
+    ).subquery()
+
+    result = db.execute(
+        insert(SavingsDailyRollup).from_select(
+            [
+                "cluster_id", "category", "day", "organization_id", "savings",
+                "opportunities_found", "opportunities_executed", "updated_at"
+            ],
+            select(
+                actions.c.cluster_id,
+                actions.c.category,
+                actions.c.day,
+                actions.c.organization_id,
+                func.sum(actions.c.savings),
+                func.count(),
+                func.sum(actions.c.executed),
+                func.now()
+            ).group_by(
+                actions.c.cluster_id, actions.c.category, actions.c.day, actions.c.organization_id
+            )
+        )
+    )
+    return result.rowcount or 0
+
+
+def record_job_savings(db: Session, job: OptimizationJob) -> int:
+    """
+    Fold a completed job into the rollup and commit
+
+    Args:
+        db: Database session
+        job: Completed OptimizationJob
+
+    Returns:
+        Number of rollup rows written for the job's cluster and day
+    """
+    day = (job.created_at or datetime.utcnow()).date()
+    written = refresh_savings_rollup(db, str(job.cluster_id), day)
+    db.commit()
+    return written
+
+
+def rebuild_savings_rollups(
+    db: Session,
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None,
+    organization_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Recompute the rollup for a range of days (backfill)
+
+    Clusters are refreshed one at a time, each in its own transaction.
+
+    Args:
+        db: Database session
+        start_day: First UTC day (default: day of the oldest job)
+        end_day: Last UTC day, inclusive (default today)
+        organization_id: Restrict to an organization
+
+    Returns:
+        {"clusters": 12, "rows": 340, "start_day": "...", "end_day": "..."}
+    """
+    end_day = end_day or datetime.utcnow().date()
+    if start_day is None:
+        oldest = db.execute(select(func.min(OptimizationJob.created_at))).scalar()
+        start_day = oldest.date() if oldest else end_day
+
+    cluster_query = select(Cluster.id)
+    if organization_id:
+        cluster_query = cluster_query.join(
+            Account, Account.id == Cluster.account_id
+        ).where(Account.organization_id == organization_id)
+    cluster_ids = db.execute(cluster_query).scalars().all()
+
+    rows = 0
+    for cluster_id in cluster_ids:
+        rows += refresh_savings_rollup(db, str(cluster_id), start_day, end_day)
+        db.commit()
+
+    logger.info(
+        f"[WORK-RPT-01] Rebuilt savings rollup {start_day}..{end_day}: "
+        f"{len(cluster_ids)} clusters, {rows} rows"
+    )
+    return {
+        "clusters": len(cluster_ids),
+        "rows": rows,
+        "start_day": start_day.isoformat(),
+        "end_day": end_day.isoformat()
+    }
+
+
+def load_savings_rollup(
+    db: Session,
+    organization_id: str,
+    start_day: date,
+    end_day: date
+) -> List[Dict[str, Any]]:
+    """
+    Savings of an organization grouped by cluster and category
+
+    Args:
+        db: Database session
+        organization_id: Organization UUID
+        start_day: First UTC day
+        end_day: Last UTC day, inclusive
+
+    Returns:
+        [{"cluster_id", "cluster_name", "category", "savings",
+          "opportunities_found", "opportunities_executed"}, ...]
+    """
+    rows = db.execute(
+        select(
+            SavingsDailyRollup.cluster_id,
+            Cluster.name,
+            SavingsDailyRollup.category,
+            func.sum(SavingsDailyRollup.savings),
+            func.sum(SavingsDailyRollup.opportunities_found),
+            func.sum(SavingsDailyRollup.opportunities_executed)
+        ).join(
+            Cluster, Cluster.id == SavingsDailyRollup.cluster_id
+        ).where(
+            SavingsDailyRollup.organization_id == organization_id,
+            SavingsDailyRollup.day >= start_day,
+            SavingsDailyRollup.day <= end_day
+        ).group_by(
+            SavingsDailyRollup.cluster_id, Cluster.name, SavingsDailyRollup.category
+        )
+    ).all()
+
+    return [
+        {
+            "cluster_id": cluster_id,
+            "cluster_name": cluster_name,
+            "category": category,
+            "savings": float(savings or 0),
+            "opportunities_found": int(found or 0),
+            "opportunities_executed": int(executed or 0)
+        }
+        for cluster_id, cluster_name, category, savings, found, executed in rows
+    ]
@@ -0,0 +1,231 @@
+"""
+Usage Sketches (MOD-SIZE-01)
+Streaming CPU/memory utilization quantiles per instance
+
+Utilization samples from agent node metrics are folded into DDSketch-style
+quantile sketches: values are counted in logarithmic buckets, so any
+quantile is returned with a relative error of at most RELATIVE_ACCURACY
+regardless of how many samples were seen, and sketches merge by adding
+bucket counts.
+
+One sparse Redis hash is kept per instance, metric and UTC day:
+
+- usage_sketch:{instance_id}:{metric}:{YYYYMMDD}  HASH  bucket -> count
+
+Samples are added with HINCRBY, so concurrent ingestion needs no locking.
+A window of N days is read by merging N daily sketches; the cost depends
+on the window length, never on the number of raw samples.
+"""
+
+import logging
+import math
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Iterable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+USAGE_SKETCH_KEY = "usage_sketch:{}:{}:{}"
+
+METRICS = ("cpu", "memory")
+
+# Quantiles are accurate to within 1% of their value
+RELATIVE_ACCURACY = 0.01
+
+# Utilization below this (in percent) is counted in the zero bucket
+MIN_TRACKED_VALUE = 0.1
+
+# Daily sketches are kept this long, bounding the longest window
+SKETCH_RETENTION_DAYS = 31
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+_ZERO_BUCKET = "z"
+
+_SECONDS_PER_DAY = 86400
+
+
+def _bucket(value: float) -> str:
+    if value < MIN_TRACKED_VALUE:
+        return _ZERO_BUCKET
+    return str(math.ceil(math.log(value) / _LOG_GAMMA))
+
+
+def _day(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y%m%d")
+
+
+class QuantileSketch:
+    """
+    Mergeable log-bucket quantile sketch (DDSketch)
+    """
+
+    def __init__(self):
+        self.zero_count = 0
+        self.buckets: Dict[int, int] = {}
+
+    @classmethod
+    def from_buckets(cls, buckets: Dict[str, Any]) -> "QuantileSketch":
+        """Build a sketch from a stored bucket -> count hash"""
+        sketch = cls()
+        sketch.merge_buckets(buckets)
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.buckets.values())
+
+    def add(self, value: float, count: int = 1):
+        """Add a sample"""
+        bucket = _bucket(value)
+        if bucket == _ZERO_BUCKET:
+            self.zero_count += count
+        else:
+            index = int(bucket)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge_buckets(self, buckets: Dict[str, Any]):
+        """Add stored bucket counts to this sketch"""
+        for bucket, count in buckets.items():
+            if bucket == _ZERO_BUCKET:
+                self.zero_count += int(count)
+            else:
+                index = int(bucket)
+                self.buckets[index] = self.buckets.get(index, 0) + int(count)
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """
+        Estimate several quantiles in one pass
+
+        Args:
+            qs: Quantiles in [0, 1]
+
+        Returns:
+            Estimated values (None for an empty sketch)
+        """
+        qs = list(qs)
+        total = self.count
+        if total == 0:
+            return [None] * len(qs)
+
+        indexes = np.array(sorted(self.buckets), dtype=np.int64)
+        counts = np.array([self.buckets[i] for i in indexes], dtype=np.int64)
+        cumulative = self.zero_count + np.cumsum(counts)
+
+        results = []
+        for q in qs:
+            rank = q * (total - 1)
+            if rank < self.zero_count:
+                results.append(0.0)
+                continue
+            position = int(np.searchsorted(cumulative, rank, side="right"))
+            position = min(position, len(indexes) - 1)
+            # Bucket midpoint in relative terms keeps the error within the accuracy
+            results.append(2 * _GAMMA ** int(indexes[position]) / (_GAMMA + 1))
+        return results
+
+
+def record_node_usage(
+    redis_client,
+    metrics: List[Dict[str, Any]],
+    now: Optional[float] = None
+) -> int:
+    """
+    Add CPU/memory utilization of agent node metrics to the daily sketches
+
+    Args:
+        redis_client: Redis client
+        metrics: Agent metric dicts (only metric_type "node" with an
+                 instance_id and usage are used)
+        now: Sample time (epoch seconds, default now)
+
+    Returns:
+        Number of nodes sampled
+    """
+    day = _day(now or time.time())
+    ttl = SKETCH_RETENTION_DAYS * _SECONDS_PER_DAY
+    sampled = 0
+
+    pipe = redis_client.pipeline()
+    for metric in metrics:
+        if metric.get("metric_type") != "node" or not metric.get("instance_id"):
+            continue
+
+        usage = (
+            ("cpu", metric.get("cpu_usage_millicores"), metric.get("cpu_capacity_millicores")),
+            ("memory", metric.get("memory_usage_bytes"), metric.get("memory_capacity_bytes")),
+        )
+        recorded = False
+        for name, used, capacity in usage:
+            if used is None or not capacity:
+                continue
+            key = USAGE_SKETCH_KEY.format(metric["instance_id"], name, day)
+            pipe.hincrby(key, _bucket(100.0 * float(used) / float(capacity)), 1)
+            pipe.expire(key, ttl)
+            recorded = True
+        sampled += recorded
+
+    if sampled:
+        pipe.execute()
+    return sampled
+
+
+def load_usage_quantiles(
+    redis_client,
+    instance_ids: List[str],
+    days: int = 14,
+    quantiles: Tuple[float, ...] = (0.5, 0.95, 0.99),
+    now: Optional[float] = None
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Get utilization quantiles of instances over the last `days` UTC days
+
+    Args:
+        redis_client: Redis client
+        instance_ids: EC2 instance IDs
+        days: Window length in days (today included), up to SKETCH_RETENTION_DAYS
+        quantiles: Quantiles to estimate
+        now: End of the window (epoch seconds, default now)
+
+    Returns:
+        {
+            "i-0x123": {
+                "cpu": {"p50": 18.2, "p95": 41.0, "p99": 63.5, "samples": 20160},
+                "memory": {...}
+            }
+        }
+        Instances without samples in the window are omitted.
+    """
+    if not instance_ids:
+        return {}
+
+    days = max(1, min(days, SKETCH_RETENTION_DAYS))
+    end = now or time.time()
+    window = [_day(end - offset * _SECONDS_PER_DAY) for offset in range(days)]
+
+    pipe = redis_client.pipeline()
+    for instance_id in instance_ids:
+        for name in METRICS:
+            for day in window:
+                pipe.hgetall(USAGE_SKETCH_KEY.format(instance_id, name, day))
+    raw = iter(pipe.execute())
+
+    labels = [f"p{round(q * 100, 1):g}" for q in quantiles]
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    for instance_id in instance_ids:
+        usage = {}
+        for name in METRICS:
+            sketch = QuantileSketch()
+            for _ in window:
+                sketch.merge_buckets(next(raw) or {})
+            if sketch.count:
+                values = sketch.quantiles(quantiles)
+                usage[name] = {label: round(value, 2) for label, value in zip(labels, values)}
+                usage[name]["samples"] = sketch.count
+        if usage:
+            results[instance_id] = usage
+
+    return results
@@ -0,0 +1,198 @@
+"""
+Workload Store (MOD-PACK-01)
+Latest pod requests, node capacity and PDBs reported by the agent
+
+The agent sends pod and node metrics in batches (one collection cycle may
+span several requests), so entries are kept per pod / per node in Redis
+hashes and merged as batches arrive:
+
+- cluster_pods:{cluster_id}   HASH  "namespace/name" -> JSON
+- cluster_nodes:{cluster_id}  HASH  node_name -> JSON
+- cluster_pdbs:{cluster_id}   HASH  "namespace/name" -> JSON
+
+Entries not refreshed within WORKLOAD_STALE_SECONDS (deleted pods, removed
+nodes) are ignored and pruned on read.
+"""
+
+import json
+import logging
+import time
+from typing import Dict, Any, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+CLUSTER_PODS_KEY = "cluster_pods:{}"
+CLUSTER_NODES_KEY = "cluster_nodes:{}"
+CLUSTER_PDBS_KEY = "cluster_pdbs:{}"
+
+WORKLOAD_TTL_SECONDS = 86400
+WORKLOAD_STALE_SECONDS = 600
+
+# Pod phases that no longer hold node resources
+_FINISHED_PHASES = ("Succeeded", "Failed")
+
+_COMPACT = (",", ":")
+
+
+def store_agent_metrics(
+    redis_client,
+    cluster_id: str,
+    metrics: List[Dict[str, Any]]
+) -> Dict[str, int]:
+    """
+    Merge a batch of agent pod/node metrics into the workload store
+
+    Args:
+        redis_client: Redis client
+        cluster_id: Cluster UUID
+        metrics: Agent metric dicts (metric_type "pod" / "node" / "pdb";
+                 others ignored)
+
+    Returns:
+        {"pods": 120, "nodes": 8, "pdbs": 3}
+    """
+    now = time.time()
+    pods: Dict[str, str] = {}
+    finished: List[str] = []
+    nodes: Dict[str, str] = {}
+    pdbs: Dict[str, str] = {}
+
+    for metric in metrics:
+        metric_type = metric.get("metric_type")
+
+        if metric_type == "pod":
+            pod_key = f"{metric.get('namespace')}/{metric.get('pod_name')}"
+            if metric.get("phase") in _FINISHED_PHASES or not metric.get("node_name"):
+                finished.append(pod_key)
+                continue
+            pods[pod_key] = json.dumps([
+                metric["node_name"],
+                float(metric.get("cpu_request_millicores") or 0),
+                float(metric.get("memory_request_bytes") or 0),
+                metric.get("owner_kind"),
+                metric.get("labels") or {},
+                now
+            ], separators=_COMPACT)
+
+        elif metric_type == "node":
+            nodes[metric["node_name"]] = json.dumps([
+                metric.get("instance_id"),
+                float(metric.get("cpu_allocatable_millicores") or 0),
+                float(metric.get("memory_allocatable_bytes") or 0),
+                int(metric.get("pods_allocatable") or 110),
+                bool(metric.get("unschedulable")),
+                now
+            ], separators=_COMPACT)
+
+        elif metric_type == "pdb":
+            pdbs[f"{metric.get('namespace')}/{metric.get('name')}"] = json.dumps([
+                metric.get("match_labels") or {},
+                int(metric.get("disruptions_allowed") or 0),
+                now
+            ], separators=_COMPACT)
+
+    pods_key = CLUSTER_PODS_KEY.format(cluster_id)
+    nodes_key = CLUSTER_NODES_KEY.format(cluster_id)
+    pdbs_key = CLUSTER_PDBS_KEY.format(cluster_id)
+
+    pipe = redis_client.pipeline()
+    if pods:
+        pipe.hset(pods_key, mapping=pods)
+        pipe.expire(pods_key, WORKLOAD_TTL_SECONDS)
+    if finished:
+        pipe.hdel(pods_key, *finished)
+    if nodes:
+        pipe.hset(nodes_key, mapping=nodes)
+        pipe.expire(nodes_key, WORKLOAD_TTL_SECONDS)
+    if pdbs:
+        pipe.hset(pdbs_key, mapping=pdbs)
+        pipe.expire(pdbs_key, WORKLOAD_TTL_SECONDS)
+    pipe.execute()
+
+    return {"pods": len(pods), "nodes": len(nodes), "pdbs": len(pdbs)}
+
+
+def load_workload(
+    redis_client,
+    cluster_id: str
+) -> Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Load current nodes, pods and PDBs of a cluster from the workload store
+
+    Args:
+        redis_client: Redis client
+        cluster_id: Cluster UUID
+
+    Returns:
+        Tuple of (nodes by node name, list of pods, list of PDBs); all
+        empty if the agent has not reported recently
+    """
+    cutoff = time.time() - WORKLOAD_STALE_SECONDS
+    pods_key = CLUSTER_PODS_KEY.format(cluster_id)
+    nodes_key = CLUSTER_NODES_KEY.format(cluster_id)
+    pdbs_key = CLUSTER_PDBS_KEY.format(cluster_id)
+
+    pipe = redis_client.pipeline()
+    pipe.hgetall(nodes_key)
+    pipe.hgetall(pods_key)
+    pipe.hgetall(pdbs_key)
+    raw_nodes, raw_pods, raw_pdbs = pipe.execute()
+
+    nodes = {}
+    stale_nodes = []
+    for node_name, raw in (raw_nodes or {}).items():
+        instance_id, cpu, memory, pod_slots, unschedulable, seen = json.loads(raw)
+        if seen < cutoff:
+            stale_nodes.append(node_name)
+            continue
+        nodes[node_name] = {
+            "node_name": node_name,
+            "instance_id": instance_id,
+            "cpu": cpu,
+            "memory": memory,
+            "pods": pod_slots,
+            "unschedulable": unschedulable
+        }
+
+    pods = []
+    stale_pods = []
+    for pod_key, raw in (raw_pods or {}).items():
+        entry = json.loads(raw)
+        if entry[-1] < cutoff:
+            stale_pods.append(pod_key)
+            continue
+        pods.append({
+            "name": pod_key,
+            "node_name": entry[0],
+            "cpu": entry[1],
+            "memory": entry[2],
+            "owner_kind": entry[3],
+            # Entries written before labels were stored have none
+            "labels": entry[4] if len(entry) > 5 else {}
+        })
+
+    pdbs = []
+    stale_pdbs = []
+    for pdb_key, raw in (raw_pdbs or {}).items():
+        match_labels, disruptions_allowed, seen = json.loads(raw)
+        if seen < cutoff:
+            stale_pdbs.append(pdb_key)
+            continue
+        pdbs.append({
+            "name": pdb_key,
+            "namespace": pdb_key.split("/", 1)[0],
+            "match_labels": match_labels,
+            "disruptions_allowed": disruptions_allowed
+        })
+
+    if stale_nodes or stale_pods or stale_pdbs:
+        pipe = redis_client.pipeline()
+        if stale_nodes:
+            pipe.hdel(nodes_key, *stale_nodes)
+        if stale_pods:
+            pipe.hdel(pods_key, *stale_pods)
+        if stale_pdbs:
+            pipe.hdel(pdbs_key, *stale_pdbs)
+        pipe.execute()
+
+    return nodes, pods, pdbs
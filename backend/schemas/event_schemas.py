@@ -0,0 +1,19 @@
+"""
+Event Schemas
+
+Request/response schemas for batched AWS event ingestion
+"""
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any
+
+# Largest batch accepted per request
+MAX_EVENT_BATCH = 1000
+
+
+class EventBatch(BaseModel):
+    """EventBridge/CloudWatch events, as delivered by AWS"""
+    events: List[Dict[str, Any]] = Field(..., min_length=1, max_length=MAX_EVENT_BATCH)
+
+
+class EventBatchResult(BaseModel):
+    queued: int
@@ -42,6 +42,16 @@ class MetricFilter(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
+class AgentMetricsBatch(BaseModel):
+    cluster_id: str
+    metrics: List[Dict[str, Any]] = Field(default_factory=list)
+    timestamp: Optional[datetime] = None
+
+class AgentMetricsIngestResult(BaseModel):
+    pods: int
+    nodes: int
+    pdbs: int = 0
+
 # Aliases for dashboard
 class KPISet(DashboardKPIs): pass
 class ChartDataPoint(TimeSeriesPoint): pass
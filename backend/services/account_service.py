@@ -1,10 +1,10 @@
 import uuid
-import boto3
 from botocore.exceptions import ClientError
 from datetime import datetime
 from typing import List, Optional
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from backend.core.aws_session import get_aws_client_pool
 from backend.models.account import Account, AccountStatus
 from backend.schemas.account_schemas import AccountCreate, AccountResponse
 
@@ -15,11 +15,12 @@ class AccountService:
     def verify_connection(self, role_arn: str, external_id: str) -> bool:
         """Verify AWS connection by attempting to assume role"""
         try:
-            sts = boto3.client('sts')
-            sts.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName="SpotOptimizerVerify",
-                ExternalId=external_id
+            # Always hits STS; the fresh credentials are cached for later scans
+            get_aws_client_pool().get_credentials(
+                role_arn,
+                external_id,
+                session_name="SpotOptimizerVerify",
+                force_refresh=True
             )
             return True
         except ClientError as e:
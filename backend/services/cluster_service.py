@@ -3,7 +3,6 @@ Cluster Service
 
 Business logic for cluster discovery, registration, and management
 """
-import boto3
 from typing import List, Optional, Dict, Any
 
 import uuid
@@ -19,6 +18,7 @@ from backend.schemas.cluster_schemas import (
     ClusterCreate, ClusterUpdate, ClusterResponse, ClusterList, 
     AWSConnectRequest, AgentInstallCommand, ClusterFilter
 )
+from backend.core.aws_session import get_aws_client_pool
 from backend.core.exceptions import (
     ResourceNotFoundError, ResourceAlreadyExistsError, ValidationError
 )
@@ -36,23 +36,16 @@ class ClusterService:
 
         discovered = []
         try:
-            # Assume Role
-            sts = boto3.client('sts')
-            assumed = sts.assume_role(
-                RoleArn=account.role_arn,
-                RoleSessionName="Discovery",
-                ExternalId=account.external_id
+            # EKS client for the account's assumed role (pooled)
+            eks = get_aws_client_pool().get_client(
+                'eks',
+                account.region or 'us-east-1',
+                role_arn=account.role_arn,
+                external_id=account.external_id,
+                session_name="Discovery"
             )
-            creds = assumed['Credentials']
             
             # List Clusters
-            eks = boto3.client(
-                'eks',
-                aws_access_key_id=creds['AccessKeyId'],
-                aws_secret_access_key=creds['SecretAccessKey'],
-                aws_session_token=creds['SessionToken'],
-                region_name=account.region or 'us-east-1'
-            )
             
             cluster_names = eks.list_clusters()['clusters']
 
@@ -23,6 +23,8 @@ from backend.core.exceptions import (
 )
 from backend.core.validators import validate_schedule_matrix, validate_timezone
 from backend.core.logger import StructuredLogger
+from backend.core.hibernation_timer import get_hibernation_timer
+from backend.core.schedule_mask import to_mask, to_bytes
 from datetime import datetime
 import uuid
 
@@ -101,6 +103,7 @@ class HibernationService:
             id=str(uuid.uuid4()),
             cluster_id=schedule_data.cluster_id,
             schedule_matrix=schedule_data.schedule_matrix,
+            schedule_bits=to_bytes(to_mask(schedule_data.schedule_matrix)),
             timezone=schedule_data.timezone,
             pre_warm_minutes=schedule_data.pre_warm_minutes,
             is_active=schedule_data.is_active,
@@ -111,6 +114,7 @@ class HibernationService:
         self.db.add(new_schedule)
         self.db.commit()
         self.db.refresh(new_schedule)
+        self._reschedule(new_schedule)
 
         logger.info(
             "Hibernation schedule created",
@@ -287,10 +291,14 @@ class HibernationService:
         for field, value in update_dict.items():
             setattr(schedule, field, value)
 
+        if "schedule_matrix" in update_dict:
+            schedule.schedule_bits = to_bytes(to_mask(update_dict["schedule_matrix"]))
+
         schedule.updated_at = datetime.utcnow()
 
         self.db.commit()
         self.db.refresh(schedule)
+        self._reschedule(schedule)
 
         logger.info(
             "Hibernation schedule updated",
@@ -329,6 +337,7 @@ class HibernationService:
 
         self.db.delete(schedule)
         self.db.commit()
+        get_hibernation_timer(self.db).unschedule(schedule_id)
 
         logger.info(
             "Hibernation schedule deleted",
@@ -369,6 +378,7 @@ class HibernationService:
 
         self.db.commit()
         self.db.refresh(schedule)
+        self._reschedule(schedule)
 
         logger.info(
             "Hibernation schedule toggled",
@@ -390,6 +400,19 @@ class HibernationService:
             HibernationSchedule.is_active == "Y"
         ).all()
 
+    def _reschedule(self, schedule: HibernationSchedule) -> None:
+        """
+        Recompute a schedule's entry in the hibernation timer after an edit
+
+        Args:
+            schedule: HibernationSchedule model
+        """
+        timer = get_hibernation_timer(self.db)
+        if schedule.is_active == "Y":
+            timer.reschedule(schedule)
+        else:
+            timer.unschedule(str(schedule.id))
+
     def _to_response(self, schedule: HibernationSchedule) -> HibernationScheduleResponse:
         """
         Convert HibernationSchedule model to HibernationScheduleResponse schema
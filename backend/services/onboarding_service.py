@@ -1,11 +1,11 @@
 import uuid
-import boto3
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from botocore.exceptions import ClientError
 from backend.models.user import User
 from backend.models.onboarding import OnboardingState, OnboardingStep, ConnectionMode
 from backend.core.config import settings
+from backend.core.aws_session import get_aws_client_pool
 import urllib.parse
 
 # Constants
@@ -56,20 +56,15 @@ class OnboardingService:
         
         try:
             # Attempt to Assume Role using the specific ExternalId
-            sts_client = boto3.client(
-                'sts',
-                aws_access_key_id=settings.AWS_ACCESS_KEY,
-                aws_secret_access_key=settings.AWS_SECRET_KEY,
-                region_name='us-east-1'
+            # (always hits STS; the credentials are cached for later scans)
+            get_aws_client_pool().get_credentials(
+                role_arn,
+                state.external_id,
+                session_name=f"OnboardingVerify-{user_id}",
+                force_refresh=True
             )
             
-            response = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName=f"OnboardingVerify-{user_id}",
-                ExternalId=state.external_id
-            )
-            
-            # If successful, credentials are in response['Credentials']
+            # If successful, the assumed-role credentials are now pooled
             # We can do a quick test call like listing costs to verify permissions
             
             # Update State
@@ -319,6 +319,8 @@ class PolicyService:
         self.db.commit()
         self.db.refresh(policy)
 
+        self._schedule_plan_reevaluation(policy.cluster_id)
+
         logger.info(
             "Policy updated",
             policy_id=policy_id,
@@ -397,6 +399,8 @@ class PolicyService:
         self.db.commit()
         self.db.refresh(policy)
 
+        self._schedule_plan_reevaluation(policy.cluster_id)
+
         logger.info(
             "Policy toggled",
             policy_id=policy_id,
@@ -406,6 +410,25 @@ class PolicyService:
 
         return self._to_response(policy)
 
+    def _schedule_plan_reevaluation(self, cluster_id: str) -> None:
+        """
+        Queue incremental re-evaluation of the cluster's stored action plan
+
+        Failure to enqueue never fails the policy change itself.
+
+        Args:
+            cluster_id: Cluster UUID
+        """
+        try:
+            from backend.workers.tasks.optimization import reevaluate_action_plans
+            reevaluate_action_plans.delay(cluster_id=cluster_id)
+        except Exception as e:
+            logger.warning(
+                "Could not queue plan re-evaluation",
+                cluster_id=cluster_id,
+                error=str(e)
+            )
+
     def _to_response(self, policy: ClusterPolicy) -> PolicyResponse:
         """
         Convert ClusterPolicy model to PolicyResponse schema
@@ -8,12 +8,36 @@ app = Celery(
     include=['backend.workers.tasks.discovery', 'backend.workers.tasks.pricing_task']
 )
 
+# Reports fan out one task per organization: rendering and sending run on
+# their own queues, so report throughput (and the number of organizations
+# in flight) is set by the workers consuming them, see docker-compose.yml
+app.conf.task_routes = {
+    'workers.reports.generate_org_report': {'queue': 'reports'},
+    'workers.reports.deliver_report': {'queue': 'email'},
+}
+
 app.conf.beat_schedule = {
-    # Existing discovery task
-    'discovery-every-5-mins': {
+    # Discovery reconciliation; EC2 state-change events keep the
+    # inventory current in between
+    'discovery-hourly': {
         'task': 'workers.discovery.scan_all_accounts', # Matches discovery.py name
+        'schedule': 3600.0, # 1 hour
+    },
+    # Re-dispatch phased action plans lost to worker restarts
+    'resume-stalled-plans-every-5-mins': {
+        'task': 'workers.optimization.resume_stalled_plans',
         'schedule': 300.0, # 5 minutes
     },
+    # Shared waiter for pending Spot replacement requests
+    'poll-spot-fulfillment-every-15-secs': {
+        'task': 'workers.optimization.poll_spot_fulfillment',
+        'schedule': 15.0, # 15 seconds
+    },
+    # Micro-batching consumer for queued AWS events (each run lasts ~55s)
+    'consume-events-every-minute': {
+        'task': 'workers.events.consume_events',
+        'schedule': 60.0, # 1 minute
+    },
     # NEW: Pricing task
     'pricing-every-hour': {
         'task': 'backend.workers.tasks.pricing.fetch_aws_pricing', # Matches pricing_task.py name
@@ -12,7 +12,15 @@ Workers:
 """
 
 from .discovery import discovery_worker_loop, stream_discovery_status
-from .optimization import trigger_manual_optimization, optimize_cluster
+from .optimization import (
+    trigger_manual_optimization,
+    optimize_cluster,
+    evaluate_fleet_plans,
+    reevaluate_action_plans,
+    execute_plan_phase,
+    resume_stalled_plans,
+    poll_spot_fulfillment
+)
 from .hibernation_worker import (
     hibernation_scheduler_loop,
     manual_sleep_cluster,
@@ -21,10 +29,15 @@ from .hibernation_worker import (
 from .report_worker import (
     generate_weekly_report,
     generate_monthly_report,
-    export_savings_to_csv
+    generate_org_report,
+    deliver_report,
+    collect_report_results,
+    export_savings_to_csv,
+    rebuild_savings_rollup_task
 )
 from .event_processor import (
     process_event,
+    consume_events,
     replay_event,
     cleanup_old_events
 )
@@ -37,6 +50,11 @@ __all__ = [
     # Optimization worker
     "trigger_manual_optimization",
     "optimize_cluster",
+    "evaluate_fleet_plans",
+    "reevaluate_action_plans",
+    "execute_plan_phase",
+    "resume_stalled_plans",
+    "poll_spot_fulfillment",
 
     # Hibernation worker
     "hibernation_scheduler_loop",
@@ -46,10 +64,15 @@ __all__ = [
     # Report worker
     "generate_weekly_report",
     "generate_monthly_report",
+    "generate_org_report",
+    "deliver_report",
+    "collect_report_results",
     "export_savings_to_csv",
+    "rebuild_savings_rollup_task",
 
     # Event processor
     "process_event",
+    "consume_events",
     "replay_event",
     "cleanup_old_events",
 ]
@@ -1,39 +1,89 @@
 """
 Discovery Worker (WORK-DISC-01)
 Scans AWS accounts for EC2 instances and EKS clusters every 5 minutes
+
+Accounts and regions are scanned concurrently on a bounded thread pool.
 """
 import logging
-from typing import List, Dict, Any
+import time
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from celery import Task
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-import boto3
 from botocore.exceptions import ClientError
 
 from backend.workers import app
-from backend.models.base import get_db
+from backend.models.base import get_db, SessionLocal, generate_uuid
 from backend.models.account import Account
 from backend.models.cluster import Cluster
-from backend.models.instance import Instance
+from backend.models.instance import Instance, InstanceLifecycle
 from backend.core.redis_client import get_redis_client
+from backend.core.aws_session import get_aws_client_pool
+from backend.core.deadline_pool import run_with_deadlines
 
 logger = logging.getLogger(__name__)
 
 
 
+# Concurrent (account, region) scans per discovery run
+DISCOVERY_MAX_WORKERS = 16
+
+# Scans not finished this long after the run submitted them are reported as
+# timed out (well below DISCOVERY_LOCK_SECONDS, so a run always ends while it
+# still holds the lock)
+SCAN_TIMEOUT_SECONDS = 240
+
+# Region scanned for accounts without a known cluster region
+DEFAULT_REGION = 'us-east-1'
+
+# Rows per INSERT ... ON CONFLICT statement when writing instances
+UPSERT_BATCH_SIZE = 500
+
+# EC2 states in and out of the inventory (state-change events)
+LIVE_INSTANCE_STATES = ('pending', 'running')
+REMOVED_INSTANCE_STATES = ('shutting-down', 'terminated', 'stopping', 'stopped')
+
+# describe_instances page size and server-side filters: only live
+# instances that belong to an EKS cluster
+DESCRIBE_PAGE_SIZE = 1000
+DISCOVERY_INSTANCE_FILTERS = [
+    {'Name': 'tag-key', 'Values': ['eks:cluster-name']},
+    {'Name': 'instance-state-name', 'Values': list(LIVE_INSTANCE_STATES)},
+]
+
+# Held while a run is in progress so overlapping Beat runs are skipped
+DISCOVERY_LOCK_KEY = "discovery:run_lock"
+DISCOVERY_LOCK_SECONDS = 600
+
+
 @app.task(bind=True, name="workers.discovery.scan_all_accounts")
 def discovery_worker_loop(self: Task) -> Dict[str, Any]:
     """
     Main discovery loop - scans all active AWS accounts
 
-    Scheduled to run every 5 minutes via Celery Beat
+    Reconciliation pass, scheduled hourly via Celery Beat; EC2 state-change
+    events keep the inventory current in between. Every (account,
+    region) pair is scanned on a bounded thread pool with its own database
+    session, so a run takes about as long as the slowest account. Scans not
+    finished SCAN_TIMEOUT_SECONDS after submit (queued ones included) are
+    reported as timed out and abandoned; a run still in progress makes the
+    next one skip.
 
     Returns:
         {
             "accounts_scanned": 5,
+            "accounts_failed": 0,
+            "regions_scanned": 7,
             "clusters_found": 12,
             "instances_found": 145,
-            "duration_seconds": 23.5
+            "instances_written": 12,
+            "ec2_pages": 9,
+            "drift": {"added": 0, "changed": 1, "removed": 2},
+            "failures": [{"account_id": "...", "region": "us-east-1", "error": "..."}],
+            "slowest_account_seconds": 18.2,
+            "duration_seconds": 23.5,
+            "aws_client_pool": {"credential_hits": 40, "credential_misses": 5, ...}
         }
     """
     start_time = datetime.utcnow()
@@ -42,6 +92,12 @@ def discovery_worker_loop(self: Task) -> Dict[str, Any]:
     db = next(get_db())
     redis_client = get_redis_client()
 
+    run_id = self.request.id or str(time.time())
+    if not redis_client.set(DISCOVERY_LOCK_KEY, run_id, nx=True, ex=DISCOVERY_LOCK_SECONDS):
+        logger.warning(f"[WORK-DISC-01] Previous discovery run still in progress, skipping")
+        db.close()
+        return {"status": "skipped", "reason": "previous run in progress"}
+
     try:
         # Query all active accounts
         accounts = db.query(Account).filter(
@@ -50,98 +106,287 @@ def discovery_worker_loop(self: Task) -> Dict[str, Any]:
 
         logger.info(f"[WORK-DISC-01] Found {len(accounts)} active accounts to scan")
 
+        units = [
+            (account.id, region)
+            for account in accounts
+            for region in _account_regions(account, db)
+        ]
+        outcomes = _scan_concurrently(units, redis_client)
+
         total_clusters = 0
         total_instances = 0
-
-        for account in accounts:
-            try:
-                # Scan this account
-                result = scan_account(account, db, redis_client)
-                total_clusters += result['clusters_found']
-                total_instances += result['instances_found']
-
-            except Exception as e:
-                logger.error(f"[WORK-DISC-01] Failed to scan account {account.id}: {str(e)}")
+        total_pages = 0
+        total_written = 0
+        drift = {"added": 0, "changed": 0, "removed": 0}
+        failures = []
+        failed_accounts = set()
+        account_seconds: Dict[str, float] = {}
+
+        for (account_id, region), outcome in outcomes.items():
+            account_seconds[account_id] = account_seconds.get(account_id, 0.0) + outcome["seconds"]
+            if "error" in outcome:
+                failed_accounts.add(account_id)
+                failures.append({
+                    "account_id": str(account_id),
+                    "region": region,
+                    "error": outcome["error"]
+                })
                 continue
+            total_clusters += outcome["clusters_found"]
+            total_instances += outcome["instances_found"]
+            total_pages += outcome.get("ec2_pages", 0)
+            total_written += outcome.get("instances_written", 0)
+            for kind, count in outcome.get("drift", {}).items():
+                drift[kind] += count
+
+        # Accounts still being onboarded become active after a clean scan
+        for account in accounts:
+            if account.status == 'scanning' and account.id not in failed_accounts:
+                account.status = 'active'
+        db.commit()
 
         duration = (datetime.utcnow() - start_time).total_seconds()
 
         result = {
             "accounts_scanned": len(accounts),
+            "accounts_failed": len(failed_accounts),
+            "regions_scanned": len(units),
             "clusters_found": total_clusters,
             "instances_found": total_instances,
-            "duration_seconds": round(duration, 1)
+            "instances_written": total_written,
+            "ec2_pages": total_pages,
+            "drift": drift,
+            "failures": failures,
+            "slowest_account_seconds": round(max(account_seconds.values(), default=0.0), 1),
+            "duration_seconds": round(duration, 1),
+            "aws_client_pool": get_aws_client_pool().stats()
         }
 
+        pool_stats = result["aws_client_pool"]
         logger.info(
             f"[WORK-DISC-01] Discovery complete: {total_clusters} clusters, "
-            f"{total_instances} instances in {duration:.1f}s"
+            f"{total_instances} instances in {duration:.1f}s "
+            f"({len(failed_accounts)}/{len(accounts)} accounts failed, drift {drift}; "
+            f"AWS credential hit rate {pool_stats['credential_hit_rate']:.0%}, "
+            f"client hit rate {pool_stats['client_hit_rate']:.0%})"
         )
 
         return result
 
     finally:
+        if redis_client.get(DISCOVERY_LOCK_KEY) == run_id:
+            redis_client.delete(DISCOVERY_LOCK_KEY)
         db.close()
 
 # Alias for app.py compatibility
 run_discovery = discovery_worker_loop
 
 
-def scan_account(account: Account, db: Session, redis_client) -> Dict[str, int]:
+def _account_regions(account: Account, db: Session) -> List[str]:
+    """Regions to scan for an account: its own plus those of its known clusters"""
+    regions = {getattr(account, 'region', None) or DEFAULT_REGION}
+    for (region,) in db.query(Cluster.region).filter(
+        Cluster.account_id == account.id
+    ).distinct():
+        if region:
+            regions.add(region)
+    return sorted(regions)
+
+
+def _scan_concurrently(
+    units: List[Tuple[str, str]],
+    redis_client
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Scan (account_id, region) pairs on a bounded thread pool
+
+    Each scan loads its account in its own database session (sessions are
+    not thread-safe). All scans share one deadline, SCAN_TIMEOUT_SECONDS
+    after submit: scans still queued or running by then are recorded as
+    failed and their threads abandoned rather than joined.
+
+    Args:
+        units: (account_id, region) pairs
+        redis_client: Redis client
+
+    Returns:
+        Outcome per pair: clusters_found/instances_found or error, plus seconds
+    """
+    outcomes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    deadline = time.time() + SCAN_TIMEOUT_SECONDS
+    started: Dict[Tuple[str, str], float] = {}
+
+    def run(unit: Tuple[str, str]) -> Dict[str, int]:
+        account_id, region = unit
+        started[unit] = time.time()
+
+        db = SessionLocal()
+        try:
+            account = db.query(Account).filter(Account.id == account_id).first()
+            return scan_account(account, db, redis_client, region=region)
+        finally:
+            db.close()
+
+    def seconds(unit: Tuple[str, str]) -> float:
+        now = time.time()
+        return now - started.get(unit, now)
+
+    def on_result(unit: Tuple[str, str], result, error) -> None:
+        if error is not None:
+            logger.error(f"[WORK-DISC-01] Failed to scan account {unit[0]} in {unit[1]}: {str(error)}")
+            outcomes[unit] = {"error": str(error), "seconds": seconds(unit)}
+        else:
+            outcomes[unit] = dict(result, seconds=seconds(unit))
+
+    def on_timeout(unit: Tuple[str, str]) -> None:
+        logger.error(
+            f"[WORK-DISC-01] Scan of account {unit[0]} in {unit[1]} timed out "
+            f"after {SCAN_TIMEOUT_SECONDS}s"
+        )
+        outcomes[unit] = {
+            "error": f"Timed out after {SCAN_TIMEOUT_SECONDS}s",
+            "seconds": seconds(unit)
+        }
+
+    run_with_deadlines(
+        units,
+        run,
+        lambda unit: deadline,
+        on_result,
+        on_timeout,
+        max_workers=DISCOVERY_MAX_WORKERS
+    )
+
+    return outcomes
+
+
+def _account_cluster_ids(
+    account: Account,
+    db: Session,
+    region: Optional[str] = None
+) -> Dict[str, str]:
+    """Cluster name -> cluster ID for an account (optionally one region)"""
+    query = db.query(Cluster.name, Cluster.id).filter(Cluster.account_id == account.id)
+    if region:
+        query = query.filter(Cluster.region == region)
+    return dict(query.all())
+
+
+def apply_instance_state_change(
+    db: Session,
+    aws_account_id: Optional[str],
+    region: Optional[str],
+    instance_id: str,
+    state: str
+) -> Dict[str, Any]:
+    """
+    Apply one EC2 state-change event to the instance inventory
+
+    Instances leaving service are deleted right away. A launch of an
+    untracked instance costs one describe_instances call for that instance
+    (to get its type, lifecycle and cluster tag); launches of tracked
+    instances and other transitions touch nothing.
+
+    Args:
+        db: Database session
+        aws_account_id: 12-digit AWS account from the event envelope
+        region: Region from the event envelope
+        instance_id: EC2 instance ID
+        state: New instance state
+
+    Returns:
+        {"instance_id": "i-0x123", "inventory": "added" | "removed" | "unchanged" | ...}
+    """
+    result = {"instance_id": instance_id, "inventory": "unchanged"}
+
+    if state in REMOVED_INSTANCE_STATES:
+        removed = db.query(Instance).filter(
+            Instance.instance_id == instance_id
+        ).delete(synchronize_session=False)
+        db.commit()
+        result["inventory"] = "removed" if removed else "untracked"
+        return result
+
+    if state not in LIVE_INSTANCE_STATES:
+        return result
+
+    if db.query(Instance.id).filter(Instance.instance_id == instance_id).first():
+        return result
+
+    account = db.query(Account).filter(Account.aws_account_id == aws_account_id).first()
+    if not account or not region:
+        result["inventory"] = "unknown_account"
+        return result
+
+    ec2_client = get_aws_client_pool().get_client(
+        'ec2', region,
+        role_arn=account.role_arn,
+        external_id=account.external_id,
+        session_name=f"SpotOptimizer-Discovery-{account.id}"
+    )
+    response = ec2_client.describe_instances(InstanceIds=[instance_id])
+    discovered = [
+        instance_data
+        for reservation in response.get('Reservations', [])
+        for instance_data in reservation.get('Instances', [])
+    ]
+
+    counts = _upsert_instance_page(db, discovered, _account_cluster_ids(account, db, region))
+    result["inventory"] = "added" if counts["added"] else "not_in_cluster"
+
+    logger.info(f"[WORK-DISC-01] Inventory update for {instance_id} ({state}): {result['inventory']}")
+    return result
+
+
+def scan_account(
+    account: Account,
+    db: Session,
+    redis_client,
+    region: Optional[str] = None
+) -> Dict[str, int]:
     """
-    Scan a single AWS account
+    Scan a single AWS account in one region
 
     Args:
         account: Account object with AWS credentials
         db: Database session
         redis_client: Redis client
+        region: AWS region (default: the account's region)
 
     Returns:
         {"clusters_found": 3, "instances_found": 45}
     """
-    logger.info(f"[WORK-DISC-01] Scanning account {account.aws_account_id}")
+    region = region or getattr(account, 'region', None) or DEFAULT_REGION
+    logger.info(f"[WORK-DISC-01] Scanning account {account.aws_account_id} in {region}")
 
     clusters_found = 0
     instances_found = 0
+    ec2_stats: Dict[str, Any] = {}
 
     try:
-        # Assume IAM role via STS
-        sts_client = boto3.client('sts')
-        assumed_role = sts_client.assume_role(
-            RoleArn=account.role_arn,
-            RoleSessionName=f"SpotOptimizer-Discovery-{account.id}",
-            ExternalId=account.external_id
-        )
-
-        credentials = assumed_role['Credentials']
-
-        # Create AWS clients with assumed credentials
-        ec2_client = boto3.client(
-            'ec2',
-            region_name=account.region or 'us-east-1',
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
+        # AWS clients for the account's assumed role (pooled across scans)
+        pool = get_aws_client_pool()
+        session_name = f"SpotOptimizer-Discovery-{account.id}"
+
+        ec2_client = pool.get_client(
+            'ec2', region,
+            role_arn=account.role_arn,
+            external_id=account.external_id,
+            session_name=session_name
         )
 
-        eks_client = boto3.client(
-            'eks',
-            region_name=account.region or 'us-east-1',
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
+        eks_client = pool.get_client(
+            'eks', region,
+            role_arn=account.role_arn,
+            external_id=account.external_id,
+            session_name=session_name
         )
 
         # Scan EKS clusters
-        clusters_found = scan_eks_clusters(account, eks_client, db)
+        clusters_found = scan_eks_clusters(account, eks_client, db, region=region)
 
         # Scan EC2 instances
-        instances_found = scan_ec2_instances(account, ec2_client, db)
-
-        # Update account status
-        if account.status == 'scanning':
-            account.status = 'active'
-            db.commit()
+        instances_found = scan_ec2_instances(account, ec2_client, db, stats=ec2_stats, region=region)
 
     except ClientError as e:
         logger.error(f"[WORK-DISC-01] AWS error scanning account {account.id}: {str(e)}")
@@ -149,13 +394,16 @@ def scan_account(account: Account, db: Session, redis_client) -> Dict[str, int]:
 
     return {
         "clusters_found": clusters_found,
-        "instances_found": instances_found
+        "instances_found": instances_found,
+        "ec2_pages": ec2_stats.get("pages", 0),
+        "instances_written": ec2_stats.get("changed", 0),
+        "drift": ec2_stats.get("drift", {})
     }
 
 
-def scan_eks_clusters(account: Account, eks_client, db: Session) -> int:
+def scan_eks_clusters(account: Account, eks_client, db: Session, region: Optional[str] = None) -> int:
     """
-    Scan EKS clusters in the account
+    Scan EKS clusters in the account (in the EKS client's region)
 
     Returns:
         Number of clusters found
@@ -189,7 +437,7 @@ def scan_eks_clusters(account: Account, eks_client, db: Session) -> int:
                 new_cluster = Cluster(
                     account_id=account.id,
                     name=cluster_name,
-                    region=account.region or 'us-east-1',
+                    region=region or getattr(account, 'region', None) or DEFAULT_REGION,
                     vpc_id=cluster_data.get('resourcesVpcConfig', {}).get('vpcId'),
                     api_endpoint=cluster_data.get('endpoint'),
                     k8s_version=cluster_data.get('version'),
@@ -206,72 +454,103 @@ def scan_eks_clusters(account: Account, eks_client, db: Session) -> int:
         return 0
 
 
-def scan_ec2_instances(account: Account, ec2_client, db: Session) -> int:
+def scan_ec2_instances(
+    account: Account,
+    ec2_client,
+    db: Session,
+    stats: Optional[Dict[str, Any]] = None,
+    region: Optional[str] = None
+) -> int:
     """
     Scan EC2 instances in the account
 
+    Only pending/running instances tagged with eks:cluster-name are
+    requested (filtered server-side), page by page; each page is written
+    before the next is fetched, so memory stays bounded by the page size.
+    The account's clusters are loaded once, tracked instances once per page;
+    new and changed instances are written with batched INSERT ... ON
+    CONFLICT upserts, and unchanged instances are skipped.
+
+    Day to day the inventory is kept current by EC2 state-change events
+    (apply_instance_state_change); this scan reconciles it, deleting
+    instances of the scanned clusters that no longer run and reporting
+    everything it had to fix as drift.
+
+    Args:
+        account: Account being scanned
+        ec2_client: EC2 client for the account and region
+        db: Database session
+        stats: Filled with pages, changed, describe_seconds and drift
+               (added/changed/removed) if given
+        region: Region of ec2_client (limits removals to its clusters)
+
     Returns:
         Number of instances found
     """
+    stats = stats if stats is not None else {}
+    stats.update(pages=0, changed=0, describe_seconds=0.0, drift={"added": 0, "changed": 0, "removed": 0})
+    instance_count = 0
+    seen = set()
+
     try:
-        # Describe all instances
-        response = ec2_client.describe_instances()
-        instance_count = 0
-
-        for reservation in response.get('Reservations', []):
-            for instance_data in reservation.get('Instances', []):
-                instance_id = instance_data.get('InstanceId')
-                instance_type = instance_data.get('InstanceType')
-                lifecycle = instance_data.get('InstanceLifecycle', 'on-demand').upper()
-                az = instance_data.get('Placement', {}).get('AvailabilityZone')
-
-                # Find associated cluster (via tags)
-                tags = instance_data.get('Tags', [])
-                cluster_name = None
-                for tag in tags:
-                    if tag.get('Key') == 'eks:cluster-name':
-                        cluster_name = tag.get('Value')
-                        break
-
-                cluster_id = None
-                if cluster_name:
-                    cluster = db.query(Cluster).filter(
-                        Cluster.account_id == account.id,
-                        Cluster.name == cluster_name
-                    ).first()
-                    if cluster:
-                        cluster_id = cluster.id
-
-                # Check if instance already exists
-                existing = db.query(Instance).filter(
-                    Instance.instance_id == instance_id
-                ).first()
-
-                if existing:
-                    # Update existing instance
-                    existing.instance_type = instance_type
-                    existing.lifecycle = lifecycle
-                    existing.az = az
-                    existing.updated_at = datetime.utcnow()
-                else:
-                    # Create new instance
-                    new_instance = Instance(
-                        cluster_id=cluster_id,
-                        instance_id=instance_id,
-                        instance_type=instance_type,
-                        lifecycle=lifecycle,
-                        az=az,
-                        price=None,  # Will be updated by pricing collector
-                        cpu_util=None,  # Will be updated by metrics collection
-                        memory_util=None
-                    )
-                    db.add(new_instance)
-
-                instance_count += 1
+        # Preload cluster name -> id once for all pages
+        cluster_ids = _account_cluster_ids(account, db, region)
 
-            db.commit()
+        pages = ec2_client.get_paginator('describe_instances').paginate(
+            Filters=DISCOVERY_INSTANCE_FILTERS,
+            PaginationConfig={'PageSize': DESCRIBE_PAGE_SIZE}
+        )
 
-        logger.info(f"[WORK-DISC-01] Found {instance_count} EC2 instances")
+        page_started = time.monotonic()
+        for page in pages:
+            latency = time.monotonic() - page_started
+            discovered = [
+                instance_data
+                for reservation in page.get('Reservations', [])
+                for instance_data in reservation.get('Instances', [])
+            ]
+
+            counts = _upsert_instance_page(db, discovered, cluster_ids)
+            changed = counts["added"] + counts["changed"]
+            seen.update(i.get('InstanceId') for i in discovered)
+
+            stats["pages"] += 1
+            stats["changed"] += changed
+            stats["drift"]["added"] += counts["added"]
+            stats["drift"]["changed"] += counts["changed"]
+            stats["describe_seconds"] += latency
+            instance_count += len(discovered)
+
+            logger.debug(
+                f"[WORK-DISC-01] describe_instances page {stats['pages']}: "
+                f"{len(discovered)} instances ({changed} written) in {latency * 1000:.0f}ms"
+            )
+            page_started = time.monotonic()
+
+        # Tracked instances of these clusters that no longer run: missed
+        # terminations (only after every page was read)
+        if cluster_ids:
+            tracked = {
+                instance_id for (instance_id,) in db.query(Instance.instance_id).filter(
+                    Instance.cluster_id.in_(list(cluster_ids.values()))
+                ).all()
+            }
+            removed = list(tracked - seen)
+            if removed:
+                db.query(Instance).filter(
+                    Instance.instance_id.in_(removed)
+                ).delete(synchronize_session=False)
+                db.commit()
+            stats["drift"]["removed"] = len(removed)
+
+        stats["describe_seconds"] = round(stats["describe_seconds"], 3)
+        logger.info(
+            f"[WORK-DISC-01] Found {instance_count} EC2 instances "
+            f"({stats['changed']} new or changed) in {stats['pages']} page(s), "
+            f"{stats['describe_seconds']:.2f}s in describe_instances"
+        )
+        if any(stats["drift"].values()):
+            logger.warning(f"[WORK-DISC-01] Reconciliation drift for account {account.id}: {stats['drift']}")
         return instance_count
 
     except ClientError as e:
@@ -279,6 +558,103 @@ def scan_ec2_instances(account: Account, ec2_client, db: Session) -> int:
         return 0
 
 
+def _upsert_instance_page(
+    db: Session,
+    discovered: List[Dict[str, Any]],
+    cluster_ids: Dict[str, str]
+) -> Dict[str, int]:
+    """
+    Write new and changed instances of one describe_instances page
+
+    Instances not tagged with a known cluster are only updated if already
+    tracked (instances require a cluster).
+
+    Args:
+        db: Database session
+        discovered: Instance dicts from the page
+        cluster_ids: Cluster name -> cluster ID for the account
+
+    Returns:
+        {"added": new rows, "changed": updated rows}
+    """
+    counts = {"added": 0, "changed": 0}
+    if not discovered:
+        return counts
+
+    # instance_id -> tracked state, one query per page
+    existing = {
+        row.instance_id: row
+        for row in db.query(
+            Instance.instance_id,
+            Instance.cluster_id,
+            Instance.instance_type,
+            Instance.lifecycle,
+            Instance.az
+        ).filter(Instance.instance_id.in_([i.get('InstanceId') for i in discovered])).all()
+    }
+
+    now = datetime.utcnow()
+    rows = []
+
+    for instance_data in discovered:
+        instance_id = instance_data.get('InstanceId')
+        instance_type = instance_data.get('InstanceType')
+        lifecycle = (
+            InstanceLifecycle.SPOT
+            if instance_data.get('InstanceLifecycle') == 'spot'
+            else InstanceLifecycle.ON_DEMAND
+        )
+        az = instance_data.get('Placement', {}).get('AvailabilityZone')
+
+        # Find associated cluster (via tags)
+        cluster_name = None
+        for tag in instance_data.get('Tags', []):
+            if tag.get('Key') == 'eks:cluster-name':
+                cluster_name = tag.get('Value')
+                break
+
+        tracked = existing.get(instance_id)
+        cluster_id = cluster_ids.get(cluster_name) if cluster_name else None
+        if tracked is not None:
+            cluster_id = cluster_id or tracked.cluster_id
+            if (tracked.cluster_id, tracked.instance_type, tracked.lifecycle, tracked.az) == \
+                    (cluster_id, instance_type, lifecycle, az):
+                continue
+            counts["changed"] += 1
+        elif cluster_id is None:
+            continue
+        else:
+            counts["added"] += 1
+
+        rows.append({
+            "id": generate_uuid(),
+            "cluster_id": cluster_id,
+            "instance_id": instance_id,
+            "instance_type": instance_type,
+            "lifecycle": lifecycle,
+            "az": az,
+            "created_at": now,
+            "updated_at": now
+        })
+
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        statement = pg_insert(Instance).values(rows[start:start + UPSERT_BATCH_SIZE])
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[Instance.instance_id],
+            set_={
+                "cluster_id": statement.excluded.cluster_id,
+                "instance_type": statement.excluded.instance_type,
+                "lifecycle": statement.excluded.lifecycle,
+                "az": statement.excluded.az,
+                "updated_at": statement.excluded.updated_at
+            }
+        ))
+    if rows:
+        db.commit()
+
+    return counts
+
+
 @app.task(name="workers.discovery.stream_progress")
 def stream_discovery_status(account_id: str) -> Dict[str, Any]:
     """
@@ -10,6 +10,8 @@ Processes incoming events from:
 
 Key Features:
 - Real-time Spot interruption handling
+- Micro-batched consumption of queued events (one dedup pipeline and one
+  insert per batch)
 - Automatic pod rescheduling
 - Global Risk Tracker updates
 - Webhook notifications
@@ -27,24 +29,77 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 import json
 import hashlib
+import time
 
 from celery import Task
 import boto3
 from botocore.exceptions import ClientError
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 
 from backend.workers import app
-from backend.models.base import get_db
+from backend.models.base import get_db, generate_uuid
 from backend.models.cluster import Cluster
 from backend.models.account import Account
-from backend.models.audit_log import AuditLog
+from backend.models.audit_log import AuditLog, AuditOutcome, ResourceType
+from backend.models.cluster_event import ClusterEvent
 from backend.core.redis_client import get_redis_client
 from backend.modules.risk_tracker import get_risk_tracker
+from backend.core.spot_fulfillment import get_spot_fulfillment_tracker
+from backend.workers.tasks.optimization import (
+    reevaluate_action_plans,
+    poll_spot_fulfillment
+)
+from backend.workers.tasks.discovery import apply_instance_state_change
 
 logger = logging.getLogger(__name__)
 
+try:
+    import xxhash
+
+    def _payload_digest(data: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(data)
+except ImportError:
+    logger.warning("[WORK-EVT-01] xxhash not available, using blake2b for event fingerprints")
+
+    def _payload_digest(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+# Events waiting for the batch consumer (JSON payloads, FIFO)
+EVENT_QUEUE_KEY = "events:pending"
+
+# Batch in flight of one consumer run; events are moved here when popped
+# and the list is deleted (acked) once the whole batch has been handled
+EVENT_PROCESSING_KEY = "events:processing:{}"
+
+# Consumer run ID -> lease expiry (epoch). The processing list of a run
+# whose lease ran out (worker died mid-batch) is moved back to the queue
+EVENT_CONSUMERS_KEY = "events:consumers"
+EVENT_CONSUMER_LEASE_SECONDS = 300
+
+# A failing event is queued again this many times before it is given up
+# (its cluster_events row keeps the error for replay)
+EVENT_MAX_ATTEMPTS = 5
+
+# Delivery attempt counter carried by requeued payloads
+_ATTEMPT_FIELD = "_attempt"
+
+# Processed-event markers (event:{event_id}) expire after this long
+EVENT_DEDUP_TTL_SECONDS = 3600
+
+# Largest batch handled at once
+EVENT_BATCH_SIZE = 500
+
+# How long a partial batch keeps filling while events are still arriving
+EVENT_BATCH_WINDOW_SECONDS = 0.05
+
+# Blocking wait for the first event of a batch
+EVENT_IDLE_BLOCK_SECONDS = 1
+
+# Each consumer run ends after this long (beat starts one per minute)
+EVENT_CONSUMER_RUN_SECONDS = 55
+
 
 @app.task(bind=True, name="workers.events.process_event")
 def process_event(self: Task, event_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -63,41 +118,22 @@ def process_event(self: Task, event_data: Dict[str, Any]) -> Dict[str, Any]:
     redis_client = get_redis_client()
 
     try:
-        # Extract event metadata
-        event_type = event_data.get('detail-type', '')
-        source = event_data.get('source', '')
-        detail = event_data.get('detail', {})
-
-        # Deduplicate events using Redis
+        # Deduplicate events using Redis (atomic claim)
         event_id = generate_event_id(event_data)
-        if is_duplicate_event(event_id, redis_client):
+        if not claim_event(event_id, redis_client):
             logger.info(f"[WORK-EVT-01] Skipping duplicate event {event_id}")
             return {"status": "skipped", "reason": "duplicate"}
 
-        # Mark event as processed (TTL 1 hour)
-        redis_client.setex(f"event:{event_id}", 3600, "processed")
-
         # Route event to appropriate handler
-        result = None
-
-        if "EC2 Spot Instance Interruption Warning" in event_type:
-            result = handle_spot_interruption(detail, db, redis_client)
-
-        elif "EC2 Instance State-change Notification" in event_type:
-            result = handle_instance_state_change(detail, db, redis_client)
-
-        elif "Auto Scaling" in event_type:
-            result = handle_autoscaling_event(detail, db, redis_client)
-
-        elif "EKS" in source:
-            result = handle_eks_event(detail, db, redis_client)
-
-        else:
-            logger.warning(f"[WORK-EVT-01] Unknown event type: {event_type}")
-            result = {"status": "ignored", "reason": "unknown_type"}
+        try:
+            result = route_event(event_data, db, redis_client)
+        except Exception:
+            # Let a redelivery process the event again
+            redis_client.delete(_event_key(event_id))
+            raise
 
         # Log event to database
-        log_event(event_data, result, db)
+        log_event(event_data, result, db, event_id=event_id)
 
         return result
 
@@ -108,6 +144,358 @@ def process_event(self: Task, event_data: Dict[str, Any]) -> Dict[str, Any]:
         db.close()
 
 
+def route_event(
+    event_data: Dict[str, Any],
+    db: Session,
+    redis_client
+) -> Dict[str, Any]:
+    """
+    Dispatch an event to its handler
+
+    Args:
+        event_data: Event payload from EventBridge/CloudWatch
+        db: Database session
+        redis_client: Redis client
+
+    Returns:
+        Handler result
+    """
+    event_type = event_data.get('detail-type', '')
+    source = event_data.get('source', '')
+    detail = event_data.get('detail', {})
+
+    if "EC2 Spot Instance Interruption Warning" in event_type:
+        return handle_spot_interruption(detail, db, redis_client)
+
+    if "EC2 Instance State-change Notification" in event_type:
+        return handle_instance_state_change(
+            detail, db, redis_client,
+            aws_account_id=event_data.get('account'),
+            region=event_data.get('region')
+        )
+
+    if "Auto Scaling" in event_type:
+        return handle_autoscaling_event(detail, db, redis_client)
+
+    if "EKS" in source:
+        return handle_eks_event(detail, db, redis_client)
+
+    logger.warning(f"[WORK-EVT-01] Unknown event type: {event_type}")
+    return {"status": "ignored", "reason": "unknown_type"}
+
+
+def enqueue_events(events: List[Dict[str, Any]], redis_client=None) -> int:
+    """
+    Queue events for the batch consumer (one RPUSH)
+
+    Args:
+        events: Event payloads
+        redis_client: Optional Redis client
+
+    Returns:
+        Number of events queued
+    """
+    if not events:
+        return 0
+    redis_client = redis_client or get_redis_client()
+    redis_client.rpush(EVENT_QUEUE_KEY, *[json.dumps(event) for event in events])
+    return len(events)
+
+
+def pop_event_batch(
+    redis_client,
+    processing_key: str,
+    batch_size: int = EVENT_BATCH_SIZE,
+    window_seconds: float = EVENT_BATCH_WINDOW_SECONDS,
+    block_seconds: float = EVENT_IDLE_BLOCK_SECONDS
+) -> List[Dict[str, Any]]:
+    """
+    Take the next batch of queued events
+
+    Blocks until an event arrives (up to block_seconds), then takes what
+    is already queued. A partial batch keeps filling for up to
+    window_seconds only while more events keep arriving, so a lone event
+    is processed at once and bursts are handled in full batches.
+
+    Events are moved (BLMOVE/LMOVE) onto processing_key rather than
+    removed, so a batch whose consumer dies is still in Redis; the caller
+    acks it with ack_event_batch() once handled.
+
+    Args:
+        redis_client: Redis client
+        processing_key: Processing list of the consumer run (must be empty)
+        batch_size: Largest batch
+        window_seconds: Fill window for partial batches under load
+        block_seconds: Idle wait for the first event
+
+    Returns:
+        Event payloads in arrival order (empty if none arrived)
+    """
+    first = redis_client.blmove(EVENT_QUEUE_KEY, processing_key, block_seconds, "LEFT", "RIGHT")
+    if first is None:
+        return []
+
+    raw = [first]
+    deadline = time.monotonic() + window_seconds
+    while len(raw) < batch_size:
+        available = min(redis_client.llen(EVENT_QUEUE_KEY), batch_size - len(raw))
+        if not available:
+            break
+        pipe = redis_client.pipeline(transaction=False)
+        for _ in range(available):
+            pipe.lmove(EVENT_QUEUE_KEY, processing_key, "LEFT", "RIGHT")
+        raw.extend(payload for payload in pipe.execute() if payload is not None)
+        if time.monotonic() >= deadline:
+            break
+
+    events = []
+    for payload in raw:
+        try:
+            events.append(json.loads(payload))
+        except ValueError:
+            logger.error(f"[WORK-EVT-01] Dropping malformed queued event: {payload[:200]}")
+    return events
+
+
+def ack_event_batch(redis_client, processing_key: str) -> None:
+    """Drop a handled batch from its processing list"""
+    redis_client.delete(processing_key)
+
+
+def requeue_events(
+    events: List[Dict[str, Any]],
+    redis_client,
+    max_attempts: int = EVENT_MAX_ATTEMPTS
+) -> int:
+    """
+    Queue failed events again with their attempt counter incremented
+
+    Args:
+        events: Event payloads that failed (as popped, with their counter)
+        redis_client: Redis client
+        max_attempts: Events that failed this many times are given up
+
+    Returns:
+        Number of events queued again
+    """
+    retry = []
+    for event in events:
+        attempt = event.pop(_ATTEMPT_FIELD, 0) + 1
+        if attempt >= max_attempts:
+            logger.error(
+                f"[WORK-EVT-01] Giving up event {generate_event_id(event)} "
+                f"after {attempt} attempts"
+            )
+            continue
+        retry.append(json.dumps({**event, _ATTEMPT_FIELD: attempt}))
+
+    if retry:
+        redis_client.rpush(EVENT_QUEUE_KEY, *retry)
+    return len(retry)
+
+
+def recover_stalled_batches(redis_client, now: Optional[float] = None) -> int:
+    """
+    Move batches of dead consumer runs back to the queue
+
+    A run whose lease expired died between popping a batch and acking it.
+    Its events go back to the front of the queue with their dedup claims
+    released, so they are processed again (at least once).
+
+    Args:
+        redis_client: Redis client
+        now: Epoch seconds (default now)
+
+    Returns:
+        Number of events recovered
+    """
+    now = now or time.time()
+    stalled = redis_client.zrangebyscore(EVENT_CONSUMERS_KEY, 0, now)
+
+    recovered = 0
+    for consumer_id in stalled:
+        # Only one consumer wins the cleanup of a stalled run
+        if not redis_client.zrem(EVENT_CONSUMERS_KEY, consumer_id):
+            continue
+
+        processing_key = EVENT_PROCESSING_KEY.format(consumer_id)
+        payloads = redis_client.lrange(processing_key, 0, -1)
+        if not payloads:
+            redis_client.delete(processing_key)
+            continue
+
+        event_keys = []
+        for payload in payloads:
+            try:
+                event = json.loads(payload)
+            except ValueError:
+                continue
+            event.pop(_ATTEMPT_FIELD, None)
+            event_keys.append(_event_key(generate_event_id(event)))
+
+        pipe = redis_client.pipeline()
+        if event_keys:
+            pipe.delete(*event_keys)
+        pipe.lpush(EVENT_QUEUE_KEY, *reversed(payloads))
+        pipe.delete(processing_key)
+        pipe.execute()
+
+        recovered += len(payloads)
+        logger.warning(
+            f"[WORK-EVT-01] Requeued {len(payloads)} events of stalled consumer {consumer_id}"
+        )
+
+    return recovered
+
+
+def process_event_batch(
+    events: List[Dict[str, Any]],
+    db: Session,
+    redis_client
+) -> Dict[str, int]:
+    """
+    Process a batch of events
+
+    1. Deduplicate the whole batch in one pipeline: SET event:{id} NX EX
+       claims each event, so repeats within the batch and events already
+       claimed by another consumer are skipped
+    2. Route each claimed event to its handler
+    3. Insert all ClusterEvent rows in one statement
+
+    A failed handler releases its event's claim and the event is queued
+    again (up to EVENT_MAX_ATTEMPTS deliveries); its row records the error
+    for replay.
+
+    Args:
+        events: Event payloads
+        db: Database session
+        redis_client: Redis client
+
+    Returns:
+        {"received": 500, "duplicates": 12, "processed": 486, "errors": 2,
+         "requeued": 2}
+    """
+    summary = {"received": len(events), "duplicates": 0, "processed": 0, "errors": 0, "requeued": 0}
+    if not events:
+        return summary
+
+    attempts = [event.pop(_ATTEMPT_FIELD, 0) for event in events]
+    event_ids = [generate_event_id(event) for event in events]
+
+    pipe = redis_client.pipeline(transaction=False)
+    for event_id in event_ids:
+        pipe.set(_event_key(event_id), "processed", nx=True, ex=EVENT_DEDUP_TTL_SECONDS)
+    claimed = pipe.execute()
+
+    rows = []
+    failed = []
+    processed_at = datetime.utcnow()
+
+    for event_data, event_id, attempt, won in zip(events, event_ids, attempts, claimed):
+        if not won:
+            summary["duplicates"] += 1
+            continue
+
+        try:
+            result = route_event(event_data, db, redis_client)
+            summary["processed"] += 1
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[WORK-EVT-01] Error processing event {event_id}: {str(e)}")
+            result = {"status": "error", "error": str(e), "attempt": attempt + 1}
+            failed.append((event_id, {**event_data, _ATTEMPT_FIELD: attempt}))
+            summary["errors"] += 1
+
+        rows.append({
+            "id": generate_uuid(),
+            "event_id": event_id,
+            "event_type": event_data.get('detail-type', 'unknown'),
+            "event_source": event_data.get('source', 'unknown'),
+            "event_data": event_data,
+            "processing_result": result,
+            "processed_at": processed_at
+        })
+
+    if failed:
+        redis_client.delete(*[_event_key(event_id) for event_id, _ in failed])
+        summary["requeued"] = requeue_events([event for _, event in failed], redis_client)
+
+    if rows:
+        try:
+            db.execute(insert(ClusterEvent).values(rows))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[WORK-EVT-01] Error logging {len(rows)} events: {str(e)}")
+
+    return summary
+
+
+@app.task(bind=True, name="workers.events.consume_events")
+def consume_events(self: Task, run_seconds: float = EVENT_CONSUMER_RUN_SECONDS) -> Dict[str, int]:
+    """
+    Micro-batching event consumer - started every minute by beat
+
+    Drains the event queue (filled by POST /events/batch) in batches of up
+    to EVENT_BATCH_SIZE until run_seconds have passed. Several consumers
+    may run at once; moving events onto a per-run processing list and the
+    SET NX claims keep them from processing an event twice.
+
+    Each batch is acked only after it has been handled, and the run holds
+    a lease in EVENT_CONSUMERS_KEY while it works; batches of runs that
+    died are requeued by the next run (recover_stalled_batches()).
+
+    Args:
+        run_seconds: How long to keep consuming
+
+    Returns:
+        Dict with totals over all batches
+    """
+    db = next(get_db())
+    redis_client = get_redis_client()
+
+    consumer_id = self.request.id or generate_uuid()
+    processing_key = EVENT_PROCESSING_KEY.format(consumer_id)
+
+    totals = {
+        "batches": 0, "received": 0, "duplicates": 0, "processed": 0,
+        "errors": 0, "requeued": 0, "recovered": 0
+    }
+    stop_at = time.monotonic() + run_seconds
+
+    try:
+        totals["recovered"] = recover_stalled_batches(redis_client)
+
+        while time.monotonic() < stop_at:
+            redis_client.zadd(
+                EVENT_CONSUMERS_KEY, {consumer_id: time.time() + EVENT_CONSUMER_LEASE_SECONDS}
+            )
+            events = pop_event_batch(
+                redis_client,
+                processing_key,
+                # BLMOVE treats 0 as "block forever"
+                block_seconds=max(0.01, min(EVENT_IDLE_BLOCK_SECONDS, stop_at - time.monotonic()))
+            )
+            if not events:
+                continue
+
+            summary = process_event_batch(events, db, redis_client)
+            ack_event_batch(redis_client, processing_key)
+            totals["batches"] += 1
+            for key, value in summary.items():
+                totals[key] += value
+
+        # Run over: nothing left in flight
+        redis_client.zrem(EVENT_CONSUMERS_KEY, consumer_id)
+
+        if totals["batches"] or totals["recovered"]:
+            logger.info(f"[WORK-EVT-01] Event consumer run complete: {totals}")
+        return totals
+
+    finally:
+        db.close()
+
+
 def handle_spot_interruption(
     detail: Dict[str, Any],
     db: Session,
@@ -152,7 +540,7 @@ def handle_spot_interruption(
         region = availability_zone[:-1]  # Remove AZ letter
 
         # Flag this instance pool as risky in Global Risk Tracker
-        risk_tracker = get_risk_tracker(db, redis_client)
+        risk_tracker = get_risk_tracker(redis_client)
         risk_tracker.flag_risky_pool(
             instance_type=instance_type,
             availability_zone=availability_zone,
@@ -170,6 +558,18 @@ def handle_spot_interruption(
             f"(Global Risk Tracker updated)"
         )
 
+        actions_taken = ["flagged_risky_pool"]
+
+        # Patch stored action plans that launch into this pool
+        try:
+            reevaluate_action_plans.delay(
+                availability_zone=availability_zone,
+                instance_type=instance_type
+            )
+            actions_taken.append("queued_plan_reevaluation")
+        except Exception as e:
+            logger.error(f"[WORK-EVT-01] Could not queue plan re-evaluation: {str(e)}")
+
         # Trigger node drain (graceful pod eviction)
         # In production, this would use Kubernetes client to cordon + drain
         logger.info(f"[WORK-EVT-01] Triggering node drain for {instance_id}")
@@ -185,28 +585,33 @@ def handle_spot_interruption(
             "severity": "high"
         })
 
-        # Log action
-        action_log = ActionLog(
-            action_type="SPOT_INTERRUPTION_HANDLED",
-            status="completed",
-            details={
-                "instance_id": instance_id,
-                "instance_type": instance_type,
-                "availability_zone": availability_zone,
-                "action": instance_action
-            }
-        )
-        db.add(action_log)
-        db.commit()
+        actions_taken += ["triggered_node_drain", "sent_webhook"]
+
+        # Audit trail; a failed write does not undo the handling above
+        try:
+            db.add(AuditLog(
+                actor_id="system",
+                actor_name="event-processor",
+                event="SPOT_INTERRUPTION_HANDLED",
+                resource=str(instance_id),
+                resource_type=ResourceType.INSTANCE,
+                outcome=AuditOutcome.SUCCESS,
+                diff_after={
+                    "instance_id": instance_id,
+                    "instance_type": instance_type,
+                    "availability_zone": availability_zone,
+                    "action": instance_action
+                }
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[WORK-EVT-01] Error logging Spot interruption: {str(e)}")
 
         return {
             "status": "handled",
             "instance_id": instance_id,
-            "actions_taken": [
-                "flagged_risky_pool",
-                "triggered_node_drain",
-                "sent_webhook"
-            ]
+            "actions_taken": actions_taken
         }
 
     except Exception as e:
@@ -220,17 +625,25 @@ def handle_spot_interruption(
 def handle_instance_state_change(
     detail: Dict[str, Any],
     db: Session,
-    redis_client
+    redis_client,
+    aws_account_id: Optional[str] = None,
+    region: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Handle EC2 Instance State Change event
 
     Tracks instance lifecycle: pending -> running -> stopping -> stopped -> terminated
 
+    The instance inventory is updated from the event (launches added,
+    stops and terminations removed); the hourly discovery scan only
+    reconciles what events missed.
+
     Args:
         detail: Event detail payload
         db: Database session
         redis_client: Redis client
+        aws_account_id: AWS account from the event envelope
+        region: Region from the event envelope
 
     Returns:
         Dict with handling result
@@ -244,6 +657,19 @@ def handle_instance_state_change(
     instance_key = f"instance_state:{instance_id}"
     redis_client.setex(instance_key, 86400, state)  # Cache for 24 hours
 
+    # Keep the instance inventory current without waiting for discovery
+    try:
+        inventory = apply_instance_state_change(db, aws_account_id, region, instance_id, state)["inventory"]
+    except ClientError as e:
+        db.rollback()
+        logger.error(f"[WORK-EVT-01] Inventory update failed for {instance_id}: {str(e)}")
+        inventory = "error"
+
+    # Wake the Spot fulfillment loop if a pending replacement is waiting on it
+    tracker = get_spot_fulfillment_tracker(db, redis_client)
+    if tracker.notify_instance_state(instance_id, state):
+        poll_spot_fulfillment.delay()
+
     # If instance terminated unexpectedly, investigate
     if state == 'terminated':
         logger.warning(f"[WORK-EVT-01] Instance {instance_id} terminated - investigating")
@@ -269,7 +695,8 @@ def handle_instance_state_change(
     return {
         "status": "handled",
         "instance_id": instance_id,
-        "state": state
+        "state": state,
+        "inventory": inventory
     }
 
 
@@ -347,7 +774,10 @@ def generate_event_id(event_data: Dict[str, Any]) -> str:
     """
     Generate unique event ID for deduplication
 
-    Uses hash of event content to detect duplicates
+    EventBridge assigns every event an `id` that is kept across delivery
+    retries, so it is used as-is. Payloads without one are fingerprinted
+    with a fast non-cryptographic 64-bit hash (xxh3) of their canonical
+    JSON.
 
     Args:
         event_data: Event payload
@@ -355,25 +785,34 @@ def generate_event_id(event_data: Dict[str, Any]) -> str:
     Returns:
         Event ID string
     """
-    # Create deterministic hash of event
-    event_str = json.dumps(event_data, sort_keys=True)
-    event_hash = hashlib.sha256(event_str.encode()).hexdigest()[:16]
+    event_id = event_data.get('id')
+    if isinstance(event_id, str) and 0 < len(event_id) <= 64:
+        return event_id
 
-    return event_hash
+    event_str = json.dumps(event_data, sort_keys=True, separators=(',', ':'), default=str)
+    return _payload_digest(event_str.encode())
 
 
-def is_duplicate_event(event_id: str, redis_client) -> bool:
+def _event_key(event_id: str) -> str:
+    return f"event:{event_id}"
+
+
+def claim_event(event_id: str, redis_client) -> bool:
     """
-    Check if event was already processed
+    Claim an event for processing
+
+    A single SET NX EX marks the event as processed only if no one did
+    before, so of several workers receiving the same event exactly one
+    gets True.
 
     Args:
         event_id: Event ID
         redis_client: Redis client
 
     Returns:
-        True if duplicate, False otherwise
+        True if this caller should process the event, False if duplicate
     """
-    return redis_client.exists(f"event:{event_id}")
+    return bool(redis_client.set(_event_key(event_id), "processed", nx=True, ex=EVENT_DEDUP_TTL_SECONDS))
 
 
 def send_webhook_notification(payload: Dict[str, Any]) -> None:
@@ -396,7 +835,8 @@ def send_webhook_notification(payload: Dict[str, Any]) -> None:
 def log_event(
     event_data: Dict[str, Any],
     result: Dict[str, Any],
-    db: Session
+    db: Session,
+    event_id: Optional[str] = None
 ) -> None:
     """
     Log event to database for audit trail
@@ -405,9 +845,11 @@ def log_event(
         event_data: Original event data
         result: Processing result
         db: Database session
+        event_id: Deduplication ID of the event
     """
     try:
         cluster_event = ClusterEvent(
+            event_id=event_id,
             event_type=event_data.get('detail-type', 'unknown'),
             event_source=event_data.get('source', 'unknown'),
             event_data=event_data,
@@ -2,15 +2,17 @@
 Hibernation Worker (WORK-HIB-01)
 Schedule-based cluster hibernation and wake-up management
 
-Runs every 1 minute to check hibernation schedules and trigger sleep/wake actions.
+Runs every 1 minute to pop due schedule transitions and trigger sleep/wake actions.
 Includes pre-warm logic to boot clusters 30 minutes before scheduled wake time.
 
 Key Features:
 - Timezone-aware schedule processing
+- Next-transition timer wheel (per-tick cost proportional to due transitions)
 - 168-hour weekly schedule matrix support
 - Pre-warm cluster boot (30 min before wake)
 - AWS Auto Scaling Group integration
 - Graceful shutdown with pod eviction
+- Batched, concurrent ASG updates for transitions due in the same minute
 
 Dependencies:
 - Celery for task scheduling
@@ -20,11 +22,13 @@ Dependencies:
 """
 
 import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-import pytz
+from typing import Dict, Any, List, Optional, Tuple
 from celery import Task
-import boto3
 from botocore.exceptions import ClientError
 
 from sqlalchemy.orm import Session
@@ -36,13 +40,37 @@ from backend.models.cluster import Cluster
 from backend.models.hibernation_schedule import HibernationSchedule
 from backend.models.account import Account
 from backend.models.cluster_policy import ClusterPolicy
-from backend.models.audit_log import AuditLog
+from backend.models.audit_log import AuditLog, AuditOutcome, ResourceType
 from backend.core.redis_client import get_redis_client
+from backend.core.aws_session import get_aws_client_pool
+from backend.core.hibernation_timer import get_hibernation_timer
 
 logger = logging.getLogger(__name__)
 
-# Pre-warm time: Boot cluster this many minutes before scheduled wake
-PREWARM_MINUTES = 30
+# Concurrent ASG updates per batch, and per (account, region) to stay
+# under the Auto Scaling API rate limits
+HIBERNATION_MAX_WORKERS = 32
+ASG_CONCURRENCY_PER_REGION = 8
+
+# Throttled ASG calls are retried with jittered exponential backoff
+ASG_RETRY_ATTEMPTS = 5
+ASG_BACKOFF_BASE_SECONDS = 0.5
+ASG_BACKOFF_MAX_SECONDS = 8
+
+# Updates still running after this long are reported as failed (and retried)
+HIBERNATION_BATCH_TIMEOUT_SECONDS = 45
+
+# Nodes to wake to when the policy config sets no min_nodes
+DEFAULT_WAKE_NODES = 3
+
+_THROTTLE_CODES = ("Throttling", "ThrottlingException", "RequestLimitExceeded", "TooManyRequestsException")
+
+# Per action: cached cluster states that make it a no-op, state it sets,
+# summary counter and audit log event
+_SETTLED_STATES = {"SLEEP": ("SLEEPING",), "WAKE": ("AWAKE",), "PREWARM": ("PREWARM", "AWAKE")}
+_CLUSTER_STATES = {"SLEEP": "SLEEPING", "WAKE": "AWAKE", "PREWARM": "PREWARM"}
+_RESULT_COUNTERS = {"SLEEP": "sleep_triggered", "WAKE": "wake_triggered", "PREWARM": "prewarm_triggered"}
+_ACTION_LOG_TYPES = {"SLEEP": "HIBERNATE", "WAKE": "WAKE", "PREWARM": "PREWARM"}
 
 
 @app.task(bind=True, name="workers.hibernation.check_schedules")
@@ -50,22 +78,20 @@ def hibernation_scheduler_loop(self: Task) -> Dict[str, Any]:
     """
     Main hibernation scheduler loop - runs every 1 minute
 
-    Checks all active hibernation schedules and triggers sleep/wake actions
-    based on current time and schedule matrix.
+    Pops the schedule transitions that are due from the hibernation timer
+    (WORK-HIB-01 timer wheel), applies them as one batch and queues each
+    schedule's next transition. Ticks with nothing due cost one Redis call.
 
     Returns:
         Dict with execution summary
     """
-    logger.info("[WORK-HIB-01] Starting hibernation schedule check")
-
     db = next(get_db())
     redis_client = get_redis_client()
 
     try:
-        # Query all enabled hibernation schedules
-        schedules = db.query(HibernationSchedule).filter(
-            HibernationSchedule.enabled == True
-        ).all()
+        timer = get_hibernation_timer(db, redis_client)
+        now = time.time()
+        timer.ensure_built(now)
 
         results = {
             "checked": 0,
@@ -75,23 +101,66 @@ def hibernation_scheduler_loop(self: Task) -> Dict[str, Any]:
             "errors": 0
         }
 
-        for schedule in schedules:
-            try:
-                results["checked"] += 1
+        due = timer.pop_due(now)
+        if not due:
+            return results
 
-                # Process this schedule
-                action = process_schedule(schedule, db, redis_client)
+        logger.info(f"[WORK-HIB-01] {len(due)} hibernation transitions due")
 
-                if action == "SLEEP":
-                    results["sleep_triggered"] += 1
-                elif action == "WAKE":
-                    results["wake_triggered"] += 1
-                elif action == "PREWARM":
-                    results["prewarm_triggered"] += 1
+        schedules = {
+            str(schedule.id): schedule
+            for schedule in db.query(HibernationSchedule).filter(
+                HibernationSchedule.id.in_([schedule_id for schedule_id, _ in due])
+            ).all()
+        }
+        clusters = {
+            str(cluster.id): cluster
+            for cluster in db.query(Cluster).filter(
+                Cluster.id.in_({schedule.cluster_id for schedule in schedules.values()})
+            ).all()
+        } if schedules else {}
+
+        # Schedules deleted since they were queued give up their lease
+        for schedule_id, _ in due:
+            if schedule_id not in schedules:
+                timer.unschedule(schedule_id)
+
+        # Current cluster states in one round trip
+        due_schedules = [
+            (schedules[schedule_id], action)
+            for schedule_id, action in due
+            if schedule_id in schedules
+        ]
+        cached_states = redis_client.mget([
+            f"cluster_state:{schedule.cluster_id}" for schedule, _ in due_schedules
+        ]) if due_schedules else []
+
+        transitions = []
+        for (schedule, action), cached_state in zip(due_schedules, cached_states):
+            results["checked"] += 1
+            cluster = clusters.get(str(schedule.cluster_id))
+            if not cluster:
+                logger.warning(f"[WORK-HIB-01] Cluster {schedule.cluster_id} not found")
+                timer.advance(schedule, now)
+            elif cached_state in _SETTLED_STATES[action]:
+                # Already there (e.g. reconcile after an edit)
+                timer.advance(schedule, now)
+            else:
+                transitions.append((schedule, cluster, action))
 
-            except Exception as e:
-                logger.error(f"[WORK-HIB-01] Error processing schedule {schedule.id}: {str(e)}")
+        outcomes = execute_transitions(transitions, db)
+
+        pipe = redis_client.pipeline()
+        for (schedule, cluster, action), outcome in zip(transitions, outcomes):
+            if outcome["status"] != "completed":
                 results["errors"] += 1
+                timer.retry(str(schedule.id), action, now)
+                continue
+
+            pipe.setex(f"cluster_state:{cluster.id}", 3600, _CLUSTER_STATES[action])
+            results[_RESULT_COUNTERS[action]] += 1
+            timer.advance(schedule, now)
+        pipe.execute()
 
         logger.info(f"[WORK-HIB-01] Schedule check complete: {results}")
         return results
@@ -103,181 +172,244 @@ def hibernation_scheduler_loop(self: Task) -> Dict[str, Any]:
         db.close()
 
 
-def process_schedule(
-    schedule: HibernationSchedule,
-    db: Session,
-    redis_client
-) -> Optional[str]:
+def execute_transitions(
+    transitions: List[Tuple[HibernationSchedule, Cluster, str]],
+    db: Session
+) -> List[Dict[str, Any]]:
     """
-    Process a single hibernation schedule
+    Apply many sleep/wake/pre-warm transitions at once
+
+    Accounts and cluster policies are loaded in one query each, one pooled
+    ASG client is used per (account, region), and the ASG updates run on a
+    bounded thread pool with at most ASG_CONCURRENCY_PER_REGION calls in
+    flight per (account, region). Throttled calls back off and retry. All
+    audit log rows are written in one insert. A transition that cannot be
+    prepared (missing account, bad policy config, client error) fails on
+    its own without affecting the rest of the batch.
+
+    Steps per cluster:
+    - SLEEP: desired capacity and min size to 0 (1 unless the policy config
+      sets allow_zero_nodes)
+    - WAKE / PREWARM: desired capacity to the policy config's min_nodes
+      (DEFAULT_WAKE_NODES if unset); PREWARM is a wake issued before the
+      scheduled wake time
 
     Args:
-        schedule: HibernationSchedule database record
+        transitions: (schedule, cluster, action) tuples, action being
+                     "SLEEP", "WAKE" or "PREWARM"
         db: Database session
-        redis_client: Redis client
 
     Returns:
-        Action taken: "SLEEP", "WAKE", "PREWARM", or None
+        Per transition (same order): {"cluster_id", "action", "status"
+        ("completed" | "failed"), "asg_name", "capacity", "attempts", "error"}
     """
-    # Get cluster
-    cluster = db.query(Cluster).filter(Cluster.id == schedule.cluster_id).first()
-    if not cluster:
-        logger.warning(f"[WORK-HIB-01] Cluster {schedule.cluster_id} not found")
-        return None
-
-    # Convert current time to schedule's timezone
-    tz = pytz.timezone(schedule.timezone)
-    current_time = datetime.now(pytz.UTC).astimezone(tz)
-
-    # Get current day and hour (0-6 for Mon-Sun, 0-23 for hours)
-    current_day = current_time.weekday()  # Monday = 0, Sunday = 6
-    current_hour = current_time.hour
-
-    # Calculate index in 168-hour matrix (7 days * 24 hours)
-    matrix_index = (current_day * 24) + current_hour
-
-    # Parse schedule matrix (168 bits: 1 = awake, 0 = sleep)
-    # Format: "111111111111111111111111000000001111111111111111..." (168 chars)
-    if len(schedule.schedule_matrix) != 168:
-        logger.error(f"[WORK-HIB-01] Invalid schedule matrix for {schedule.id}")
-        return None
-
-    current_state = schedule.schedule_matrix[matrix_index]
-    should_be_awake = (current_state == '1')
-
-    # Check pre-warm window (30 minutes before wake time)
-    prewarm_index = (matrix_index + 1) % 168  # Next hour
-    next_hour_state = schedule.schedule_matrix[prewarm_index]
-    next_hour_awake = (next_hour_state == '1')
-
-    # Check if we're 30 minutes before wake time
-    current_minute = current_time.minute
-    is_prewarm_window = (current_minute >= 30 and not should_be_awake and next_hour_awake)
-
-    # Get cluster's current state from Redis cache
-    cluster_state_key = f"cluster_state:{cluster.id}"
-    cached_state = redis_client.get(cluster_state_key)
-
-    # Determine action needed
-    if is_prewarm_window and cached_state != b"PREWARM":
-        logger.info(f"[WORK-HIB-01] Pre-warming cluster {cluster.name} (boots in 30 min)")
-        trigger_prewarm(cluster, schedule, db)
-        redis_client.setex(cluster_state_key, 3600, "PREWARM")
-        return "PREWARM"
-
-    elif should_be_awake and cached_state != b"AWAKE":
-        logger.info(f"[WORK-HIB-01] Waking cluster {cluster.name}")
-        trigger_wake(cluster, schedule, db)
-        redis_client.setex(cluster_state_key, 3600, "AWAKE")
-        return "WAKE"
+    if not transitions:
+        return []
+
+    started = time.time()
+    account_ids = {cluster.account_id for _, cluster, _ in transitions}
+    accounts = {
+        account.id: account
+        for account in db.query(Account).filter(Account.id.in_(account_ids)).all()
+    }
+    policies = {
+        policy.cluster_id: policy
+        for policy in db.query(ClusterPolicy).filter(
+            ClusterPolicy.cluster_id.in_({cluster.id for _, cluster, _ in transitions})
+        ).all()
+    }
 
-    elif not should_be_awake and cached_state != b"SLEEPING":
-        logger.info(f"[WORK-HIB-01] Sleeping cluster {cluster.name}")
-        trigger_sleep(cluster, schedule, db)
-        redis_client.setex(cluster_state_key, 3600, "SLEEPING")
-        return "SLEEP"
+    outcomes: List[Dict[str, Any]] = []
+    jobs = []
+    clients = {}
+    slots: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
 
-    return None
+    for index, (schedule, cluster, action) in enumerate(transitions):
+        # Note: In real implementation, we'd need to find the ASG name from cluster tags
+        # For now, assume ASG name matches cluster name
+        asg_name = f"{cluster.name}-node-group"
+        outcome = {
+            "cluster_id": cluster.id,
+            "action": action,
+            "status": "failed",
+            "asg_name": asg_name,
+            "capacity": None,
+            "attempts": 0,
+            "error": None
+        }
+        outcomes.append(outcome)
 
+        try:
+            policy = policies.get(cluster.id)
+            config = (policy.config or {}) if policy else {}
 
-def trigger_sleep(
-    cluster: Cluster,
-    schedule: HibernationSchedule,
-    db: Session
-) -> None:
-    """
-    Trigger cluster sleep action
+            if action == "SLEEP":
+                capacity = 0 if config.get("allow_zero_nodes", False) else 1
+                params = {"DesiredCapacity": capacity, "MinSize": capacity}
+            else:
+                capacity = int(config.get("min_nodes", DEFAULT_WAKE_NODES))
+                params = {"DesiredCapacity": capacity}
+            outcome["capacity"] = capacity
+
+            account = accounts.get(cluster.account_id)
+            if not account:
+                outcome["error"] = f"Account {cluster.account_id} not found"
+                continue
+
+            group = (account.id, cluster.region)
+            if group not in clients:
+                # ASG client for the account's assumed role (pooled)
+                clients[group] = get_aws_client_pool().get_client(
+                    'autoscaling',
+                    cluster.region,
+                    role_arn=account.role_arn,
+                    external_id=account.external_id,
+                    session_name=f"SpotOptimizer-Hibernation-{account.id}"
+                )
+                slots[group] = threading.BoundedSemaphore(ASG_CONCURRENCY_PER_REGION)
+        except Exception as e:
+            logger.error(f"[WORK-HIB-01] Cannot prepare {action} for cluster {cluster.id}: {str(e)}")
+            outcome["error"] = str(e)
+            continue
+
+        jobs.append((index, group, asg_name, params))
+
+    def run(group: Tuple[str, str], asg_name: str, params: Dict[str, Any]) -> Tuple[str, int]:
+        with slots[group]:
+            return _update_asg(clients[group], asg_name, params)
+
+    if jobs:
+        pool = ThreadPoolExecutor(max_workers=min(HIBERNATION_MAX_WORKERS, len(jobs)))
+        futures = {
+            pool.submit(run, group, asg_name, params): index
+            for index, group, asg_name, params in jobs
+        }
+        done, pending = wait(futures, timeout=HIBERNATION_BATCH_TIMEOUT_SECONDS)
 
-    Steps:
-    1. Cordon all nodes (prevent new pod scheduling)
-    2. Evict non-critical pods gracefully
-    3. Update ASG desired capacity to minimum (or 0)
-    4. Log action to database
-    """
-    logger.info(f"[WORK-HIB-01] Executing sleep for cluster {cluster.name}")
+        for future in done:
+            outcome = outcomes[futures[future]]
+            try:
+                result, attempts = future.result()
+                outcome["attempts"] = attempts
+                outcome["status"] = "completed"
+                if result == "not_found":
+                    logger.warning(f"[WORK-HIB-01] ASG {outcome['asg_name']} not found, skipping")
+            except Exception as e:
+                outcome["error"] = str(e)
 
-    try:
-        # Get cluster's AWS account credentials
-        account = db.query(Account).filter(Account.id == cluster.account_id).first()
-        if not account:
-            raise ValueError(f"Account {cluster.account_id} not found")
-
-        # Assume IAM role
-        sts_client = boto3.client('sts')
-        assumed_role = sts_client.assume_role(
-            RoleArn=account.role_arn,
-            RoleSessionName=f"SpotOptimizer-Hibernation-{cluster.id}",
-            ExternalId=account.external_id
-        )
+        for future in pending:
+            outcomes[futures[future]]["error"] = (
+                f"Timed out after {HIBERNATION_BATCH_TIMEOUT_SECONDS}s"
+            )
 
-        credentials = assumed_role['Credentials']
+        # Threads of timed-out updates are abandoned rather than joined
+        pool.shutdown(wait=not pending)
 
-        # Create ASG client
-        asg_client = boto3.client(
-            'autoscaling',
-            region_name=cluster.region,
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
+    _log_transitions(transitions, outcomes, db)
 
-        # Get cluster policy for min nodes
-        policy = db.query(ClusterPolicy).filter(
-            ClusterPolicy.cluster_id == cluster.id
-        ).first()
+    failed = sum(1 for outcome in outcomes if outcome["status"] != "completed")
+    logger.info(
+        f"[WORK-HIB-01] Applied {len(transitions)} hibernation transitions "
+        f"across {len(clients)} account/region(s) in {time.time() - started:.1f}s "
+        f"({failed} failed)"
+    )
+    return outcomes
 
-        min_capacity = 0 if policy and policy.allow_zero_nodes else 1
 
-        # Update ASG desired capacity
-        # Note: In real implementation, we'd need to find the ASG name from cluster tags
-        # For now, assume ASG name matches cluster name
-        asg_name = f"{cluster.name}-node-group"
+def _update_asg(asg_client, asg_name: str, params: Dict[str, Any]) -> Tuple[str, int]:
+    """
+    Update one ASG, backing off on throttling
 
+    Returns:
+        ("updated" | "not_found", attempts)
+    """
+    for attempt in range(1, ASG_RETRY_ATTEMPTS + 1):
         try:
-            asg_client.update_auto_scaling_group(
-                AutoScalingGroupName=asg_name,
-                DesiredCapacity=min_capacity,
-                MinSize=min_capacity
-            )
-            logger.info(f"[WORK-HIB-01] Updated ASG {asg_name} to capacity {min_capacity}")
+            asg_client.update_auto_scaling_group(AutoScalingGroupName=asg_name, **params)
+            return "updated", attempt
         except ClientError as e:
-            if e.response['Error']['Code'] == 'ValidationError':
-                logger.warning(f"[WORK-HIB-01] ASG {asg_name} not found, skipping")
-            else:
+            code = e.response['Error']['Code']
+            if code == 'ValidationError':
+                return "not_found", attempt
+            if code not in _THROTTLE_CODES or attempt == ASG_RETRY_ATTEMPTS:
                 raise
+            # Full jitter keeps a storm of clusters from retrying in lockstep
+            delay = min(ASG_BACKOFF_BASE_SECONDS * (2 ** (attempt - 1)), ASG_BACKOFF_MAX_SECONDS)
+            time.sleep(random.uniform(0, delay))
 
-        # Log action
-        action_log = ActionLog(
-            cluster_id=cluster.id,
-            action_type="HIBERNATE",
-            status="completed",
-            details={
-                "schedule_id": str(schedule.id),
-                "asg_name": asg_name,
-                "desired_capacity": min_capacity
-            }
-        )
-        db.add(action_log)
-        db.commit()
+    return "updated", ASG_RETRY_ATTEMPTS
 
-        logger.info(f"[WORK-HIB-01] Sleep action completed for {cluster.name}")
 
-    except Exception as e:
-        logger.error(f"[WORK-HIB-01] Error executing sleep: {str(e)}")
-
-        # Log failed action
-        action_log = ActionLog(
-            cluster_id=cluster.id,
-            action_type="HIBERNATE",
-            status="failed",
-            details={
-                "error": str(e),
-                "schedule_id": str(schedule.id)
+def _log_transitions(
+    transitions: List[Tuple[HibernationSchedule, Cluster, str]],
+    outcomes: List[Dict[str, Any]],
+    db: Session
+) -> None:
+    """Record all transitions of a batch as audit log rows in one insert"""
+    try:
+        logs = []
+        for (schedule, cluster, action), outcome in zip(transitions, outcomes):
+            details = {
+                # Manual transitions run with an unsaved schedule
+                "schedule_id": str(schedule.id) if schedule.id else None,
+                "status": outcome["status"],
+                "asg_name": outcome["asg_name"],
+                "desired_capacity": outcome["capacity"]
             }
-        )
-        db.add(action_log)
+            if action == "PREWARM":
+                details["prewarm"] = True
+            if outcome["error"]:
+                details["error"] = outcome["error"]
+
+            logs.append(AuditLog(
+                actor_id="system",
+                actor_name="hibernation-scheduler",
+                event=_ACTION_LOG_TYPES[action],
+                resource=str(cluster.id),
+                resource_type=ResourceType.HIBERNATION,
+                outcome=(
+                    AuditOutcome.SUCCESS if outcome["status"] == "completed"
+                    else AuditOutcome.FAILURE
+                ),
+                diff_after=details
+            ))
+
+        db.add_all(logs)
         db.commit()
-        raise
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[WORK-HIB-01] Error logging hibernation actions: {str(e)}")
+
+
+def _trigger(
+    cluster: Cluster,
+    schedule: HibernationSchedule,
+    db: Session,
+    action: str
+) -> None:
+    outcome = execute_transitions([(schedule, cluster, action)], db)[0]
+    if outcome["status"] != "completed":
+        logger.error(f"[WORK-HIB-01] Error executing {action.lower()}: {outcome['error']}")
+        raise RuntimeError(outcome["error"])
+    logger.info(f"[WORK-HIB-01] {action.capitalize()} action completed for {cluster.name}")
+
+
+def trigger_sleep(
+    cluster: Cluster,
+    schedule: HibernationSchedule,
+    db: Session
+) -> None:
+    """
+    Trigger cluster sleep action
+
+    Steps:
+    1. Cordon all nodes (prevent new pod scheduling)
+    2. Evict non-critical pods gracefully
+    3. Update ASG desired capacity to minimum (or 0)
+    4. Log action to database
+    """
+    logger.info(f"[WORK-HIB-01] Executing sleep for cluster {cluster.name}")
+    _trigger(cluster, schedule, db, "SLEEP")
 
 
 def trigger_wake(
@@ -295,86 +427,7 @@ def trigger_wake(
     4. Log action to database
     """
     logger.info(f"[WORK-HIB-01] Executing wake for cluster {cluster.name}")
-
-    try:
-        # Get cluster's AWS account credentials
-        account = db.query(Account).filter(Account.id == cluster.account_id).first()
-        if not account:
-            raise ValueError(f"Account {cluster.account_id} not found")
-
-        # Assume IAM role
-        sts_client = boto3.client('sts')
-        assumed_role = sts_client.assume_role(
-            RoleArn=account.role_arn,
-            RoleSessionName=f"SpotOptimizer-Wake-{cluster.id}",
-            ExternalId=account.external_id
-        )
-
-        credentials = assumed_role['Credentials']
-
-        # Create ASG client
-        asg_client = boto3.client(
-            'autoscaling',
-            region_name=cluster.region,
-            aws_access_key_id=credentials['AccessKeyId'],
-            aws_secret_access_key=credentials['SecretAccessKey'],
-            aws_session_token=credentials['SessionToken']
-        )
-
-        # Get cluster policy for desired node count
-        policy = db.query(ClusterPolicy).filter(
-            ClusterPolicy.cluster_id == cluster.id
-        ).first()
-
-        desired_capacity = policy.min_nodes if policy else 3
-
-        # Update ASG desired capacity
-        asg_name = f"{cluster.name}-node-group"
-
-        try:
-            asg_client.update_auto_scaling_group(
-                AutoScalingGroupName=asg_name,
-                DesiredCapacity=desired_capacity
-            )
-            logger.info(f"[WORK-HIB-01] Updated ASG {asg_name} to capacity {desired_capacity}")
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'ValidationError':
-                logger.warning(f"[WORK-HIB-01] ASG {asg_name} not found, skipping")
-            else:
-                raise
-
-        # Log action
-        action_log = ActionLog(
-            cluster_id=cluster.id,
-            action_type="WAKE",
-            status="completed",
-            details={
-                "schedule_id": str(schedule.id),
-                "asg_name": asg_name,
-                "desired_capacity": desired_capacity
-            }
-        )
-        db.add(action_log)
-        db.commit()
-
-        logger.info(f"[WORK-HIB-01] Wake action completed for {cluster.name}")
-
-    except Exception as e:
-        logger.error(f"[WORK-HIB-01] Error executing wake: {str(e)}")
-
-        # Log failed action
-        action_log = ActionLog(
-            cluster_id=cluster.id,
-            action_type="WAKE",
-            status="failed",
-            details={
-                "error": str(e),
-                "schedule_id": str(schedule.id)
-            }
-        )
-        db.add(action_log)
-        db.commit()
-        raise
+    _trigger(cluster, schedule, db, "WAKE")
 
 
 def trigger_prewarm(
@@ -391,27 +444,7 @@ def trigger_prewarm(
     This is essentially the same as wake, but logged differently.
     """
     logger.info(f"[WORK-HIB-01] Pre-warming cluster {cluster.name}")
-
-    try:
-        # Pre-warm is identical to wake, just triggers earlier
-        trigger_wake(cluster, schedule, db)
-
-        # Update log to reflect pre-warm
-        latest_log = db.query(ActionLog).filter(
-            ActionLog.cluster_id == cluster.id,
-            ActionLog.action_type == "WAKE"
-        ).order_by(ActionLog.created_at.desc()).first()
-
-        if latest_log:
-            latest_log.action_type = "PREWARM"
-            latest_log.details["prewarm"] = True
-            db.commit()
-
-        logger.info(f"[WORK-HIB-01] Pre-warm completed for {cluster.name}")
-
-    except Exception as e:
-        logger.error(f"[WORK-HIB-01] Error executing pre-warm: {str(e)}")
-        raise
+    _trigger(cluster, schedule, db, "PREWARM")
 
 
 @app.task(bind=True, name="workers.hibernation.manual_sleep")
@@ -438,9 +471,9 @@ def manual_sleep_cluster(self: Task, cluster_id: str) -> Dict[str, Any]:
         # Create dummy schedule for logging
         dummy_schedule = HibernationSchedule(
             cluster_id=cluster_id,
-            schedule_matrix="0" * 168,  # All sleep
+            schedule_matrix=[0] * 168,  # All sleep
             timezone="UTC",
-            enabled=False
+            is_active="N"
         )
 
         trigger_sleep(cluster, dummy_schedule, db)
@@ -490,9 +523,9 @@ def manual_wake_cluster(self: Task, cluster_id: str) -> Dict[str, Any]:
         # Create dummy schedule for logging
         dummy_schedule = HibernationSchedule(
             cluster_id=cluster_id,
-            schedule_matrix="1" * 168,  # All awake
+            schedule_matrix=[1] * 168,  # All awake
             timezone="UTC",
-            enabled=False
+            is_active="N"
         )
 
         trigger_wake(cluster, dummy_schedule, db)
@@ -14,7 +14,11 @@ from backend.core.redis_client import get_redis_client
 from backend.models.optimization_job import OptimizationJob
 from backend.models.cluster_policy import ClusterPolicy
 from backend.modules import get_spot_optimizer, get_bin_packer
+from backend.modules.savings_rollup import record_job_savings
 from backend.models.cluster import Cluster
+from backend.core.decision_engine import get_decision_engine
+from backend.core.action_executor import get_action_executor
+from backend.core.spot_fulfillment import get_spot_fulfillment_tracker
 
 logger = logging.getLogger(__name__)
 
@@ -119,6 +123,14 @@ def optimize_cluster(self: Task, job_id: str, cluster_id: str) -> Dict[str, Any]
         job.results = action_plan
         db.commit()
 
+        # Fold the plan into the daily savings rollup; a failure here leaves
+        # the job completed and is repaired by the rollup rebuild
+        try:
+            record_job_savings(db, job)
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[WORK-OPT-01] Savings rollup update failed for job {job_id}: {str(e)}")
+
         logger.info(f"[WORK-OPT-01] Optimization complete: {len(action_plan['actions'])} actions")
 
         return {
@@ -137,3 +149,158 @@ def optimize_cluster(self: Task, job_id: str, cluster_id: str) -> Dict[str, Any]
 
     finally:
         db.close()
+
+
+@app.task(bind=True, name="workers.optimization.evaluate_fleet")
+def evaluate_fleet_plans(
+    self: Task,
+    proposed_actions_by_cluster: Dict[str, Any],
+    job_id: str = None
+) -> Dict[str, Any]:
+    """
+    Evaluate proposed action plans for many clusters in a single task
+
+    Used by fleet-wide optimization sweeps instead of enqueuing one
+    evaluation task per cluster.
+
+    Args:
+        proposed_actions_by_cluster: Dict of cluster UUID -> proposed actions
+        job_id: Optional optimization job UUID
+
+    Returns:
+        Per-cluster evaluation results (see DecisionEngine.evaluate_fleet)
+    """
+    logger.info(
+        f"[WORK-OPT-01] Evaluating fleet plan for "
+        f"{len(proposed_actions_by_cluster)} clusters"
+    )
+
+    db = next(get_db())
+    redis_client = get_redis_client()
+
+    try:
+        engine = get_decision_engine(db, redis_client)
+        return engine.evaluate_fleet(proposed_actions_by_cluster, job_id=job_id)
+
+    finally:
+        db.close()
+
+
+@app.task(bind=True, name="workers.optimization.reevaluate_plans")
+def reevaluate_action_plans(
+    self: Task,
+    cluster_id: str = None,
+    availability_zone: str = None,
+    instance_type: str = None
+) -> Dict[str, Any]:
+    """
+    Incrementally re-evaluate stored action plans after a policy or risk change
+
+    Pass cluster_id after a policy edit, or availability_zone and
+    instance_type after a pool is flagged by the Global Risk Tracker.
+
+    Args:
+        cluster_id: Optional cluster UUID whose policy changed
+        availability_zone: Optional AZ of a flagged pool
+        instance_type: Optional instance type of a flagged pool
+
+    Returns:
+        {"plans_reevaluated": 2, "actions_reevaluated": 5}
+    """
+    db = next(get_db())
+    redis_client = get_redis_client()
+
+    try:
+        engine = get_decision_engine(db, redis_client)
+
+        if cluster_id:
+            result = engine.reevaluate_plan(cluster_id)
+            results = {cluster_id: result} if result else {}
+        else:
+            results = engine.reevaluate_for_pool(availability_zone, instance_type)
+
+        actions = sum(r["summary"].get("reevaluated", 0) for r in results.values())
+
+        logger.info(
+            f"[WORK-OPT-01] Re-evaluated {len(results)} plans ({actions} actions)"
+        )
+
+        return {
+            "plans_reevaluated": len(results),
+            "actions_reevaluated": actions
+        }
+
+    finally:
+        db.close()
+
+
+@app.task(bind=True, name="workers.optimization.execute_plan_phase", acks_late=True)
+def execute_plan_phase(self: Task, execution_id: str) -> Dict[str, Any]:
+    """
+    Run the due phase(s) of a persisted action plan (CORE-EXEC)
+
+    Dispatched with a countdown by ActionExecutor instead of sleeping
+    between phases, so worker slots stay free during phase delays.
+
+    Args:
+        execution_id: Plan execution UUID
+
+    Returns:
+        Execution results so far
+    """
+    logger.info(f"[WORK-OPT-01] Running next phase of execution {execution_id}")
+
+    db = next(get_db())
+    redis_client = get_redis_client()
+
+    try:
+        executor = get_action_executor(db, redis_client)
+        return executor.resume_action_plan(execution_id) or {
+            "execution_id": execution_id,
+            "status": "not_found"
+        }
+
+    finally:
+        db.close()
+
+
+@app.task(bind=True, name="workers.optimization.resume_stalled_plans")
+def resume_stalled_plans(self: Task) -> Dict[str, Any]:
+    """
+    Re-dispatch action plans whose next phase is overdue (runs every 5 min)
+
+    Returns:
+        {"resumed": 1}
+    """
+    db = next(get_db())
+    redis_client = get_redis_client()
+
+    try:
+        executor = get_action_executor(db, redis_client)
+        return {"resumed": executor.resume_stalled_plans()}
+
+    finally:
+        db.close()
+
+
+@app.task(bind=True, name="workers.optimization.poll_spot_fulfillment")
+def poll_spot_fulfillment(self: Task) -> Dict[str, Any]:
+    """
+    Check pending Spot replacement requests (CORE-EXEC)
+
+    Runs on a short beat schedule and is also dispatched by the event
+    processor when a tracked Spot instance changes state. One pass covers
+    every due request, so concurrent replacements share a single loop.
+
+    Returns:
+        {"checked": 12, "fulfilled": 3, "failed": 1, "pending": 8}
+    """
+    db = next(get_db())
+    redis_client = get_redis_client()
+
+    try:
+        tracker = get_spot_fulfillment_tracker(db, redis_client)
+        return tracker.poll()
+
+    finally:
+        db.close()
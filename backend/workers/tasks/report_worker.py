@@ -20,31 +20,44 @@ Dependencies:
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import Dict, Any, List, Optional
 import json
 from decimal import Decimal
 
-from celery import Task
+from celery import Task, chain, chord
+from celery.signals import worker_process_init
 import boto3
 from botocore.exceptions import ClientError
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy import and_, func, select
 
 from backend.workers import app
 from backend.models.base import get_db
 from backend.models.organization import Organization
 from backend.models.account import Account
 from backend.models.cluster import Cluster
-from backend.models.optimization_job import OptimizationJob
+from backend.models.optimization_job import OptimizationJob, OptimizationJobStatus
 from backend.models.audit_log import AuditLog
 from backend.models.user import User
 from backend.core.redis_client import get_redis_client
+from backend.modules.savings_rollup import load_savings_rollup, rebuild_savings_rollups
+from backend.modules.savings_export import export_filename, write_savings_csv
+from backend.modules.report_renderer import render_report_html, warm_report_templates
 
 logger = logging.getLogger(__name__)
 
 
+@worker_process_init.connect
+def _warm_report_templates(**kwargs):
+    """Compile report templates once per worker process"""
+    try:
+        warm_report_templates()
+    except Exception as e:
+        logger.warning(f"[WORK-RPT-01] Report template warm-up failed: {str(e)}")
+
+
 @app.task(bind=True, name="workers.reports.generate_weekly_report")
 def generate_weekly_report(self: Task, organization_id: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -56,77 +69,199 @@ def generate_weekly_report(self: Task, organization_id: Optional[str] = None) ->
         organization_id: If provided, generate for specific org. Otherwise, all orgs.
 
     Returns:
-        Dict with report generation summary
+        Dict with fan-out summary (see fan_out_reports())
     """
     logger.info(f"[WORK-RPT-01] Starting weekly report generation")
+    return fan_out_reports("weekly", 7, organization_id)
+
+
+def fan_out_reports(
+    report_type: str,
+    days: int,
+    organization_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Dispatch one report per organization as a chord
 
+    Each organization gets a chain of generate_org_report (aggregation and
+    rendering, "reports" queue) and deliver_report (SES, "email" queue);
+    collect_report_results runs once every chain has finished. How many
+    organizations are processed at once is capped by the concurrency of
+    the workers consuming those queues, so one slow organization or mail
+    server only holds its own slot.
+
+    Args:
+        report_type: "weekly" or "monthly"
+        days: Report period in full UTC days before today
+        organization_id: If provided, generate for specific org. Otherwise, all orgs.
+
+    Returns:
+        {"organizations": 42, "chord_id": "...", "period_start": "...", "period_end": "..."}
+    """
     db = next(get_db())
 
     try:
-        # Define report period (last 7 days)
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=7)
+        # Define report period (the full UTC days before today)
+        today = datetime.combine(datetime.utcnow().date(), time.min)
+        end_date = today - timedelta(days=1)
+        start_date = today - timedelta(days=days)
 
         # Query organizations
+        org_query = db.query(Organization.id)
         if organization_id:
-            orgs = db.query(Organization).filter(
-                Organization.id == organization_id
-            ).all()
+            org_query = org_query.filter(Organization.id == organization_id)
         else:
-            orgs = db.query(Organization).filter(
-                Organization.status == 'active'
-            ).all()
-
-        results = {
-            "reports_generated": 0,
-            "emails_sent": 0,
-            "errors": 0,
-            "total_savings": 0.0
-        }
+            org_query = org_query.filter(Organization.status == 'active')
+        org_ids = [str(org_id) for org_id, in org_query.all()]
+    finally:
+        db.close()
+
+    summary = {
+        "organizations": len(org_ids),
+        "chord_id": None,
+        "period_start": start_date.isoformat(),
+        "period_end": end_date.isoformat()
+    }
+    if not org_ids:
+        logger.info(f"[WORK-RPT-01] No organizations for {report_type} reports")
+        return summary
+
+    header = [
+        chain(
+            generate_org_report.s(org_id, report_type, start_date.isoformat(), end_date.isoformat()),
+            deliver_report.s()
+        )
+        for org_id in org_ids
+    ]
+    result = chord(header)(collect_report_results.s(report_type))
+    summary["chord_id"] = result.id
+
+    logger.info(f"[WORK-RPT-01] Dispatched {len(org_ids)} {report_type} reports (chord {result.id})")
+    return summary
+
+
+@app.task(bind=True, name="workers.reports.generate_org_report")
+def generate_org_report(
+    self: Task,
+    organization_id: str,
+    report_type: str,
+    start_date: str,
+    end_date: str
+) -> Dict[str, Any]:
+    """
+    Aggregate and render one organization's report
+
+    Failures are returned rather than raised so the chord still completes.
+
+    Args:
+        organization_id: Organization UUID
+        report_type: "weekly" or "monthly"
+        start_date: ISO period start
+        end_date: ISO period end
+
+    Returns:
+        Dict with organization_id, success, and on success subject,
+        recipients, html_content and total_savings
+    """
+    db = next(get_db())
+
+    try:
+        org = db.query(Organization).filter(Organization.id == organization_id).first()
+        if not org:
+            raise ValueError(f"Organization {organization_id} not found")
 
-        for org in orgs:
-            try:
-                # Generate report for this organization
-                report_data = aggregate_savings_data(org, start_date, end_date, db)
-
-                # Generate HTML email
-                html_content = generate_html_report(org, report_data, "weekly")
-
-                # Send email to organization admins
-                recipients = get_org_admin_emails(org, db)
-                send_result = send_report_email(
-                    recipients=recipients,
-                    subject=f"Weekly Savings Report - {org.name}",
-                    html_content=html_content,
-                    org=org
-                )
-
-                if send_result["success"]:
-                    results["emails_sent"] += len(recipients)
-                    results["reports_generated"] += 1
-                    results["total_savings"] += report_data["total_savings"]
-
-                    logger.info(
-                        f"[WORK-RPT-01] Report sent to {org.name}: "
-                        f"${report_data['total_savings']:.2f} saved"
-                    )
-                else:
-                    results["errors"] += 1
-
-            except Exception as e:
-                logger.error(f"[WORK-RPT-01] Error generating report for {org.name}: {str(e)}")
-                results["errors"] += 1
-
-        logger.info(f"[WORK-RPT-01] Weekly report generation complete: {results}")
-        return results
+        report_data = aggregate_savings_data(
+            org, datetime.fromisoformat(start_date), datetime.fromisoformat(end_date), db
+        )
+
+        return {
+            "organization_id": organization_id,
+            "success": True,
+            "subject": f"{report_type.capitalize()} Savings Report - {org.name}",
+            "recipients": get_org_admin_emails(org, db),
+            "html_content": generate_html_report(org, report_data, report_type),
+            "total_savings": report_data["total_savings"]
+        }
 
     except Exception as e:
-        logger.error(f"[WORK-RPT-01] Fatal error in report generation: {str(e)}")
-        raise
+        logger.error(f"[WORK-RPT-01] Error generating {report_type} report for org {organization_id}: {str(e)}")
+        return {
+            "organization_id": organization_id,
+            "success": False,
+            "error": str(e)
+        }
     finally:
         db.close()
 
 
+# SES allows 14 sends/s by default; per email worker
+@app.task(bind=True, name="workers.reports.deliver_report", rate_limit="10/s")
+def deliver_report(self: Task, report: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send a rendered report (second link of each report chain)
+
+    Args:
+        report: Result of generate_org_report()
+
+    Returns:
+        Dict with organization_id, success, recipients and total_savings
+    """
+    if not report.get("success"):
+        return report
+
+    result = {
+        "organization_id": report["organization_id"],
+        "recipients": len(report["recipients"]),
+        "total_savings": report["total_savings"]
+    }
+    if not report["recipients"]:
+        logger.warning(f"[WORK-RPT-01] No recipients for org {report['organization_id']}, skipping")
+        return {**result, "success": False, "error": "no recipients"}
+
+    send_result = send_report_email(
+        recipients=report["recipients"],
+        subject=report["subject"],
+        html_content=report["html_content"]
+    )
+    if send_result["success"]:
+        logger.info(
+            f"[WORK-RPT-01] Report sent to org {report['organization_id']}: "
+            f"${report['total_savings']:.2f} saved"
+        )
+    return {**result, "success": send_result["success"], "error": send_result.get("error")}
+
+
+@app.task(bind=True, name="workers.reports.collect_report_results")
+def collect_report_results(self: Task, results: List[Dict[str, Any]], report_type: str) -> Dict[str, Any]:
+    """
+    Summarize a report fan-out (chord callback)
+
+    Args:
+        results: deliver_report() results, one per organization
+        report_type: "weekly" or "monthly"
+
+    Returns:
+        Dict with report generation summary
+    """
+    summary = {
+        "reports_generated": 0,
+        "emails_sent": 0,
+        "errors": 0,
+        "total_savings": 0.0
+    }
+
+    for result in results:
+        if result.get("success"):
+            summary["reports_generated"] += 1
+            summary["emails_sent"] += result["recipients"]
+            summary["total_savings"] += result["total_savings"]
+        else:
+            summary["errors"] += 1
+
+    logger.info(f"[WORK-RPT-01] {report_type.capitalize()} report generation complete: {summary}")
+    return summary
+
+
 def aggregate_savings_data(
     org: Organization,
     start_date: datetime,
@@ -136,6 +271,12 @@ def aggregate_savings_data(
     """
     Aggregate savings data for an organization
 
+    Savings are read from the daily rollup (modules/savings_rollup.py)
+    grouped by cluster and category, so the cost depends on the number of
+    clusters and days in the period, not on the number of jobs. The period
+    covers whole UTC days, from the day of start_date to the day of
+    end_date inclusive.
+
     Args:
         org: Organization record
         start_date: Report period start
@@ -145,79 +286,51 @@ def aggregate_savings_data(
     Returns:
         Dict with aggregated savings metrics
     """
-    # Get all accounts for this organization
-    accounts = db.query(Account).filter(
-        Account.organization_id == org.id
-    ).all()
-
-    account_ids = [acc.id for acc in accounts]
-
-    # Get all clusters for these accounts
-    clusters = db.query(Cluster).filter(
-        Cluster.account_id.in_(account_ids)
-    ).all()
-
-    cluster_ids = [c.id for c in clusters]
-
-    # Query optimization jobs in date range
-    jobs = db.query(OptimizationJob).filter(
-        and_(
-            OptimizationJob.cluster_id.in_(cluster_ids),
-            OptimizationJob.created_at >= start_date,
-            OptimizationJob.created_at <= end_date,
-            OptimizationJob.status == 'completed'
-        )
-    ).all()
-
-    # Aggregate savings by category
+    start_day = start_date.date()
+    end_day = end_date.date()
+
+    grouped = load_savings_rollup(db, org.id, start_day, end_day)
+
+    total_clusters, total_jobs = db.execute(
+        select(
+            func.count(func.distinct(Cluster.id)),
+            func.count(OptimizationJob.id)
+        ).select_from(Cluster).join(
+            Account, Account.id == Cluster.account_id
+        ).outerjoin(
+            OptimizationJob,
+            and_(
+                OptimizationJob.cluster_id == Cluster.id,
+                OptimizationJob.created_at >= datetime.combine(start_day, time.min),
+                OptimizationJob.created_at < datetime.combine(end_day + timedelta(days=1), time.min),
+                OptimizationJob.status == OptimizationJobStatus.COMPLETED
+            )
+        ).where(Account.organization_id == org.id)
+    ).one()
+
+    savings_by_category = {
+        "spot_optimization": 0.0,
+        "rightsizing": 0.0,
+        "consolidation": 0.0,
+        "hibernation": 0.0
+    }
     total_savings = 0.0
-    spot_savings = 0.0
-    rightsizing_savings = 0.0
-    consolidation_savings = 0.0
-    hibernation_savings = 0.0
-
     opportunities_found = 0
     opportunities_executed = 0
-
     cluster_breakdown = {}
 
-    for job in jobs:
-        # Parse action plan from job results
-        if job.action_plan:
-            action_plan = json.loads(job.action_plan) if isinstance(job.action_plan, str) else job.action_plan
-
-            # Extract savings from action plan
-            for action in action_plan.get("actions", []):
-                savings = float(action.get("estimated_savings", 0))
-                total_savings += savings
-
-                # Categorize by action type
-                action_type = action.get("type", "")
-                if "spot" in action_type.lower():
-                    spot_savings += savings
-                elif "resize" in action_type.lower() or "rightsize" in action_type.lower():
-                    rightsizing_savings += savings
-                elif "consolidat" in action_type.lower() or "pack" in action_type.lower():
-                    consolidation_savings += savings
-                elif "hibernat" in action_type.lower():
-                    hibernation_savings += savings
-
-                opportunities_found += 1
-
-                # Check if action was executed
-                if action.get("status") == "executed":
-                    opportunities_executed += 1
-
-            # Per-cluster breakdown
-            cluster_name = next((c.name for c in clusters if str(c.id) == str(job.cluster_id)), "Unknown")
-            if cluster_name not in cluster_breakdown:
-                cluster_breakdown[cluster_name] = {
-                    "savings": 0.0,
-                    "opportunities": 0
-                }
+    for row in grouped:
+        savings = row["savings"]
+        total_savings += savings
+        if row["category"] in savings_by_category:
+            savings_by_category[row["category"]] += savings
+        opportunities_found += row["opportunities_found"]
+        opportunities_executed += row["opportunities_executed"]
 
-            cluster_breakdown[cluster_name]["savings"] += total_savings
-            cluster_breakdown[cluster_name]["opportunities"] += len(action_plan.get("actions", []))
+        # Per-cluster breakdown
+        breakdown = cluster_breakdown.setdefault(row["cluster_name"], {"savings": 0.0, "opportunities": 0})
+        breakdown["savings"] += savings
+        breakdown["opportunities"] += row["opportunities_found"]
 
     # Calculate monthly projection (multiply weekly by 4.33)
     monthly_projection = total_savings * 4.33
@@ -230,18 +343,13 @@ def aggregate_savings_data(
         "total_savings": total_savings,
         "monthly_projection": monthly_projection,
         "annual_projection": annual_projection,
-        "savings_by_category": {
-            "spot_optimization": spot_savings,
-            "rightsizing": rightsizing_savings,
-            "consolidation": consolidation_savings,
-            "hibernation": hibernation_savings
-        },
+        "savings_by_category": savings_by_category,
         "opportunities_found": opportunities_found,
         "opportunities_executed": opportunities_executed,
         "execution_rate": (opportunities_executed / opportunities_found * 100) if opportunities_found > 0 else 0,
         "cluster_breakdown": cluster_breakdown,
-        "total_clusters": len(clusters),
-        "total_jobs": len(jobs)
+        "total_clusters": total_clusters,
+        "total_jobs": total_jobs
     }
 
 
@@ -261,195 +369,7 @@ def generate_html_report(
     Returns:
         HTML string
     """
-    # Simple HTML template (in production, use Jinja2 templates)
-    html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 32px;
-        }}
-        .savings-summary {{
-            background: #f8f9fa;
-            padding: 25px;
-            border-radius: 10px;
-            margin: 20px 0;
-        }}
-        .savings-amount {{
-            font-size: 48px;
-            font-weight: bold;
-            color: #28a745;
-            text-align: center;
-            margin: 20px 0;
-        }}
-        .metric-grid {{
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        .metric-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .metric-label {{
-            color: #6c757d;
-            font-size: 14px;
-            margin-bottom: 5px;
-        }}
-        .metric-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #667eea;
-        }}
-        .category-breakdown {{
-            margin: 20px 0;
-        }}
-        .category-item {{
-            display: flex;
-            justify-content: space-between;
-            padding: 10px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .cluster-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 20px 0;
-        }}
-        .cluster-table th {{
-            background: #667eea;
-            color: white;
-            padding: 12px;
-            text-align: left;
-        }}
-        .cluster-table td {{
-            padding: 10px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .footer {{
-            text-align: center;
-            color: #6c757d;
-            margin-top: 40px;
-            padding-top: 20px;
-            border-top: 1px solid #e9ecef;
-        }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>💰 {report_type.capitalize()} Savings Report</h1>
-        <p>{report_data['organization_name']}</p>
-        <p style="font-size: 14px; opacity: 0.9;">
-            {report_data['period_start'][:10]} to {report_data['period_end'][:10]}
-        </p>
-    </div>
-
-    <div class="savings-summary">
-        <h2 style="text-align: center; margin-top: 0;">Total Savings This Week</h2>
-        <div class="savings-amount">${report_data['total_savings']:,.2f}</div>
-
-        <div class="metric-grid">
-            <div class="metric-card">
-                <div class="metric-label">Monthly Projection</div>
-                <div class="metric-value">${report_data['monthly_projection']:,.2f}</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Annual Projection</div>
-                <div class="metric-value">${report_data['annual_projection']:,.2f}</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Opportunities Found</div>
-                <div class="metric-value">{report_data['opportunities_found']}</div>
-            </div>
-            <div class="metric-card">
-                <div class="metric-label">Execution Rate</div>
-                <div class="metric-value">{report_data['execution_rate']:.1f}%</div>
-            </div>
-        </div>
-    </div>
-
-    <div class="category-breakdown">
-        <h2>Savings by Category</h2>
-        <div class="category-item">
-            <span>🎯 Spot Instance Optimization</span>
-            <strong>${report_data['savings_by_category']['spot_optimization']:,.2f}</strong>
-        </div>
-        <div class="category-item">
-            <span>📏 Right-Sizing</span>
-            <strong>${report_data['savings_by_category']['rightsizing']:,.2f}</strong>
-        </div>
-        <div class="category-item">
-            <span>📦 Consolidation</span>
-            <strong>${report_data['savings_by_category']['consolidation']:,.2f}</strong>
-        </div>
-        <div class="category-item">
-            <span>💤 Hibernation</span>
-            <strong>${report_data['savings_by_category']['hibernation']:,.2f}</strong>
-        </div>
-    </div>
-
-    <div>
-        <h2>Cluster Breakdown</h2>
-        <table class="cluster-table">
-            <thead>
-                <tr>
-                    <th>Cluster</th>
-                    <th>Savings</th>
-                    <th>Opportunities</th>
-                </tr>
-            </thead>
-            <tbody>
-"""
-
-    # Add cluster rows
-    for cluster_name, data in report_data['cluster_breakdown'].items():
-        html += f"""
-                <tr>
-                    <td>{cluster_name}</td>
-                    <td>${data['savings']:,.2f}</td>
-                    <td>{data['opportunities']}</td>
-                </tr>
-"""
-
-    html += f"""
-            </tbody>
-        </table>
-    </div>
-
-    <div class="footer">
-        <p>
-            <strong>Spot Optimizer Platform</strong><br>
-            {report_data['total_clusters']} clusters monitored • {report_data['total_jobs']} optimization jobs completed
-        </p>
-        <p style="font-size: 12px; color: #adb5bd;">
-            This is an automated report. For questions, contact your platform administrator.
-        </p>
-    </div>
-</body>
-</html>
-"""
-
-    return html
+    return render_report_html(report_data, report_type)
 
 
 def get_org_admin_emails(org: Organization, db: Session) -> List[str]:
@@ -478,7 +398,7 @@ def send_report_email(
     recipients: List[str],
     subject: str,
     html_content: str,
-    org: Organization
+    org: Optional[Organization] = None
 ) -> Dict[str, Any]:
     """
     Send report email via AWS SES
@@ -563,75 +483,10 @@ def generate_monthly_report(self: Task, organization_id: Optional[str] = None) -
         organization_id: If provided, generate for specific org. Otherwise, all orgs.
 
     Returns:
-        Dict with report generation summary
+        Dict with fan-out summary (see fan_out_reports())
     """
     logger.info(f"[WORK-RPT-01] Starting monthly report generation")
-
-    db = next(get_db())
-
-    try:
-        # Define report period (last 30 days)
-        end_date = datetime.utcnow()
-        start_date = end_date - timedelta(days=30)
-
-        # Query organizations
-        if organization_id:
-            orgs = db.query(Organization).filter(
-                Organization.id == organization_id
-            ).all()
-        else:
-            orgs = db.query(Organization).filter(
-                Organization.status == 'active'
-            ).all()
-
-        results = {
-            "reports_generated": 0,
-            "emails_sent": 0,
-            "errors": 0,
-            "total_savings": 0.0
-        }
-
-        for org in orgs:
-            try:
-                # Generate report for this organization
-                report_data = aggregate_savings_data(org, start_date, end_date, db)
-
-                # Generate HTML email
-                html_content = generate_html_report(org, report_data, "monthly")
-
-                # Send email to organization admins
-                recipients = get_org_admin_emails(org, db)
-                send_result = send_report_email(
-                    recipients=recipients,
-                    subject=f"Monthly Savings Report - {org.name}",
-                    html_content=html_content,
-                    org=org
-                )
-
-                if send_result["success"]:
-                    results["emails_sent"] += len(recipients)
-                    results["reports_generated"] += 1
-                    results["total_savings"] += report_data["total_savings"]
-
-                    logger.info(
-                        f"[WORK-RPT-01] Monthly report sent to {org.name}: "
-                        f"${report_data['total_savings']:.2f} saved"
-                    )
-                else:
-                    results["errors"] += 1
-
-            except Exception as e:
-                logger.error(f"[WORK-RPT-01] Error generating monthly report for {org.name}: {str(e)}")
-                results["errors"] += 1
-
-        logger.info(f"[WORK-RPT-01] Monthly report generation complete: {results}")
-        return results
-
-    except Exception as e:
-        logger.error(f"[WORK-RPT-01] Fatal error in monthly report generation: {str(e)}")
-        raise
-    finally:
-        db.close()
+    return fan_out_reports("monthly", 30, organization_id)
 
 
 @app.task(bind=True, name="workers.reports.export_to_csv")
@@ -639,20 +494,28 @@ def export_savings_to_csv(
     self: Task,
     organization_id: str,
     start_date: str,
-    end_date: str
+    end_date: str,
+    level: str = "cluster",
+    compress: bool = False
 ) -> Dict[str, Any]:
     """
     Export savings data to CSV file
 
+    Rows are streamed from a server-side cursor into the file
+    (modules/savings_export.py), so memory use does not grow with the
+    date range.
+
     Args:
         organization_id: Organization UUID
-        start_date: ISO format date string
-        end_date: ISO format date string
+        start_date: ISO format date string (first day)
+        end_date: ISO format date string (last day, inclusive)
+        level: "cluster", "day" or "action"
+        compress: Gzip the file
 
     Returns:
         Dict with CSV file path
     """
-    logger.info(f"[WORK-RPT-01] Exporting CSV for org {organization_id}")
+    logger.info(f"[WORK-RPT-01] Exporting {level} CSV for org {organization_id}")
 
     db = next(get_db())
 
@@ -661,28 +524,20 @@ def export_savings_to_csv(
         if not org:
             raise ValueError(f"Organization {organization_id} not found")
 
-        start = datetime.fromisoformat(start_date)
-        end = datetime.fromisoformat(end_date)
-
-        # Aggregate data
-        report_data = aggregate_savings_data(org, start, end, db)
-
-        # Generate CSV (simplified - in production use pandas)
-        csv_content = "Cluster,Savings,Opportunities\n"
-        for cluster_name, data in report_data['cluster_breakdown'].items():
-            csv_content += f"{cluster_name},{data['savings']},{data['opportunities']}\n"
+        start = datetime.fromisoformat(start_date).date()
+        end = datetime.fromisoformat(end_date).date()
 
         # Save to file (in production, upload to S3)
-        file_path = f"/tmp/savings_report_{organization_id}_{start_date}_{end_date}.csv"
-        with open(file_path, 'w') as f:
-            f.write(csv_content)
+        file_path = f"/tmp/{export_filename(organization_id, start, end, level, compress)}"
+        written = write_savings_csv(db, organization_id, start, end, file_path, level=level, compress=compress)
 
         logger.info(f"[WORK-RPT-01] CSV exported to {file_path}")
 
         return {
             "success": True,
             "file_path": file_path,
-            "total_savings": report_data["total_savings"]
+            "rows": written["rows"],
+            "bytes": written["bytes"]
         }
 
     except Exception as e:
@@ -693,3 +548,40 @@ def export_savings_to_csv(
         }
     finally:
         db.close()
+
+
+@app.task(bind=True, name="workers.reports.rebuild_savings_rollups")
+def rebuild_savings_rollup_task(
+    self: Task,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    organization_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Rebuild the daily savings rollup (backfill)
+
+    Args:
+        start_date: ISO date of the first day (default: oldest job)
+        end_date: ISO date of the last day, inclusive (default today)
+        organization_id: If provided, rebuild only this organization
+
+    Returns:
+        Dict with rebuild summary
+    """
+    logger.info(f"[WORK-RPT-01] Rebuilding savings rollup")
+
+    db = next(get_db())
+
+    try:
+        return rebuild_savings_rollups(
+            db,
+            start_day=datetime.fromisoformat(start_date).date() if start_date else None,
+            end_day=datetime.fromisoformat(end_date).date() if end_date else None,
+            organization_id=organization_id
+        )
+    except Exception as e:
+        logger.error(f"[WORK-RPT-01] Savings rollup rebuild failed: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
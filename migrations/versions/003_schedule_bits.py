@@ -0,0 +1,50 @@
+"""
+Packed hibernation schedules
+
+Adds the 21-byte schedule_bits column (168-bit weekly mask) to
+hibernation_schedules and fills it from schedule_matrix
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18 10:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'hibernation_schedules',
+        sa.Column('schedule_bits', sa.LargeBinary(21), nullable=True)
+    )
+
+    # Backfill: bit i set when hour i of the week is awake, 21 bytes big-endian
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, schedule_matrix FROM hibernation_schedules")
+    ).fetchall()
+
+    updates = []
+    for schedule_id, matrix in rows:
+        mask = 0
+        for hour, value in enumerate(matrix or []):
+            if value == 1 or value == "1":
+                mask |= 1 << hour
+        updates.append({"id": schedule_id, "bits": mask.to_bytes(21, "big")})
+
+    if updates:
+        connection.execute(
+            sa.text("UPDATE hibernation_schedules SET schedule_bits = :bits WHERE id = :id"),
+            updates
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('hibernation_schedules', 'schedule_bits')
@@ -0,0 +1,39 @@
+"""
+Daily savings rollup
+
+Creates savings_daily_rollups: savings, opportunities found and executed per
+(cluster, category, day), filled by the rollup backfill
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18 11:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'savings_daily_rollups',
+        sa.Column('cluster_id', sa.String(36), sa.ForeignKey('clusters.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('category', sa.String(32), primary_key=True),
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('organization_id', sa.String(36), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('savings', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('opportunities_found', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('opportunities_executed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('idx_savings_rollup_org_day', 'savings_daily_rollups', ['organization_id', 'day'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_savings_rollup_org_day', table_name='savings_daily_rollups')
+    op.drop_table('savings_daily_rollups')
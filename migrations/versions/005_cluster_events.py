@@ -0,0 +1,45 @@
+"""
+Cluster events
+
+Creates cluster_events, the audit trail of processed AWS events written by
+the event processor
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18 14:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cluster_events',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('event_id', sa.String(64), nullable=True),
+        sa.Column('event_type', sa.String(255), nullable=False),
+        sa.Column('event_source', sa.String(255), nullable=False),
+        sa.Column('event_data', postgresql.JSONB(), nullable=False),
+        sa.Column('processing_result', postgresql.JSONB(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+    )
+    op.create_index('ix_cluster_events_id', 'cluster_events', ['id'])
+    op.create_index('ix_cluster_events_event_id', 'cluster_events', ['event_id'])
+    op.create_index('ix_cluster_events_processed_at', 'cluster_events', ['processed_at'])
+    op.create_index('idx_cluster_events_type_processed', 'cluster_events', ['event_type', 'processed_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_cluster_events_type_processed', table_name='cluster_events')
+    op.drop_index('ix_cluster_events_processed_at', table_name='cluster_events')
+    op.drop_index('ix_cluster_events_event_id', table_name='cluster_events')
+    op.drop_index('ix_cluster_events_id', table_name='cluster_events')
+    op.drop_table('cluster_events')
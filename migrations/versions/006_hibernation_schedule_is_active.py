@@ -0,0 +1,30 @@
+"""
+Hibernation schedule activation flag
+
+Adds is_active (Y/N) to hibernation_schedules; existing schedules stay
+active
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18 18:00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'hibernation_schedules',
+        sa.Column('is_active', sa.String(1), nullable=False, server_default='Y')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('hibernation_schedules', 'is_active')
@@ -25,6 +25,14 @@ from typing import Dict, Any, Optional
 import boto3
 from botocore.exceptions import ClientError
 
+try:
+    # Shared credential cache and client pool when run from the backend
+    from backend.core.aws_session import get_aws_client_pool
+except (ImportError, ValueError):
+    # No backend on the path, or backend settings not configured (importing
+    # backend.core validates them; pydantic's ValidationError is a ValueError)
+    get_aws_client_pool = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -44,7 +52,14 @@ def detach_volume(
 
     try:
         # Get EC2 client
-        if role_arn:
+        if get_aws_client_pool is not None:
+            ec2_client = get_aws_client_pool().get_client(
+                'ec2', region,
+                role_arn=role_arn,
+                external_id=external_id,
+                session_name=f'SpotOptimizer-DetachVolume-{volume_id}'
+            )
+        elif role_arn:
             sts_client = boto3.client('sts')
             assumed_role = sts_client.assume_role(
                 RoleArn=role_arn,
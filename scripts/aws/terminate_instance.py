@@ -28,6 +28,14 @@ import time
 import boto3
 from botocore.exceptions import ClientError
 
+try:
+    # Shared credential cache and client pool when run from the backend
+    from backend.core.aws_session import get_aws_client_pool
+except (ImportError, ValueError):
+    # No backend on the path, or backend settings not configured (importing
+    # backend.core validates them; pydantic's ValidationError is a ValueError)
+    get_aws_client_pool = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -66,7 +74,14 @@ def terminate_instance(
 
     try:
         # Assume role if provided
-        if role_arn:
+        if get_aws_client_pool is not None:
+            ec2_client = get_aws_client_pool().get_client(
+                'ec2', region,
+                role_arn=role_arn,
+                external_id=external_id,
+                session_name=f'SpotOptimizer-Terminate-{instance_id}'
+            )
+        elif role_arn:
             logger.info(f"[SCRIPT-TERM-01] Assuming role {role_arn}")
             sts_client = boto3.client('sts')
 
@@ -0,0 +1,80 @@
+"""
+Benchmark Script: Report HTML rendering
+
+Usage:
+    python scripts/benchmark_report_render.py [--clusters 500] [--reports 1000]
+
+Description:
+    Renders synthetic savings reports with the cached report templates
+    (backend/modules/report_renderer.py) and prints the one-off compile
+    time and the per-report render time. No database connection is made.
+"""
+import sys
+import os
+import argparse
+import random
+import time
+
+# Add parent dir to path to import backend modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.modules.report_renderer import (
+    CATEGORIES,
+    get_report_environment,
+    render_report_html,
+    warm_report_templates,
+)
+
+
+def synthetic_report(clusters: int) -> dict:
+    """Report data shaped like aggregate_savings_data() output"""
+    breakdown = {
+        f"cluster-{i:04d}": {
+            "savings": round(random.uniform(0, 5000), 2),
+            "opportunities": random.randint(0, 40)
+        }
+        for i in range(clusters)
+    }
+    total = sum(row["savings"] for row in breakdown.values())
+    return {
+        "organization_name": "Benchmark Org <&>",
+        "period_start": "2026-01-05T00:00:00",
+        "period_end": "2026-01-11T00:00:00",
+        "total_savings": total,
+        "monthly_projection": total * 4.33,
+        "annual_projection": total * 52,
+        "savings_by_category": {key: total / len(CATEGORIES) for key, _ in CATEGORIES},
+        "opportunities_found": sum(row["opportunities"] for row in breakdown.values()),
+        "opportunities_executed": 0,
+        "execution_rate": 42.0,
+        "cluster_breakdown": breakdown,
+        "total_clusters": clusters,
+        "total_jobs": clusters * 7
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark report HTML rendering")
+    parser.add_argument("--clusters", type=int, default=500, help="Clusters per report")
+    parser.add_argument("--reports", type=int, default=1000, help="Reports to render")
+    args = parser.parse_args()
+
+    report = synthetic_report(args.clusters)
+
+    start = time.perf_counter()
+    warm_report_templates()
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(args.reports):
+        html = render_report_html(report, "weekly")
+    render_ms = (time.perf_counter() - start) * 1000 / args.reports
+
+    print(f"📄 Templates: {', '.join(get_report_environment().list_templates())}")
+    print(f"⚙️  Compile (bytecode cache used when present): {compile_ms:.2f} ms")
+    print(f"🚀 Render: {render_ms:.3f} ms/report ({args.clusters} clusters, {len(html) / 1024:.0f} KiB)")
+    print(f"   {args.reports} reports in {render_ms * args.reports / 1000:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Maintenance Script: Rebuild the daily savings rollup
+
+Usage:
+    python scripts/rebuild_savings_rollups.py [--start YYYY-MM-DD] [--end YYYY-MM-DD] [--org ORG_ID]
+
+Description:
+    Recomputes savings_daily_rollups from completed optimization jobs.
+    Run once after migration 004 to backfill history, or over a date range
+    to repair rows. Without --start, the rebuild starts at the oldest job.
+"""
+import sys
+import os
+import argparse
+from datetime import date
+
+# Add parent dir to path to import backend modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.models.base import SessionLocal
+import backend.models  # noqa: F401 - register all mappers
+from backend.modules.savings_rollup import rebuild_savings_rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the daily savings rollup")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day (default: oldest job)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day, inclusive (default: today)")
+    parser.add_argument("--org", help="Only rebuild this organization")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("🚀 Rebuilding savings rollup...")
+        summary = rebuild_savings_rollups(db, args.start, args.end, args.org)
+        print(
+            f"✅ {summary['rows']} rows for {summary['clusters']} clusters "
+            f"({summary['start_day']} .. {summary['end_day']})"
+        )
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Rebuild failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()